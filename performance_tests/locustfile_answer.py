@@ -0,0 +1,89 @@
+"""
+답변 API 동기/비동기 구현 비교 시나리오 (ANSWER_API_MODE)
+- 같은 경로(/api/answer/*)를 서버 설정만 바꿔 동기(스레드풀 + 동기 세션) / 비동기(비동기 세션)로 실행
+- 답변 작성/투표(쓰기) + 답변 목록/상세(읽기) + 질문 목록/상세(다른 비동기 핫패스)를 섞은 부하
+- 동기 모드에서는 답변 요청이 anyio 스레드풀(기본 40)과 동기 풀 커넥션을 점유하므로,
+  같은 부하에서 답변 API 와 함께 질문 API 지연 시간이 어떻게 달라지는지 비교한다.
+
+실행 방법:
+    # 1. 동기 모드 서버
+    ANSWER_API_MODE=sync uvicorn src.main:app --port 7777
+    locust -f locustfile_answer.py --host=http://localhost:7777 \
+        --users=200 --spawn-rate=20 --run-time=5m --headless \
+        --csv=results/answer_sync_200
+
+    # 2. 비동기 모드 서버 (같은 옵션으로 재실행)
+    ANSWER_API_MODE=async uvicorn src.main:app --port 7777
+    locust -f locustfile_answer.py --host=http://localhost:7777 \
+        --users=200 --spawn-rate=20 --run-time=5m --headless \
+        --csv=results/answer_async_200
+
+    두 CSV 의 [ANSWER] / [QUESTION] 요청별 평균·p95·RPS·실패율을 비교한다.
+"""
+
+import random
+import uuid
+
+from locust import HttpUser, task, between
+
+PASSWORD = "locust-password"
+
+
+class AnswerWorkloadUser(HttpUser):
+    """질문 하나에 답변을 달고 읽는 사용자 (로그인 후 토큰 사용)"""
+    wait_time = between(0.2, 1.0)
+
+    def on_start(self):
+        username = f"locust_{uuid.uuid4().hex[:12]}"
+        self.client.post("/api/user/create", json={
+            "username": username, "password1": PASSWORD, "password2": PASSWORD,
+            "email": f"{username}@locust.local",
+        }, name="[SETUP] User Create")
+        response = self.client.post("/api/user/login", data={"username": username, "password": PASSWORD},
+                                    name="[SETUP] Login")
+        self.headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+        self.client.post("/api/question/create", json={"subject": f"locust {username}", "content": "answer load"},
+                         headers=self.headers, name="[SETUP] Question Create")
+        questions = self.client.get("/api/question/list?size=20", name="[SETUP] Question List").json()
+        self.question_ids = [question["id"] for question in questions["question_list"]]
+        self.answer_ids = []
+
+    def _question_id(self):
+        return random.choice(self.question_ids)
+
+    @task(3)
+    def create_answer(self):
+        question_id = self._question_id()
+        self.client.post(f"/api/answer/create/{question_id}", json={"content": "locust answer"},
+                         headers=self.headers, name="[ANSWER] Create")
+        answers = self.client.get(f"/api/answer/list/{question_id}?sort=create_date&size=5",
+                                  name="[ANSWER] List").json()
+        self.answer_ids = [answer["id"] for answer in answers.get("answer_list", [])] or self.answer_ids
+
+    @task(2)
+    def vote_answer(self):
+        if not self.answer_ids:
+            return
+        self.client.post("/api/answer/vote", json={"answer_id": random.choice(self.answer_ids)},
+                         headers=self.headers, name="[ANSWER] Vote")
+
+    @task(4)
+    def list_answers(self):
+        sort = random.choice(["create_date", "vote"])
+        self.client.get(f"/api/answer/list/{self._question_id()}?sort={sort}&size=20",
+                        name=f"[ANSWER] List ({sort})")
+
+    @task(2)
+    def answer_detail(self):
+        if not self.answer_ids:
+            return
+        self.client.get(f"/api/answer/detail/{random.choice(self.answer_ids)}", name="[ANSWER] Detail")
+
+    @task(4)
+    def question_list(self):
+        self.client.get("/api/question/list?size=10", name="[QUESTION] List")
+
+    @task(3)
+    def question_detail(self):
+        self.client.get(f"/api/question/detail/{self._question_id()}", name="[QUESTION] Detail")
@@ -3,6 +3,7 @@ DB 세션 테스트 시나리오
 - 동기/비동기 DB 세션의 성능 차이 측정
 - DB 연결 풀 사용 패턴 분석
 - 대용량 데이터 조회 성능 비교
+- 깊은 페이지 조회: OFFSET vs 커서(keyset) 페이지네이션
 
 실행 방법:
     locust -f locustfile_db.py --host=http://localhost:7777
@@ -12,6 +13,7 @@ DB 세션 테스트 시나리오
 """
 
 from locust import HttpUser, task, between, events
+import base64
 import random
 
 
@@ -188,6 +190,91 @@ class BulkReadComparisonUser(HttpUser):
         )
 
 
+def deep_id_cursor(after_id: int) -> str:
+    """대용량 조회 커서 생성 (서버 형식: [id] JSON 의 URL-safe base64) - 깊은 위치에서 시작하기 위함"""
+    return base64.urlsafe_b64encode(f"[{after_id}]".encode()).decode().rstrip("=")
+
+
+class DeepPageUser(HttpUser):
+    """깊은 페이지 조회 테스트 사용자 (OFFSET vs 커서)
+
+    OFFSET 은 앞쪽 행을 모두 읽고 버리므로 깊은 페이지일수록 느려지고,
+    커서는 이전 응답의 next_cursor(마지막 id) 다음부터 PK 인덱스로 조회하므로 깊이와 무관하다.
+    """
+    wait_time = between(0.1, 0.5)
+    weight = 1
+    limit = 100
+
+    def on_start(self):
+        self.bulk_cursor = deep_id_cursor(random.randint(80000, 90000))
+        self.question_cursor = None
+
+    @task(1)
+    def async_bulk_deep_offset(self):
+        """비동기 대용량 조회 - 깊은 OFFSET (80k~90k)"""
+        offset = random.randint(80000, 90000)
+        with self.client.get(
+            f"/api/v1/standard/async-bulk-read?limit={self.limit}&offset={offset}",
+            name="[DEEP PAGE] Async Offset (80k+)",
+            catch_response=True,
+            timeout=30
+        ) as response:
+            if response.status_code == 200:
+                response.success()
+            else:
+                response.failure(f"Status code: {response.status_code}")
+
+    @task(1)
+    def async_bulk_cursor(self):
+        """비동기 대용량 조회 - 80k~90k 위치의 커서에서 시작하여 다음 페이지 계속 조회"""
+        with self.client.get(
+            f"/api/v1/standard/async-bulk-read?limit={self.limit}&cursor={self.bulk_cursor}",
+            name="[DEEP PAGE] Async Cursor (80k+)",
+            catch_response=True,
+            timeout=30
+        ) as response:
+            if response.status_code == 200:
+                self.bulk_cursor = response.json()["data"]["next_cursor"] or deep_id_cursor(random.randint(80000, 90000))
+                response.success()
+            else:
+                self.bulk_cursor = deep_id_cursor(random.randint(80000, 90000))
+                response.failure(f"Status code: {response.status_code}")
+
+    @task(1)
+    def question_list_deep_offset(self):
+        """질문 목록 - 깊은 page"""
+        page = random.randint(500, 1000)
+        with self.client.get(
+            f"/api/question/list?page={page}&size=10",
+            name="[DEEP PAGE] Question List Offset (page 500+)",
+            catch_response=True,
+            timeout=30
+        ) as response:
+            if response.status_code == 200:
+                response.success()
+            else:
+                response.failure(f"Status code: {response.status_code}")
+
+    @task(1)
+    def question_list_cursor(self):
+        """질문 목록 - 커서로 다음 페이지 계속 조회"""
+        url = "/api/question/list?size=10"
+        if self.question_cursor:
+            url += f"&cursor={self.question_cursor}"
+        with self.client.get(
+            url,
+            name="[DEEP PAGE] Question List Cursor",
+            catch_response=True,
+            timeout=30
+        ) as response:
+            if response.status_code == 200:
+                self.question_cursor = response.json()["next_cursor"]
+                response.success()
+            else:
+                self.question_cursor = None
+                response.failure(f"Status code: {response.status_code}")
+
+
 @events.test_start.add_listener
 def on_test_start(environment, **kwargs):
     """테스트 시작 시 실행"""
@@ -199,6 +286,7 @@ def on_test_start(environment, **kwargs):
     print("   - DB 세션 pg_sleep 실행")
     print("   - 대용량 데이터 조회 (100~1000건)")
     print("   - 다중 쿼리 실행")
+    print("   - 깊은 페이지 조회 (OFFSET vs 커서)")
     print(" ")
     print(" 사전 준비:")
     print("   python scripts/generate_test_data.py --records=100000")
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+사용자 일괄 등록 스크립트 (테스트 테넌트 시드용)
+
+JSON 파일의 사용자 목록을 --batch 개씩 INSERT ... ON CONFLICT DO NOTHING 한 문장으로 저장합니다.
+username/email 이 이미 있는 사용자는 건너뜁니다. 비밀번호는 사용자마다 각자의 솔트로 해시합니다
+(src/domains/user/password.py 의 executor - 워커 수만큼 병렬).
+
+입력 파일 형식:
+    [{"username": "user1", "password": "...", "email": "user1@example.com"}, ...]
+
+Usage:
+    python scripts/import_users.py users.json
+
+    # 배치 크기 지정 (배치마다 커밋)
+    python scripts/import_users.py users.json --batch=500
+
+    # Docker 환경에서 실행
+    docker exec -it playground python scripts/import_users.py /data/users.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from src.domains.user import service as user_service
+from src.domains.user.password import password_hasher
+from src.domains.user.schemas import UserImportItem
+
+
+async def import_file(db_url: str, path: str, batch_size: int):
+    with open(path, encoding="utf-8") as f:
+        users = [UserImportItem.model_validate(item) for item in json.load(f)]
+    print(f"사용자 {len(users):,}명 등록: 배치 {batch_size:,}")
+
+    engine = create_async_engine(db_url)
+    start = time.perf_counter()
+    created = skipped = 0
+    try:
+        async with AsyncSession(bind=engine) as db:
+            for offset in range(0, len(users), batch_size):
+                batch_created, batch_skipped = await user_service.import_users(db, users[offset:offset + batch_size])
+                created += len(batch_created)
+                skipped += len(batch_skipped)
+                if batch_skipped:
+                    print(f"  건너뜀 (username/email 충돌): {', '.join(batch_skipped)}")
+                print(f"  ~{min(offset + batch_size, len(users)):,} 까지 완료")
+    finally:
+        await engine.dispose()
+        password_hasher.shutdown()
+    print(f"완료: 생성 {created:,}명, 건너뜀 {skipped:,}명, {time.perf_counter() - start:.1f}초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="사용자 일괄 등록 스크립트 (테스트 테넌트 시드용)")
+    parser.add_argument("path", help="사용자 목록 JSON 파일")
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=user_service.USER_IMPORT_MAX_BATCH,
+        help=f"배치 크기 (기본값: {user_service.USER_IMPORT_MAX_BATCH})"
+    )
+    parser.add_argument(
+        "--db-host",
+        type=str,
+        default=None,
+        help="데이터베이스 호스트 (기본값: 환경변수 또는 localhost)"
+    )
+    parser.add_argument(
+        "--db-port",
+        type=int,
+        default=None,
+        help="데이터베이스 포트 (기본값: 환경변수 또는 15432)"
+    )
+
+    args = parser.parse_args()
+
+    db_host = args.db_host or os.getenv("POSTGRES_HOST", "localhost")
+    db_port = args.db_port or int(os.getenv("POSTGRES_PORT", "15432"))
+    db_user = os.getenv("POSTGRES_USER", "postgres")
+    db_password = os.getenv("POSTGRES_PASSWORD", "test")
+    db_name = os.getenv("POSTGRES_DB", "fastapi_playground")
+
+    print(f"\n데이터베이스 연결: {db_host}:{db_port}/{db_name}")
+    asyncio.run(import_file(
+        f"postgresql+asyncpg://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}", args.path, args.batch
+    ))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+질문/답변 카운터(vote_count, answer_count) 일괄 재계산 스크립트
+
+카운터 컬럼 추가 후 기존 데이터에 대해 1회 실행합니다.
+이후에는 투표/답변 추가·삭제 시 애플리케이션이 같은 트랜잭션에서 갱신합니다.
+
+Usage:
+    python scripts/rebuild_question_counters.py
+
+    # 배치 크기 지정 (id 구간 단위로 커밋)
+    python scripts/rebuild_question_counters.py --batch=5000
+
+    # Docker 환경에서 실행
+    docker exec -it playground python scripts/rebuild_question_counters.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+
+from src.domains.question.counters import REBUILD_ANSWER_COUNTERS, REBUILD_QUESTION_COUNTERS
+
+
+def rebuild_table(conn, table: str, statement, batch_size: int) -> int:
+    max_id = conn.execute(text(f"SELECT coalesce(max(id), 0) FROM {table}")).scalar_one()
+    print(f"{table} 카운터 재계산: 최대 id {max_id:,}, 배치 {batch_size:,}")
+
+    updated = 0
+    for after_id in range(0, max_id, batch_size):
+        result = conn.execute(statement, {"after_id": after_id, "until_id": after_id + batch_size})
+        conn.commit()
+        updated += result.rowcount
+        print(f"  ~{min(after_id + batch_size, max_id):,} 까지 {updated:,}건 완료")
+    return updated
+
+
+def rebuild(db_url: str, batch_size: int = 5000):
+    engine = create_engine(db_url)
+    with engine.connect() as conn:
+        start = time.perf_counter()
+        questions = rebuild_table(conn, "question", REBUILD_QUESTION_COUNTERS, batch_size)
+        answers = rebuild_table(conn, "answer", REBUILD_ANSWER_COUNTERS, batch_size)
+        print(f"완료: 질문 {questions:,}건, 답변 {answers:,}건, {time.perf_counter() - start:.1f}초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="질문/답변 카운터 일괄 재계산 스크립트")
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=5000,
+        help="배치 크기 (기본값: 5000)"
+    )
+    parser.add_argument(
+        "--db-host",
+        type=str,
+        default=None,
+        help="데이터베이스 호스트 (기본값: 환경변수 또는 localhost)"
+    )
+    parser.add_argument(
+        "--db-port",
+        type=int,
+        default=None,
+        help="데이터베이스 포트 (기본값: 환경변수 또는 15432)"
+    )
+
+    args = parser.parse_args()
+
+    db_host = args.db_host or os.getenv("POSTGRES_HOST", "localhost")
+    db_port = args.db_port or int(os.getenv("POSTGRES_PORT", "15432"))
+    db_user = os.getenv("POSTGRES_USER", "postgres")
+    db_password = os.getenv("POSTGRES_PASSWORD", "test")
+    db_name = os.getenv("POSTGRES_DB", "fastapi_playground")
+
+    print(f"\n데이터베이스 연결: {db_host}:{db_port}/{db_name}")
+    rebuild(f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}", args.batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+질문 전문 검색 문서(question.search_vector) 일괄 생성 스크립트
+
+search_vector 컬럼/GIN 인덱스 추가 후 기존 질문에 대해 1회 실행합니다.
+이후에는 질문/답변 저장 시 애플리케이션이 자동으로 갱신합니다.
+
+Usage:
+    python scripts/rebuild_question_search.py
+
+    # 배치 크기 지정 (id 구간 단위로 커밋)
+    python scripts/rebuild_question_search.py --batch=5000
+
+    # Docker 환경에서 실행
+    docker exec -it playground python scripts/rebuild_question_search.py
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 프로젝트 루트를 path에 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine, text
+
+from src.domains.question.search import REBUILD_SEARCH_DOCUMENTS
+
+
+def rebuild(db_url: str, batch_size: int = 5000):
+    engine = create_engine(db_url)
+    with engine.connect() as conn:
+        max_id = conn.execute(text("SELECT coalesce(max(id), 0) FROM question")).scalar_one()
+        print(f"질문 검색 문서 생성: 최대 id {max_id:,}, 배치 {batch_size:,}")
+
+        start = time.perf_counter()
+        updated = 0
+        for after_id in range(0, max_id, batch_size):
+            result = conn.execute(REBUILD_SEARCH_DOCUMENTS, {"after_id": after_id, "until_id": after_id + batch_size})
+            conn.commit()
+            updated += result.rowcount
+            print(f"  ~{min(after_id + batch_size, max_id):,} 까지 {updated:,}건 완료")
+
+        conn.execute(text("ANALYZE question"))
+        conn.commit()
+        print(f"완료: {updated:,}건, {time.perf_counter() - start:.1f}초")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="질문 전문 검색 문서 일괄 생성 스크립트")
+    parser.add_argument(
+        "--batch",
+        type=int,
+        default=5000,
+        help="배치 크기 (기본값: 5000)"
+    )
+    parser.add_argument(
+        "--db-host",
+        type=str,
+        default=None,
+        help="데이터베이스 호스트 (기본값: 환경변수 또는 localhost)"
+    )
+    parser.add_argument(
+        "--db-port",
+        type=int,
+        default=None,
+        help="데이터베이스 포트 (기본값: 환경변수 또는 15432)"
+    )
+
+    args = parser.parse_args()
+
+    db_host = args.db_host or os.getenv("POSTGRES_HOST", "localhost")
+    db_port = args.db_port or int(os.getenv("POSTGRES_PORT", "15432"))
+    db_user = os.getenv("POSTGRES_USER", "postgres")
+    db_password = os.getenv("POSTGRES_PASSWORD", "test")
+    db_name = os.getenv("POSTGRES_DB", "fastapi_playground")
+
+    print(f"\n데이터베이스 연결: {db_host}:{db_port}/{db_name}")
+    rebuild(f"postgresql://{db_user}:{db_password}@{db_host}:{db_port}/{db_name}", args.batch)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""HTTP 조건부 요청 (ETag / If-None-Match) 유틸
+
+- ETag 는 응답 상태를 대표하는 값(버전 스탬프 또는 본문)의 해시로 만든 strong ETag 이다.
+- If-None-Match 는 약한 비교(W/ 접두어 무시)로 비교하며 여러 값과 "*" 를 지원한다 (RFC 9110 13.1.2).
+- 일치하면 본문 없이 304 를 반환하여 직렬화/전송 비용을 줄인다.
+"""
+
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Response
+from starlette import status
+
+
+def make_etag(*parts: Any) -> str:
+    digest = hashlib.sha1(":".join(str(part) for part in parts).encode()).hexdigest()[:20]
+    return f'"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (value.strip() for value in if_none_match.split(","))
+    return any(candidate.removeprefix("W/") == etag for candidate in candidates)
+
+
+def cache_headers(etag: str, cache_control: str) -> dict:
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, cache_control))
@@ -0,0 +1,47 @@
+"""커서(keyset) 페이지네이션 공통 유틸
+
+OFFSET 페이지네이션은 앞쪽 행을 모두 읽고 버리므로 페이지가 깊어질수록 느려진다.
+커서 모드는 마지막으로 본 행의 정렬 키 (예: (create_date, id) 또는 id) 다음부터 인덱스로 바로 찾아가므로
+깊은 페이지도 첫 페이지와 같은 비용으로 조회된다.
+
+커서는 정렬 키 값을 JSON 배열로 직렬화한 뒤 URL-safe base64 로 인코딩한 불투명 문자열이다.
+클라이언트는 응답의 next_cursor 를 다음 요청의 cursor 로 그대로 전달한다 (마지막 페이지면 null).
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple, Type
+
+
+class InvalidCursorError(ValueError):
+    """디코딩할 수 없거나 형식이 맞지 않는 커서"""
+
+
+def encode_cursor(*values: Any) -> str:
+    payload = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, types: Sequence[Type]) -> Tuple[Any, ...]:
+    """커서를 정렬 키 튜플로 복원 (types: 각 값의 타입 - datetime / int / str)"""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("cursor length mismatch")
+        return tuple(
+            datetime.fromisoformat(value) if value_type is datetime else value_type(value)
+            for value_type, value in zip(types, payload)
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise InvalidCursorError(f"Invalid cursor: {cursor}") from e
+
+
+def next_cursor(rows: Sequence[Any], limit: int, *attributes: str) -> Optional[str]:
+    """조회 결과가 limit 만큼 찼으면 마지막 행의 정렬 키로 다음 커서 생성"""
+    if not rows or len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(*(getattr(last, name) for name in attributes))
@@ -0,0 +1,132 @@
+"""Redis 기반 응답 캐시 (read-through, 버전 네임스페이스 무효화)
+
+직렬화된 응답(JSON 문자열)을 Redis 에 저장하고, 같은 요청이면 DB 조회 없이 그대로 반환한다.
+
+키 구조:
+    {prefix}:{cache}:{namespace}:ver                      네임스페이스 버전 (INCR 로 증가)
+    {prefix}:{cache}:{namespace}:{version}:{parts hash}   응답 본문 (TTL)
+
+- 무효화는 네임스페이스 버전을 올리는 것(INCR 1회)으로 끝난다. 이전 버전의 키는 더 이상 조회되지 않고
+  TTL 로 사라지므로 SCAN/KEYS 로 키를 찾아 지울 필요가 없다. (예: 질문 목록의 모든 페이지를 한 번에 무효화)
+- 조회 시 버전을 먼저 읽고 그 버전의 키에 저장하므로, DB 조회 도중 무효화가 일어나면
+  새로 만든 응답은 이전 버전 키에 저장되어 다시 읽히지 않는다.
+- 일관성 토큰(src/database/consistency.py)을 가진 요청은 자신의 쓰기를 봐야 하므로 캐시를 거치지 않는다.
+- 무효화 직후의 미스는 새 버전 키에 저장되므로, render 는 무효화를 일으킨 쓰기를 볼 수 있는 DB(Primary)
+  에서 조회해야 한다. 지연된 Replica 에서 조회하면 이전 응답이 TTL 동안 새 버전으로 제공된다.
+- Redis 오류는 요청을 실패시키지 않고 DB 조회로 대체한다 (무효화 실패 시 TTL 동안 이전 응답이 보일 수 있음).
+
+설정 (환경 변수):
+    RESPONSE_CACHE_ENABLED   캐시 사용 여부 (기본 true)
+    RESPONSE_CACHE_PREFIX    키 접두어
+    RESPONSE_CACHE_TTL       응답 유지 시간 (초)
+
+메트릭 (/metrics):
+    response_cache_requests_total{cache, result}    result: hit / miss / bypass / error
+    response_cache_invalidations_total{cache}
+"""
+
+import hashlib
+import json
+import logging
+import os
+from typing import Any, Awaitable, Callable, Tuple
+
+from prometheus_client import Counter
+
+from src.database.consistency import get_required_lsn
+from src.database.redis_pool import redis_pool
+
+logger = logging.getLogger(__name__)
+
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+RESPONSE_CACHE_PREFIX = os.getenv("RESPONSE_CACHE_PREFIX", "respcache")
+RESPONSE_CACHE_TTL = int(os.getenv("RESPONSE_CACHE_TTL", 30))
+
+RESPONSE_CACHE_REQUESTS = Counter(
+    "response_cache_requests_total",
+    "Response cache lookups by cache and result (hit/miss/bypass/error)",
+    ["cache", "result"],
+)
+RESPONSE_CACHE_INVALIDATIONS = Counter(
+    "response_cache_invalidations_total",
+    "Response cache namespace version bumps",
+    ["cache"],
+)
+
+
+class ResponseCache:
+    """이름(cache)별 응답 캐시 - 네임스페이스 단위로 무효화"""
+
+    def __init__(self, name: str, ttl: int = RESPONSE_CACHE_TTL, enabled: bool = RESPONSE_CACHE_ENABLED):
+        self.name = name
+        self.ttl = ttl
+        self.enabled = enabled
+        # 버전 키는 응답보다 오래 유지 (만료되어 0 으로 돌아가도 그 전 응답은 이미 만료된 뒤)
+        self.version_ttl = max(ttl * 10, 3600)
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{RESPONSE_CACHE_PREFIX}:{self.name}:{namespace}:ver"
+
+    def _entry_key(self, namespace: str, version: str, parts: Tuple[Any, ...]) -> str:
+        digest = hashlib.sha1(json.dumps(parts, default=str).encode()).hexdigest()
+        return f"{RESPONSE_CACHE_PREFIX}:{self.name}:{namespace}:{version}:{digest}"
+
+    async def get_or_render(
+        self, namespace: str, parts: Tuple[Any, ...], render: Callable[[], Awaitable[str]]
+    ) -> str:
+        """캐시된 응답 본문을 반환하고, 없으면 render() 결과를 저장 후 반환
+
+        render 에서 발생한 예외(404 등)는 그대로 전파되며 캐시되지 않는다.
+        """
+        if not self.enabled or get_required_lsn() is not None:
+            RESPONSE_CACHE_REQUESTS.labels(cache=self.name, result="bypass").inc()
+            return await render()
+
+        redis = redis_pool.async_client()
+        try:
+            version = await redis.get(self._version_key(namespace)) or "0"
+            key = self._entry_key(namespace, version, parts)
+            cached = await redis.get(key)
+        except Exception as e:
+            logger.warning(f"Response cache lookup failed ({self.name}): {e}")
+            RESPONSE_CACHE_REQUESTS.labels(cache=self.name, result="error").inc()
+            return await render()
+
+        if cached is not None:
+            RESPONSE_CACHE_REQUESTS.labels(cache=self.name, result="hit").inc()
+            return cached
+
+        RESPONSE_CACHE_REQUESTS.labels(cache=self.name, result="miss").inc()
+        body = await render()
+        try:
+            await redis.set(key, body, ex=self.ttl)
+        except Exception as e:
+            logger.warning(f"Response cache store failed ({self.name}): {e}")
+        return body
+
+    async def invalidate(self, namespace: str) -> None:
+        if not self.enabled:
+            return
+        redis = redis_pool.async_client()
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.incr(self._version_key(namespace))
+            pipe.expire(self._version_key(namespace), self.version_ttl)
+            await pipe.execute()
+            RESPONSE_CACHE_INVALIDATIONS.labels(cache=self.name).inc()
+        except Exception as e:
+            logger.error(f"Response cache invalidation failed ({self.name}:{namespace}): {e}")
+
+    def invalidate_sync(self, namespace: str) -> None:
+        """동기 라우터(스레드풀)용 무효화"""
+        if not self.enabled:
+            return
+        redis = redis_pool.sync_client()
+        try:
+            pipe = redis.pipeline(transaction=False)
+            pipe.incr(self._version_key(namespace))
+            pipe.expire(self._version_key(namespace), self.version_ttl)
+            pipe.execute()
+            RESPONSE_CACHE_INVALIDATIONS.labels(cache=self.name).inc()
+        except Exception as e:
+            logger.error(f"Response cache invalidation failed ({self.name}:{namespace}): {e}")
@@ -12,7 +12,7 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 
-from src.database.database import SessionLocal
+from src.database.database import SessionBackground
 from src.domains.scheduler.service import (
     create_job_history,
     update_job_history
@@ -85,7 +85,7 @@ def track_execution(job_id: str, job_name: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            db = SessionLocal()
+            db = SessionBackground()
             history = None
 
             try:
@@ -0,0 +1,218 @@
+"""기동 시 커넥션 풀 워밍업 및 readiness 게이트
+
+배포 직후 첫 요청 폭주가 TCP 연결/인증 비용과 SQL 컴파일 비용을 떠안지 않도록,
+lifespan 에서 백그라운드로 다음을 수행한 뒤 ready 상태로 전환합니다.
+
+1. DB 엔진(primary/replica/bulkhead 파티션, sync/async)별로 커넥션 N개를 동시에 열었다가 풀에 반환
+2. Redis 커넥션 풀(async/sync)에서 커넥션 N개를 연결 후 반환
+3. 주요 조회 쿼리를 엔진별로 1회씩 실행하여 SQLAlchemy 컴파일 캐시를 채움
+
+/ready 는 워밍업이 끝날 때까지 503 을 반환하므로, 로드밸런서 헬스체크에 연결하면
+워밍업이 끝난 인스턴스로만 트래픽이 전달됩니다.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from datetime import datetime
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+from sqlalchemy.orm import Session
+
+from src.database.bulkhead import BULKHEAD_PARTITIONS
+from src.database.database import (
+    async_engine_primary,
+    async_engine_replica,
+    engine as sync_engine_primary,
+    engine_replica as sync_engine_replica,
+    partition_async_engines,
+    partition_sync_engines,
+)
+from src.database.redis_pool import redis_pool
+from src.domains.notification import service as notification_service
+from src.domains.question import service as question_service
+from src.domains.user import service as user_service
+
+logger = logging.getLogger(__name__)
+
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+WARMUP_DB_CONNECTIONS = int(os.getenv("WARMUP_DB_CONNECTIONS", 5))
+WARMUP_REDIS_CONNECTIONS = int(os.getenv("WARMUP_REDIS_CONNECTIONS", 5))
+WARMUP_TIMEOUT_SECONDS = float(os.getenv("WARMUP_TIMEOUT_SECONDS", 30.0))
+
+ASYNC_ENGINES: Dict[str, AsyncEngine] = {
+    "async_primary": async_engine_primary,
+    "async_replica": async_engine_replica,
+    **{f"async_{name}": partition_async_engines[name] for name in BULKHEAD_PARTITIONS},
+}
+SYNC_ENGINES: Dict[str, Engine] = {
+    "sync_primary": sync_engine_primary,
+    "sync_replica": sync_engine_replica,
+    **{f"sync_{name}": partition_sync_engines[name] for name in BULKHEAD_PARTITIONS},
+}
+
+
+@dataclass
+class WarmupState:
+    """워밍업 진행 상태 (/ready 응답에 사용)"""
+    ready: bool = False
+    started_at: Optional[float] = None
+    duration_s: Optional[float] = None
+    connections: Dict[str, int] = field(default_factory=dict)
+    errors: List[str] = field(default_factory=list)
+
+
+# ── 커넥션 풀 ───────────────────────────────────────────────────────────────
+
+def _pool_capacity(pool) -> int:
+    """오버플로 커넥션은 반환 시 닫히므로 pool_size 까지만 미리 연다"""
+    size = getattr(pool, "size", None)
+    return size() if callable(size) else 0
+
+
+async def warm_async_engine(engine: AsyncEngine, count: int) -> int:
+    count = min(count, _pool_capacity(engine.sync_engine.pool))
+    results = await asyncio.gather(
+        *[engine.connect().start() for _ in range(count)], return_exceptions=True
+    )
+    connections = [conn for conn in results if not isinstance(conn, BaseException)]
+    await asyncio.gather(*[conn.close() for conn in connections])
+
+    errors = [e for e in results if isinstance(e, BaseException)]
+    if errors:
+        raise errors[0]
+    return len(connections)
+
+
+def warm_sync_engine(engine: Engine, count: int) -> int:
+    count = min(count, _pool_capacity(engine.pool))
+    connections = []
+    try:
+        for _ in range(count):
+            connections.append(engine.connect())
+    finally:
+        for conn in connections:
+            conn.close()
+    return len(connections)
+
+
+async def warm_redis_pools(count: int) -> Dict[str, int]:
+    async_pool = redis_pool.async_pool
+    results = await asyncio.gather(
+        *[async_pool.get_connection("PING") for _ in range(min(count, async_pool.max_connections))],
+        return_exceptions=True,
+    )
+    connections = [conn for conn in results if not isinstance(conn, BaseException)]
+    for connection in connections:
+        await async_pool.release(connection)
+
+    errors = [e for e in results if isinstance(e, BaseException)]
+    if errors:
+        raise errors[0]
+
+    def _warm_sync() -> int:
+        sync_pool = redis_pool.sync_pool
+        sync_connections = []
+        try:
+            for _ in range(min(count, sync_pool.max_connections)):
+                sync_connections.append(sync_pool.get_connection("PING"))
+        finally:
+            for connection in sync_connections:
+                sync_pool.release(connection)
+        return len(sync_connections)
+
+    return {"redis_async": len(connections), "redis_sync": await asyncio.to_thread(_warm_sync)}
+
+
+# ── 컴파일 캐시 ─────────────────────────────────────────────────────────────
+
+async def _prime_async_queries(engine: AsyncEngine) -> None:
+    """엔진의 compiled cache 에 주요 조회 쿼리를 등록 (결과는 사용하지 않음)"""
+    async with AsyncSession(bind=engine) as db:
+        await question_service.get_question_list(db, offset=0, limit=10)
+        await question_service.get_question_list(db, offset=0, limit=10, keyword="warmup")
+        await question_service.get_question_list(db, limit=10, after=(datetime.now(), 0))
+        await question_service.get_question(db, question_id=0)
+        await notification_service.get_notifications(db, user_id=0)
+        await notification_service.get_notifications(db, user_id=0, after=(datetime.now(), 0))
+        await user_service.get_user_async(db, username="")
+        await db.rollback()
+
+
+def _prime_sync_queries(engine: Engine) -> None:
+    with Session(bind=engine) as db:
+        question_service.get_question_sync(db, question_id=0)
+        user_service.get_user_sync(db, username="")
+        db.rollback()
+
+
+# ── 실행 ────────────────────────────────────────────────────────────────────
+
+class Warmup:
+    """lifespan 에서 백그라운드로 워밍업을 수행하고 완료 시 ready 로 전환"""
+
+    def __init__(self):
+        self.state = WarmupState()
+        self._task: Optional[asyncio.Task] = None
+
+    async def _run_step(self, name: str, coro) -> None:
+        try:
+            result = await coro
+            if isinstance(result, dict):
+                self.state.connections.update(result)
+            elif isinstance(result, int):
+                self.state.connections[name] = result
+        except Exception as e:
+            logger.error(f"Warm-up step failed: {name}, error={e}")
+            self.state.errors.append(f"{name}: {e}")
+
+    async def run(self) -> None:
+        self.state = WarmupState(started_at=time.time())
+        started = time.perf_counter()
+
+        steps = [self._run_step(name, warm_async_engine(engine, WARMUP_DB_CONNECTIONS))
+                 for name, engine in ASYNC_ENGINES.items()]
+        steps += [self._run_step(name, asyncio.to_thread(warm_sync_engine, engine, WARMUP_DB_CONNECTIONS))
+                  for name, engine in SYNC_ENGINES.items()]
+        steps.append(self._run_step("redis", warm_redis_pools(WARMUP_REDIS_CONNECTIONS)))
+        try:
+            await asyncio.wait_for(asyncio.gather(*steps), timeout=WARMUP_TIMEOUT_SECONDS)
+        except asyncio.TimeoutError:
+            self.state.errors.append(f"connections: timed out after {WARMUP_TIMEOUT_SECONDS}s")
+
+        # 풀이 채워진 뒤 컴파일 캐시 워밍 (커넥션 경합 없이 순차 실행)
+        for name, engine in ASYNC_ENGINES.items():
+            await self._run_step(f"{name}_queries", _prime_async_queries(engine))
+        for name, engine in SYNC_ENGINES.items():
+            await self._run_step(f"{name}_queries", asyncio.to_thread(_prime_sync_queries, engine))
+
+        self.state.duration_s = round(time.perf_counter() - started, 3)
+        self.state.ready = True
+        logger.info(
+            f"Warm-up finished in {self.state.duration_s}s: "
+            f"connections={self.state.connections}, errors={len(self.state.errors)}"
+        )
+
+    async def start(self) -> None:
+        """앱 시작 시 워밍업 태스크 실행 (비활성화 시 즉시 ready)"""
+        if not WARMUP_ENABLED:
+            self.state.ready = True
+            return
+        if self._task is None:
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+
+warmup = Warmup()
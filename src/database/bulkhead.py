@@ -0,0 +1,130 @@
+"""워크로드별 커넥션 풀 파티션 (Bulkhead)
+
+느린 쿼리(pg_sleep 실험, 대량 조회, 배치)가 하나의 Primary 풀을 모두 점유하면
+로그인/알림 같은 대화형 요청까지 pool_timeout 까지 대기하게 된다.
+워크로드 클래스마다 별도의 풀(엔진)을 두어 한 클래스의 포화가 다른 클래스로 번지지 않게 한다.
+
+파티션:
+    interactive : 기본값. database.py 의 Primary 엔진(DB_POOL_SIZE 등)을 그대로 사용
+    bulk        : 대량 조회, pg_sleep 실험 API
+    background  : 스케줄러, 알림 폴러 등 백그라운드 작업
+
+파티션별 설정 (환경 변수):
+    DB_BULKHEAD_<NAME>_POOL_SIZE / _MAX_OVERFLOW / _POOL_TIMEOUT
+    DB_BULKHEAD_<NAME>_ASYNC_URL / _SYNC_URL  (미설정 시 Primary URL)
+
+사용 예시:
+    # 라우터 단위
+    router = APIRouter(prefix="/api/export", dependencies=[Depends(use_partition(PARTITION_BULK))])
+
+    # 엔드포인트 단위 - get_async_db / get_async_read_db / get_db 가 현재 파티션의 풀을 사용
+    @router.get("/report", dependencies=[Depends(use_partition(PARTITION_BULK))])
+    async def report(db: AsyncSession = Depends(get_async_db)): ...
+
+메트릭 (/metrics):
+    db_bulkhead_capacity / db_bulkhead_in_use {partition, driver}
+    db_pool_checkout_wait_seconds / db_pool_checkout_timeouts_total {engine="async_bulk", ...}
+"""
+
+import os
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy.engine import Engine
+
+from src.database.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool
+
+PARTITION_INTERACTIVE = "interactive"
+PARTITION_BULK = "bulk"
+PARTITION_BACKGROUND = "background"
+
+
+@dataclass(frozen=True)
+class PoolPartition:
+    """파티션 풀 설정"""
+    name: str
+    pool_size: int
+    max_overflow: int
+    pool_timeout: float
+    async_url: Optional[str] = None
+    sync_url: Optional[str] = None
+
+
+def _load_partition(name: str, pool_size: int, max_overflow: int, pool_timeout: float) -> PoolPartition:
+    prefix = f"DB_BULKHEAD_{name.upper()}"
+    return PoolPartition(
+        name=name,
+        pool_size=int(os.getenv(f"{prefix}_POOL_SIZE", pool_size)),
+        max_overflow=int(os.getenv(f"{prefix}_MAX_OVERFLOW", max_overflow)),
+        pool_timeout=float(os.getenv(f"{prefix}_POOL_TIMEOUT", pool_timeout)),
+        async_url=os.getenv(f"{prefix}_ASYNC_URL"),
+        sync_url=os.getenv(f"{prefix}_SYNC_URL"),
+    )
+
+
+# interactive 를 제외한 파티션 (각각 별도 엔진 생성)
+BULKHEAD_PARTITIONS: Dict[str, PoolPartition] = {
+    PARTITION_BULK: _load_partition(PARTITION_BULK, pool_size=5, max_overflow=0, pool_timeout=30),
+    PARTITION_BACKGROUND: _load_partition(PARTITION_BACKGROUND, pool_size=3, max_overflow=0, pool_timeout=60),
+}
+PARTITION_NAMES = (PARTITION_INTERACTIVE, *BULKHEAD_PARTITIONS)
+
+_current_partition: ContextVar[str] = ContextVar("db_partition", default=PARTITION_INTERACTIVE)
+
+
+def get_partition() -> str:
+    """현재 요청(태스크)이 사용할 파티션 이름"""
+    return _current_partition.get()
+
+
+def use_partition(name: str) -> Callable:
+    """이후 DB 의존성이 지정한 파티션의 풀을 사용하도록 하는 FastAPI 의존성 생성
+
+    라우터/엔드포인트의 dependencies 에 지정하면 같은 요청의 get_async_db 등보다 먼저 실행된다.
+    """
+    if name not in PARTITION_NAMES:
+        raise ValueError(f"Unknown DB partition: {name}")
+
+    async def _use_partition():
+        token = _current_partition.set(name)
+        try:
+            yield name
+        finally:
+            _current_partition.reset(token)
+
+    return _use_partition
+
+
+class BulkheadStatsCollector:
+    """스크레이프 시점에 파티션별 풀 용량/사용량을 게이지로 반환"""
+
+    def __init__(self):
+        self._engines: List[Tuple[str, str, Engine]] = []
+
+    def add(self, partition: str, driver: str, sync_engine: Engine) -> None:
+        self._engines.append((partition, driver, sync_engine))
+
+    def collect(self):
+        capacity = GaugeMetricFamily(
+            "db_bulkhead_capacity", "pool_size + max_overflow of the partition pool", labels=["partition", "driver"]
+        )
+        in_use = GaugeMetricFamily(
+            "db_bulkhead_in_use", "Connections checked out from the partition pool", labels=["partition", "driver"]
+        )
+
+        for partition, driver, sync_engine in self._engines:
+            pool = sync_engine.pool
+            if not isinstance(pool, (InstrumentedQueuePool, InstrumentedAsyncQueuePool)):
+                continue
+            capacity.add_metric([partition, driver], pool.size() + max(pool.max_overflow, 0))
+            in_use.add_metric([partition, driver], pool.checkedout())
+
+        yield capacity
+        yield in_use
+
+
+bulkhead_stats_collector = BulkheadStatsCollector()
+REGISTRY.register(bulkhead_stats_collector)
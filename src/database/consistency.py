@@ -0,0 +1,149 @@
+"""Read-your-writes 일관성 토큰
+
+Primary 에 쓰기(commit)가 발생한 요청의 응답에 Primary 의 WAL LSN 을 일관성 토큰으로 내려줍니다.
+이후 요청이 토큰(헤더 또는 쿠키)을 함께 보내면, 읽기 세션은 해당 LSN 까지 재생(replay)을 마친
+Replica 로만 라우팅되고, 그렇지 않으면 Primary 로 fallback 합니다.
+
+흐름:
+    1. ConsistencyTokenMiddleware 가 요청의 토큰을 파싱하여 요청 컨텍스트(ContextVar)에 저장
+    2. Primary 세션의 after_commit 이벤트가 요청 컨텍스트에 쓰기 발생을 표시
+    3. 응답 시작 시 쓰기가 있었다면 SELECT pg_current_wal_lsn() 결과를 헤더/쿠키로 전달
+    4. get_async_read_db / get_read_db 는 토큰이 있으면 Replica 의 replay LSN 을 확인 후 엔진 결정
+"""
+
+import logging
+import os
+from contextvars import ContextVar
+from dataclasses import dataclass
+from http.cookies import SimpleCookie
+from typing import Iterable, Optional
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import Session
+from starlette.datastructures import MutableHeaders
+
+logger = logging.getLogger(__name__)
+
+CONSISTENCY_HEADER = "X-Consistency-Token"
+CONSISTENCY_COOKIE = "consistency_token"
+# 토큰 유효 시간 (초) - Replica 가 따라잡기에 충분한 시간 이후에는 토큰이 필요 없다
+CONSISTENCY_TOKEN_MAX_AGE = int(os.getenv("CONSISTENCY_TOKEN_MAX_AGE", 60))
+
+PRIMARY_LSN_QUERY = text("SELECT pg_current_wal_lsn()::text")
+REPLAY_LSN_QUERY = text("SELECT pg_last_wal_replay_lsn()::text")
+
+
+@dataclass
+class ConsistencyState:
+    """요청 단위 일관성 상태"""
+    required_lsn: Optional[int] = None
+    wrote: bool = False
+
+
+_consistency_state: ContextVar[Optional[ConsistencyState]] = ContextVar("consistency_state", default=None)
+
+
+def parse_lsn(value: Optional[str]) -> Optional[int]:
+    """'16/B374D848' 형식의 LSN 을 비교 가능한 정수로 변환 (잘못된 값은 None)"""
+    if not value:
+        return None
+    try:
+        high, low = value.strip().split("/")
+        return (int(high, 16) << 32) | int(low, 16)
+    except ValueError:
+        return None
+
+
+def get_required_lsn() -> Optional[int]:
+    """현재 요청이 요구하는 최소 LSN (토큰이 없으면 None)"""
+    state = _consistency_state.get()
+    return state.required_lsn if state else None
+
+
+def register_write_tracking(primary_engines: Iterable[Engine]) -> None:
+    """Primary 엔진에 바인딩된 세션의 commit 을 요청 컨텍스트에 기록
+
+    Args:
+        primary_engines: 쓰기용 동기 엔진 목록 (비동기 엔진은 .sync_engine 전달)
+    """
+    primary_ids = {id(e) for e in primary_engines}
+
+    @event.listens_for(Session, "after_commit")
+    def _after_commit(session):
+        state = _consistency_state.get()
+        if state is not None and id(session.bind) in primary_ids:
+            state.wrote = True
+
+
+async def fetch_replay_lsn(engine: AsyncEngine) -> Optional[int]:
+    async with engine.connect() as conn:
+        return parse_lsn((await conn.execute(REPLAY_LSN_QUERY)).scalar())
+
+
+def fetch_replay_lsn_sync(engine: Engine) -> Optional[int]:
+    with engine.connect() as conn:
+        return parse_lsn(conn.execute(REPLAY_LSN_QUERY).scalar())
+
+
+def _read_request_token(scope) -> Optional[int]:
+    header_name = CONSISTENCY_HEADER.lower().encode()
+    cookie_header = None
+    for name, value in scope.get("headers", []):
+        if name == header_name:
+            return parse_lsn(value.decode("latin-1"))
+        if name == b"cookie":
+            cookie_header = value.decode("latin-1")
+
+    if cookie_header:
+        cookie = SimpleCookie()
+        cookie.load(cookie_header)
+        if CONSISTENCY_COOKIE in cookie:
+            return parse_lsn(cookie[CONSISTENCY_COOKIE].value)
+    return None
+
+
+class ConsistencyTokenMiddleware:
+    """요청 토큰 파싱 및 쓰기 요청 응답에 일관성 토큰을 추가하는 ASGI 미들웨어
+
+    BaseHTTPMiddleware 대신 순수 ASGI 로 구현하여 SSE 스트리밍 응답에도 영향을 주지 않는다.
+    """
+
+    def __init__(self, app, primary_engine: AsyncEngine):
+        self.app = app
+        self.primary_engine = primary_engine
+
+    async def _current_primary_lsn(self) -> Optional[str]:
+        try:
+            async with self.primary_engine.connect() as conn:
+                return (await conn.execute(PRIMARY_LSN_QUERY)).scalar()
+        except Exception as e:
+            logger.error(f"Failed to read primary WAL LSN: {e}")
+            return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = ConsistencyState(required_lsn=_read_request_token(scope))
+        context_token = _consistency_state.set(state)
+
+        async def send_with_token(message):
+            if message["type"] == "http.response.start" and state.wrote:
+                lsn = await self._current_primary_lsn()
+                if lsn:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(CONSISTENCY_HEADER, lsn)
+                    headers.append(
+                        "set-cookie",
+                        f"{CONSISTENCY_COOKIE}={lsn}; Max-Age={CONSISTENCY_TOKEN_MAX_AGE}; "
+                        f"Path=/; HttpOnly; SameSite=Lax",
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_token)
+        finally:
+            _consistency_state.reset(context_token)
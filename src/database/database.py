@@ -4,18 +4,24 @@ import os
 import time
 from contextlib import asynccontextmanager
 from functools import wraps
-import random
 
 import aioredis
 import redis
-from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy import create_engine, event, MetaData
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
 
 from config import SYNC_SQLALCHEMY_DATABASE_URL, ASYNC_SQLALCHEMY_DATABASE_URL
-from src.exceptions import ExceptionResponse
+from src.database import bulkhead, consistency
+from src.database.bulkhead import BULKHEAD_PARTITIONS, PARTITION_BACKGROUND, PARTITION_INTERACTIVE
+from src.database.query_metrics import register_query_metrics
+from src.database.pool_controller import AdaptivePoolController
+from src.database.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, register_pool_metrics
+from src.database.read_router import ReadEngineRouter
+from src.database.redis_pool import redis_pool
+from src.database.statement_cache import asyncpg_connect_args
 
 """
 create_engine, sessionmaker 등을 사용하는것은 SQLAlchemy 데이터베이스를 사용하기 위해 따라야 할 규칙이다.
@@ -50,6 +56,9 @@ DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 20))
 DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 30))
 DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", 10))
 
+# 요청마다 연결 정보(호스트/포트/DB/유저)를 로깅할지 여부 (디버깅용, 기본 비활성화)
+DB_CONNECTION_DEBUG_LOG = os.getenv("DB_CONNECTION_DEBUG_LOG", "false").lower() == "true"
+
 # Primary Async DB 연결 설정
 async_engine_primary = create_async_engine(
     ASYNC_SQLALCHEMY_DATABASE_URL,
@@ -58,6 +67,9 @@ async_engine_primary = create_async_engine(
     pool_timeout=DB_POOL_TIMEOUT,
     pool_recycle=3600,
     pool_pre_ping=True,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_logging_name="async_primary",
+    connect_args=asyncpg_connect_args("async_primary"),
     echo=False
 )
 
@@ -70,6 +82,9 @@ async_engine_replica = create_async_engine(
     pool_timeout=DB_POOL_TIMEOUT,
     pool_recycle=3600,
     pool_pre_ping=True,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_logging_name="async_replica",
+    connect_args=asyncpg_connect_args("async_replica"),
     echo=False
 )
 
@@ -81,6 +96,8 @@ engine = create_engine(
     pool_timeout=DB_POOL_TIMEOUT,
     pool_recycle=3600,
     pool_pre_ping=True,
+    poolclass=InstrumentedQueuePool,
+    pool_logging_name="sync_primary",
     echo=False
 )
 
@@ -93,17 +110,113 @@ engine_replica = create_engine(
     pool_timeout=DB_POOL_TIMEOUT,
     pool_recycle=3600,
     pool_pre_ping=True,
+    poolclass=InstrumentedQueuePool,
+    pool_logging_name="sync_replica",
     echo=False
 )
 
+# 워크로드별 풀 파티션 (bulkhead) - interactive 는 위 Primary 엔진을 그대로 사용
+partition_async_engines = {PARTITION_INTERACTIVE: async_engine_primary}
+partition_sync_engines = {PARTITION_INTERACTIVE: engine}
+for _partition in BULKHEAD_PARTITIONS.values():
+    partition_async_engines[_partition.name] = create_async_engine(
+        _partition.async_url or ASYNC_SQLALCHEMY_DATABASE_URL,
+        pool_size=_partition.pool_size,
+        max_overflow=_partition.max_overflow,
+        pool_timeout=_partition.pool_timeout,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_logging_name=f"async_{_partition.name}",
+        connect_args=asyncpg_connect_args(f"async_{_partition.name}"),
+        echo=False
+    )
+    partition_sync_engines[_partition.name] = create_engine(
+        _partition.sync_url or SYNC_SQLALCHEMY_DATABASE_URL,
+        pool_size=_partition.pool_size,
+        max_overflow=_partition.max_overflow,
+        pool_timeout=_partition.pool_timeout,
+        pool_recycle=3600,
+        pool_pre_ping=True,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=f"sync_{_partition.name}",
+        echo=False
+    )
+
+# 커넥션 풀 Prometheus 메트릭 등록 (/metrics)
+register_pool_metrics("async_primary", async_engine_primary)
+register_pool_metrics("async_replica", async_engine_replica)
+register_pool_metrics("sync_primary", engine)
+register_pool_metrics("sync_replica", engine_replica)
+for _name in BULKHEAD_PARTITIONS:
+    register_pool_metrics(f"async_{_name}", partition_async_engines[_name])
+    register_pool_metrics(f"sync_{_name}", partition_sync_engines[_name])
+for _name in partition_async_engines:
+    bulkhead.bulkhead_stats_collector.add(_name, "async", partition_async_engines[_name].sync_engine)
+    bulkhead.bulkhead_stats_collector.add(_name, "sync", partition_sync_engines[_name])
+
+CONNECTION_IDENTITY_QUERY = "SELECT current_database(), current_user, inet_server_addr(), inet_server_port()"
+
+
+def _capture_connection_identity(dbapi_connection, connection_record):
+    """물리 커넥션이 생성될 때 1회만 연결 정보를 조회하여 connection record 에 캐시
+
+    요청마다 진단 SELECT 를 실행하면 DB 왕복이 1회 추가되므로,
+    풀 connect 이벤트에서 조회한 값을 재사용한다.
+    """
+    existing_autocommit = dbapi_connection.autocommit
+    dbapi_connection.autocommit = True
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.execute(CONNECTION_IDENTITY_QUERY)
+        database, user, host, port = cursor.fetchone()
+    finally:
+        cursor.close()
+        dbapi_connection.autocommit = existing_autocommit
+
+    connection_record.info["db_identity"] = {
+        "database": database,
+        "user": user,
+        "host": str(host),
+        "port": port,
+    }
+
+
+for _sync_engine in (
+    async_engine_replica.sync_engine,
+    engine_replica,
+    *[e.sync_engine for e in partition_async_engines.values()],
+    *partition_sync_engines.values(),
+):
+    event.listen(_sync_engine, "connect", _capture_connection_identity)
+    register_query_metrics(_sync_engine)
+
+
+async def _log_connection_identity(db: AsyncSession, label: str) -> None:
+    """캐시된 연결 정보를 로깅 (DB_CONNECTION_DEBUG_LOG=true 일 때만 호출)"""
+    connection = await db.connection()
+    db_info = connection.info.get("db_identity", {})
+    logger.info(f"{label} Connection Info - Host: {db_info.get('host')}, Port: {db_info.get('port')}, "
+                f"Database: {db_info.get('database')}, User: {db_info.get('user')}")
+
+
+# 파티션별 Async 세션 팩토리 (interactive = Primary)
+partition_async_sessions = {
+    name: sessionmaker(
+        partition_engine,
+        class_=AsyncSession,
+        expire_on_commit=False,
+        autocommit=False,
+        autoflush=False
+    )
+    for name, partition_engine in partition_async_engines.items()
+}
+
 # Primary Async 세션 팩토리
-AsyncSessionPrimary = sessionmaker(
-    async_engine_primary,
-    class_=AsyncSession,
-    expire_on_commit=False,
-    autocommit=False,
-    autoflush=False
-)
+AsyncSessionPrimary = partition_async_sessions[PARTITION_INTERACTIVE]
+
+# 백그라운드 작업(스케줄러, 알림 폴러)용 Async 세션 팩토리
+AsyncSessionBackground = partition_async_sessions[PARTITION_BACKGROUND]
 
 # Replica Async 세션 팩토리
 AsyncSessionReplica = sessionmaker(
@@ -114,27 +227,92 @@ AsyncSessionReplica = sessionmaker(
     autoflush=False
 )
 
+# 읽기 엔진 라우터 (지연 시간/복제 지연 기반 가중치 선택, 첫 번째 엔진이 Primary)
+read_engine_router = ReadEngineRouter({
+    "async_primary": async_engine_primary,
+    "async_replica": async_engine_replica,
+})
+sync_read_engine_router = ReadEngineRouter({
+    "sync_primary": engine,
+    "sync_replica": engine_replica,
+})
+
+# 적응형 풀 크기 조절 (DB_POOL_CONTROLLER_ENABLED=true 일 때만 동작)
+# 그룹 = 같은 Postgres 서버, bulkhead 파티션 엔진은 고정 크기로 예산에만 포함
+pool_controller = AdaptivePoolController({
+    "primary": (
+        {"async_primary": async_engine_primary, "sync_primary": engine},
+        [partition_engine
+         for name in BULKHEAD_PARTITIONS
+         for partition_engine in (partition_async_engines[name], partition_sync_engines[name])],
+    ),
+    "replica": ({"async_replica": async_engine_replica, "sync_replica": engine_replica}, []),
+})
+
+# Primary 세션의 commit 을 요청 컨텍스트에 기록 (Read-your-writes 일관성 토큰 발급용)
+consistency.register_write_tracking(
+    [e.sync_engine for e in partition_async_engines.values()] + list(partition_sync_engines.values())
+)
+
 async def get_read_engine():
-    """읽기 작업을 위한 엔진 선택 (Primary or Replica)"""
-    engines = [async_engine_primary, async_engine_replica]
-    return random.choice(engines)
+    """읽기 작업을 위한 엔진 선택 (Primary or Replica, 가중치 기반)
+
+    요청에 일관성 토큰이 있으면 해당 LSN 까지 재생을 마친 Replica 만 사용하고,
+    그렇지 않으면 Primary 로 fallback 한다.
+    """
+    selected = read_engine_router.choose()
+    required_lsn = consistency.get_required_lsn()
+    if required_lsn is None or selected is async_engine_primary:
+        return selected
+
+    name = read_engine_router.name_of(selected)
+    if not read_engine_router.has_replayed(name, required_lsn):
+        try:
+            read_engine_router.record_replay_lsn(name, await consistency.fetch_replay_lsn(selected))
+        except SQLAlchemyError as e:
+            logger.error(f"Replay LSN check failed: engine={name}, error={e}")
+            read_engine_router.record_error(name)
+    return selected if read_engine_router.has_replayed(name, required_lsn) else async_engine_primary
 
 def get_sync_read_engine():
-    """동기 읽기 작업을 위한 엔진 선택 (Primary or Replica)"""
-    engines = [engine] + [engine_replica]
-    return random.choice(engines)
+    """동기 읽기 작업을 위한 엔진 선택 (Primary or Replica, 가중치 기반, 일관성 토큰 반영)"""
+    selected = sync_read_engine_router.choose()
+    required_lsn = consistency.get_required_lsn()
+    if required_lsn is None or selected is engine:
+        return selected
+
+    name = sync_read_engine_router.name_of(selected)
+    if not sync_read_engine_router.has_replayed(name, required_lsn):
+        try:
+            sync_read_engine_router.record_replay_lsn(name, consistency.fetch_replay_lsn_sync(selected))
+        except SQLAlchemyError as e:
+            logger.error(f"Replay LSN check failed: engine={name}, error={e}")
+            sync_read_engine_router.record_error(name)
+    return selected if sync_read_engine_router.has_replayed(name, required_lsn) else engine
 
 async def get_async_read_db():
-    """읽기 전용 DB 연결 - Primary/Replica 로드밸런싱"""
-    engine = await get_read_engine()
+    """읽기 전용 DB 연결 - Primary/Replica 로드밸런싱
+
+    bulkhead 파티션이 지정된 요청은 Replica 라우팅 대신 해당 파티션의 풀을 사용한다.
+    """
+    partition = bulkhead.get_partition()
+    if partition != PARTITION_INTERACTIVE:
+        engine = partition_async_engines[partition]
+    else:
+        engine = await get_read_engine()
     async with AsyncSession(bind=engine) as db:
         try:
-            # 데이터베이스 연결 정보 조회
-            result = await db.execute(text("SELECT current_database(), current_user, inet_server_addr(), inet_server_port()"))
-            db_info = result.fetchone()
-            logger.info(f"Database Connection Info - Host: {db_info[2]}, Port: {db_info[3]}, "
-                       f"Database: {db_info[0]}, User: {db_info[1]}")
-            
+            # 커넥션 획득 시간(풀 대기)을 라우터에 기록
+            started = time.perf_counter()
+            await db.connection()
+            if partition == PARTITION_INTERACTIVE:
+                read_engine_router.record_pool_wait(
+                    read_engine_router.name_of(engine), (time.perf_counter() - started) * 1000
+                )
+
+            if DB_CONNECTION_DEBUG_LOG:
+                await _log_connection_identity(db, "Database")
+
             yield db
         except SQLAlchemyError as e:
             await db.rollback()
@@ -142,12 +320,22 @@ async def get_async_read_db():
             raise
 
 def get_read_db():
-    """동기 읽기 전용 DB 연결 - Primary/Replica 로드밸런싱"""
+    """동기 읽기 전용 DB 연결 - Primary/Replica 로드밸런싱 (bulkhead 파티션 지정 시 파티션 풀)"""
+    partition = bulkhead.get_partition()
     retry_count = 0
     while retry_count <= 3:
-        engine = get_sync_read_engine()
+        if partition != PARTITION_INTERACTIVE:
+            engine = partition_sync_engines[partition]
+        else:
+            engine = get_sync_read_engine()
         db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
         try:
+            started = time.perf_counter()
+            db.connection()
+            if partition == PARTITION_INTERACTIVE:
+                sync_read_engine_router.record_pool_wait(
+                    sync_read_engine_router.name_of(engine), (time.perf_counter() - started) * 1000
+                )
             yield db
             break
         except SQLAlchemyError as e:
@@ -160,8 +348,13 @@ def get_read_db():
     if retry_count > 3:
         logger.error("Maximum retry attempts reached for read operation, failing.")
 
-# 동기 세션 설정
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# 동기 세션 설정 (파티션별, interactive = Primary)
+partition_sessions = {
+    name: sessionmaker(autocommit=False, autoflush=False, bind=partition_engine)
+    for name, partition_engine in partition_sync_engines.items()
+}
+SessionLocal = partition_sessions[PARTITION_INTERACTIVE]
+SessionBackground = partition_sessions[PARTITION_BACKGROUND]
 SessionLocalReplica = sessionmaker(autocommit=False, autoflush=False, bind=engine_replica)
 
 class AsyncTransactionManager:
@@ -188,54 +381,22 @@ def async_transactional(method):
     return wrapper
 
 
-async def get_async_redis_client():
-    try:
-        redis_host = os.getenv('REDIS_HOST', 'localhost')
-        redis_port = int(os.getenv('REDIS_PORT', 6379))
-        redis_password = os.getenv('REDIS_PASSWORD', '')
-
-        redis_url = f'redis://:{redis_password}@{redis_host}:{redis_port}'
-        redis_client = aioredis.from_url(redis_url, decode_responses=True)
-
-        # Test the connection
-        await redis_client.ping()
-
-        return redis_client
-    except aioredis.ConnectionError as e:
-        raise ExceptionResponse(message=f"비동기 Redis 연결 간 에러가 발생 했습니다.: {str(e)}", error_code="R0000")
+async def get_async_redis_client() -> aioredis.Redis:
+    """공용 비동기 커넥션 풀을 사용하는 Redis 클라이언트 (FastAPI Depends 로 주입 가능)"""
+    return redis_pool.async_client()
 
 
-def get_sync_redis_client():
-    try:
-        redis_host = os.getenv('REDIS_HOST', 'localhost')
-        redis_port = int(os.getenv('REDIS_PORT', 6379))
-        redis_password = os.getenv('REDIS_PASSWORD', '')
-
-        redis_client = redis.StrictRedis(
-            host=redis_host,
-            port=redis_port,
-            password=redis_password,
-            db=0,
-            decode_responses=True
-        )
-
-        # Test the connection
-        redis_client.ping()
-
-        return redis_client
-    except redis.ConnectionError as e:
-        raise ExceptionResponse(message=f"동기 Redis 연결 간 에러가 발생 했습니다.: {str(e)}", error_code="R0000")
+def get_sync_redis_client() -> redis.Redis:
+    """공용 동기 커넥션 풀을 사용하는 Redis 클라이언트"""
+    return redis_pool.sync_client()
 
 async def get_async_db():
-    """쓰기 전용 DB 연결 - Primary 사용"""
-    async with AsyncSessionPrimary() as db:
+    """쓰기 전용 DB 연결 - Primary 사용 (bulkhead 파티션 지정 시 해당 파티션 풀)"""
+    async with partition_async_sessions[bulkhead.get_partition()]() as db:
         try:
-            # 데이터베이스 연결 정보 조회
-            result = await db.execute(text("SELECT current_database(), current_user, inet_server_addr(), inet_server_port()"))
-            db_info = result.fetchone()
-            logger.info(f"Primary Database Connection Info - Host: {db_info[2]}, Port: {db_info[3]}, "
-                       f"Database: {db_info[0]}, User: {db_info[1]}")
-            
+            if DB_CONNECTION_DEBUG_LOG:
+                await _log_connection_identity(db, "Primary Database")
+
             yield db
         except SQLAlchemyError as e:
             await db.rollback()
@@ -247,7 +408,7 @@ def get_db():
     """Primary DB 연결용 (쓰기 전용)"""
     retry_count = 0
     while retry_count <= 3:
-        db = SessionLocal()
+        db = partition_sessions[bulkhead.get_partition()]()
         try:
             yield db
             break
@@ -0,0 +1,402 @@
+"""적응형 커넥션 풀 크기 조절 컨트롤러
+
+DB_POOL_SIZE / DB_MAX_OVERFLOW 는 엔진·워커마다 고정이라 w4, 멀티 인스턴스 구성에서는
+(인스턴스 × 워커 × 엔진) 만큼 곱해져 Postgres max_connections 를 쉽게 넘긴다.
+컨트롤러는 워커마다 백그라운드로 다음 신호를 주기적으로 확인하여 엔진별 유효 풀 크기
+(pool_size + max_overflow)를 한도 안에서 늘리거나 줄인다.
+
+- 체크아웃 대기 시간 / pool_timeout 초과 (InstrumentedQueuePool 의 체크아웃 윈도우)
+- 구간 최대 사용 커넥션 수 (peak checked out)
+- Postgres 여유 커넥션 (max_connections - 현재 client backend 수) - 조절 대상 풀이 포화된 때에도 측정되도록
+  풀 밖의 전용 커넥션(NullPool 엔진)으로 조회
+- 전역 예산: Redis 해시에 워커별 예약 커넥션 수를 기록하여 인스턴스/워커 간 합계를 예산 이하로 유지
+
+조절 방식:
+    QueuePool/asyncio.Queue 의 크기는 실행 중에 안전하게 바꿀 수 없으므로 pool_size 를 하한으로 두고
+    pool._max_overflow 를 0 ~ 설정값(DB_MAX_OVERFLOW) 사이에서 조절한다.
+    오버플로 커넥션은 반환 시 닫히므로 줄인 만큼 물리 커넥션도 줄어든다.
+    DB_POOL_CONTROLLER_TRIM_IDLE=true 이면 구간 최대 사용량을 넘는 유휴 커넥션도 닫는다 (필요 시 재연결).
+    컨트롤러를 켤 때는 DB_POOL_SIZE 를 평상시 사용량 수준으로 작게 두는 것을 권장한다.
+
+설정 (환경 변수):
+    DB_POOL_CONTROLLER_ENABLED          컨트롤러 실행 여부 (기본 false)
+    DB_POOL_CONTROLLER_INTERVAL         조절 주기 (초)
+    DB_POOL_CONTROLLER_GROW_WAIT_MS     평균 체크아웃 대기가 이 값 이상이면 확장
+    DB_POOL_CONTROLLER_SHRINK_RATIO     구간 최대 사용량이 유효 크기 × 비율 미만이면 축소
+    DB_POOL_CONTROLLER_STEP             1회 조절 커넥션 수
+    DB_POOL_CONTROLLER_TRIM_IDLE        유휴 커넥션 정리 여부
+    DB_POOL_GLOBAL_BUDGET[_<GROUP>]     그룹(primary/replica)별 전체 워커 커넥션 예산
+                                        (미설정 시 max_connections - DB_POOL_RESERVED_CONNECTIONS)
+    DB_POOL_RESERVED_CONNECTIONS        관리/마이그레이션/모니터링용으로 남겨둘 커넥션 수
+
+Redis 를 사용할 수 없으면 전역 예산 없이 Postgres 여유 커넥션만 보고 로컬에서 조절한다.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
+
+from prometheus_client import Counter, Gauge
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool, QueuePool
+from sqlalchemy.util import greenlet_spawn
+from sqlalchemy.util import queue as sqla_queue
+
+from src.database.redis_pool import redis_pool
+
+logger = logging.getLogger(__name__)
+
+DB_POOL_CONTROLLER_ENABLED = os.getenv("DB_POOL_CONTROLLER_ENABLED", "false").lower() == "true"
+DB_POOL_CONTROLLER_INTERVAL = float(os.getenv("DB_POOL_CONTROLLER_INTERVAL", 5.0))
+DB_POOL_CONTROLLER_GROW_WAIT_MS = float(os.getenv("DB_POOL_CONTROLLER_GROW_WAIT_MS", 5.0))
+DB_POOL_CONTROLLER_SHRINK_RATIO = float(os.getenv("DB_POOL_CONTROLLER_SHRINK_RATIO", 0.5))
+DB_POOL_CONTROLLER_STEP = int(os.getenv("DB_POOL_CONTROLLER_STEP", 5))
+DB_POOL_CONTROLLER_TRIM_IDLE = os.getenv("DB_POOL_CONTROLLER_TRIM_IDLE", "false").lower() == "true"
+DB_POOL_RESERVED_CONNECTIONS = int(os.getenv("DB_POOL_RESERVED_CONNECTIONS", 10))
+DB_POOL_BUDGET_KEY_PREFIX = os.getenv("DB_POOL_BUDGET_KEY_PREFIX", "db_pool_budget")
+
+# 워커가 이 시간(주기 × 3) 동안 갱신하지 않으면 예약이 해제된 것으로 간주
+_STALE_AFTER_SECONDS = DB_POOL_CONTROLLER_INTERVAL * 3
+
+CONNECTION_HEADROOM_QUERY = text("""
+    SELECT current_setting('max_connections')::int AS max_connections,
+           (SELECT count(*) FROM pg_stat_activity WHERE backend_type = 'client backend') AS connections
+""")
+
+DB_POOL_CONTROLLER_CAPACITY = Gauge(
+    "db_pool_controller_capacity",
+    "Effective pool capacity (pool_size + max_overflow) set by the adaptive controller",
+    ["engine"],
+)
+DB_POOL_CONTROLLER_BUDGET = Gauge(
+    "db_pool_controller_budget",
+    "Connection budget shared by all workers of the group",
+    ["group"],
+)
+DB_POOL_CONTROLLER_RESERVED = Gauge(
+    "db_pool_controller_reserved",
+    "Connections reserved by all workers of the group (Redis)",
+    ["group"],
+)
+DB_POOL_CONTROLLER_ADJUSTMENTS = Counter(
+    "db_pool_controller_adjustments_total",
+    "Pool capacity changes made by the adaptive controller",
+    ["engine", "direction"],
+)
+
+AnyEngine = Union[Engine, AsyncEngine]
+
+
+def _sync_engine(engine: AnyEngine) -> Engine:
+    return engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+
+def _pool_capacity(pool: QueuePool) -> int:
+    return pool.size() + max(pool._max_overflow, 0)
+
+
+def _probe_engine(engines: List[AnyEngine]) -> AnyEngine:
+    """여유 커넥션 조회용 NullPool 엔진 (같은 서버)
+
+    조절 대상 풀에서 커넥션을 빌리면 풀이 포화되었을 때 (확장이 필요한 바로 그때) 요청 트래픽 뒤에서
+    pool_timeout 까지 기다리고, 실패한 체크아웃이 체크아웃 윈도우에도 기록된다.
+    동기 엔진이 있으면 그 URL 을 사용한다 (asyncpg prepared statement 설정과 무관하게 1회성 조회).
+    """
+    engine = next((engine for engine in engines if not isinstance(engine, AsyncEngine)), engines[0])
+    if isinstance(engine, AsyncEngine):
+        return create_async_engine(engine.url, poolclass=NullPool)
+    return create_engine(engine.url, poolclass=NullPool)
+
+
+def _load_budget(group: str) -> Optional[int]:
+    value = os.getenv(f"DB_POOL_GLOBAL_BUDGET_{group.upper()}", os.getenv("DB_POOL_GLOBAL_BUDGET"))
+    return int(value) if value else None
+
+
+@dataclass
+class ControlledPool:
+    """컨트롤러가 조절하는 엔진의 한도 (floor = pool_size, ceiling = 설정된 pool_size + max_overflow)"""
+    name: str
+    engine: AnyEngine
+    floor: int
+    ceiling: int
+
+    @property
+    def pool(self) -> QueuePool:
+        return _sync_engine(self.engine).pool
+
+    @property
+    def capacity(self) -> int:
+        return _pool_capacity(self.pool)
+
+    def set_capacity(self, capacity: int) -> None:
+        pool = self.pool
+        with pool._overflow_lock:
+            pool._max_overflow = capacity - pool.size()
+        DB_POOL_CONTROLLER_CAPACITY.labels(engine=self.name).set(capacity)
+
+
+@dataclass
+class PoolGroup:
+    """같은 Postgres 서버를 공유하는 엔진 묶음 (전역 예산 단위)
+
+    fixed 엔진(bulkhead 파티션 등)은 조절하지 않지만 예약 커넥션 수에는 포함한다.
+    probe_engine: 여유 커넥션 조회용 NullPool 엔진 (_probe_engine)
+    """
+    name: str
+    controlled: List[ControlledPool]
+    fixed: List[AnyEngine]
+    probe_engine: AnyEngine
+    budget: Optional[int] = None
+    headroom: Optional[int] = None
+
+    def reserved(self) -> int:
+        """이 워커가 그룹에서 예약한 커넥션 수 (엔진별 유효 크기 합계)"""
+        return (sum(pool.capacity for pool in self.controlled)
+                + sum(_pool_capacity(_sync_engine(engine).pool) for engine in self.fixed))
+
+
+def decide_capacity(
+    capacity: int,
+    floor: int,
+    ceiling: int,
+    avg_wait_ms: float,
+    timeouts: int,
+    peak_checked_out: int,
+    step: int = DB_POOL_CONTROLLER_STEP,
+    grow_wait_ms: float = DB_POOL_CONTROLLER_GROW_WAIT_MS,
+    shrink_ratio: float = DB_POOL_CONTROLLER_SHRINK_RATIO,
+) -> int:
+    """체크아웃 윈도우 통계로 다음 유효 풀 크기 결정 (예산 제한 전)
+
+    - 대기/타임아웃이 있거나 가득 찬 채로 사용되면 step 만큼 확장
+    - 최대 사용량이 capacity × shrink_ratio 미만이면 step 만큼 축소 (최대 사용량 + step 은 유지)
+    """
+    if timeouts or avg_wait_ms >= grow_wait_ms or peak_checked_out >= capacity:
+        target = capacity + step
+    elif peak_checked_out < capacity * shrink_ratio:
+        target = min(capacity, max(capacity - step, peak_checked_out + step))
+    else:
+        target = capacity
+    return max(floor, min(ceiling, target))
+
+
+class AdaptivePoolController:
+    """워커별 커넥션 풀 유효 크기를 주기적으로 조절하는 백그라운드 태스크"""
+
+    def __init__(
+        self,
+        groups: Dict[str, Tuple[Dict[str, AnyEngine], List[AnyEngine]]],
+        interval: float = DB_POOL_CONTROLLER_INTERVAL,
+        reserved_connections: int = DB_POOL_RESERVED_CONNECTIONS,
+        trim_idle: bool = DB_POOL_CONTROLLER_TRIM_IDLE,
+    ):
+        """
+        Args:
+            groups: 그룹 이름 -> (조절할 엔진 {이름: 엔진}, 예약에만 포함할 고정 엔진 목록)
+            interval: 조절 주기 (초)
+            reserved_connections: 예산 계산 시 max_connections 에서 제외할 커넥션 수
+            trim_idle: 구간 최대 사용량을 넘는 유휴 커넥션 정리 여부
+        """
+        self.interval = interval
+        self.reserved_connections = reserved_connections
+        self.trim_idle = trim_idle
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self.groups: Dict[str, PoolGroup] = {}
+        for group_name, (controlled, fixed) in groups.items():
+            pools = []
+            for name, engine in controlled.items():
+                pool = _sync_engine(engine).pool
+                pools.append(ControlledPool(name=name, engine=engine, floor=pool.size(), ceiling=_pool_capacity(pool)))
+            self.groups[group_name] = PoolGroup(
+                name=group_name, controlled=pools, fixed=list(fixed),
+                probe_engine=_probe_engine([pool.engine for pool in pools]), budget=_load_budget(group_name),
+            )
+        self._task: Optional[asyncio.Task] = None
+
+    # ── 신호 수집 ───────────────────────────────────────────────────────────
+
+    async def _probe_headroom(self, group: PoolGroup) -> None:
+        """max_connections 로 예산(미설정 시)과 현재 여유 커넥션 수 갱신"""
+        engine = group.probe_engine
+        if isinstance(engine, AsyncEngine):
+            async with engine.connect() as conn:
+                row = (await conn.execute(CONNECTION_HEADROOM_QUERY)).one()
+        else:
+            def _probe_sync():
+                with engine.connect() as conn:
+                    return conn.execute(CONNECTION_HEADROOM_QUERY).one()
+
+            row = await asyncio.to_thread(_probe_sync)
+
+        if _load_budget(group.name) is None:
+            group.budget = row.max_connections - self.reserved_connections
+        group.headroom = row.max_connections - self.reserved_connections - row.connections
+
+    async def _sync_reservations(self, group: PoolGroup) -> Optional[int]:
+        """이 워커의 예약을 Redis 에 기록하고 다른 워커들의 예약 합계를 반환"""
+        redis = redis_pool.async_client()
+        key = f"{DB_POOL_BUDGET_KEY_PREFIX}:{group.name}"
+        now = time.time()
+        await redis.hset(key, self.worker_id, f"{group.reserved()}|{now}")
+        await redis.expire(key, int(_STALE_AFTER_SECONDS * 10))
+
+        others = 0
+        stale = []
+        for field, value in (await redis.hgetall(key)).items():
+            field = field.decode() if isinstance(field, bytes) else field
+            value = value.decode() if isinstance(value, bytes) else value
+            if field == self.worker_id:
+                continue
+            reserved, updated_at = value.split("|")
+            if now - float(updated_at) > _STALE_AFTER_SECONDS:
+                stale.append(field)
+            else:
+                others += int(reserved)
+        if stale:
+            await redis.hdel(key, *stale)
+        return others
+
+    # ── 조절 ────────────────────────────────────────────────────────────────
+
+    def _apply(self, pool: ControlledPool, capacity: int) -> None:
+        current = pool.capacity
+        if capacity == current:
+            return
+        direction = "grow" if capacity > current else "shrink"
+        pool.set_capacity(capacity)
+        DB_POOL_CONTROLLER_ADJUSTMENTS.labels(engine=pool.name, direction=direction).inc()
+        logger.info(f"DB pool '{pool.name}' {direction}: capacity {current} -> {capacity}")
+
+    async def _trim_idle_connections(self, pool: ControlledPool, keep: int) -> None:
+        """물리 커넥션이 keep 개를 넘으면 유휴 커넥션을 닫음 (오버플로 카운터도 함께 감소)"""
+        queue_pool = pool.pool
+
+        def _trim() -> int:
+            closed = 0
+            while queue_pool.size() + queue_pool._overflow > keep:
+                try:
+                    record = queue_pool._pool.get(False)
+                except sqla_queue.Empty:
+                    break
+                try:
+                    record.close()
+                finally:
+                    queue_pool._dec_overflow()
+                closed += 1
+            return closed
+
+        # asyncpg 커넥션 종료는 greenlet 컨텍스트가 필요
+        if isinstance(pool.engine, AsyncEngine):
+            closed = await greenlet_spawn(_trim)
+        else:
+            closed = await asyncio.to_thread(_trim)
+        if closed:
+            logger.info(f"DB pool '{pool.name}' closed {closed} idle connections")
+
+    async def adjust_group(self, group: PoolGroup) -> None:
+        try:
+            await asyncio.wait_for(self._probe_headroom(group), timeout=self.interval)
+        except Exception as e:
+            logger.error(f"Connection headroom probe failed: group={group.name}, error={e}")
+
+        others: Optional[int] = None
+        try:
+            others = await self._sync_reservations(group)
+        except Exception as e:
+            logger.warning(f"Pool budget sync failed, using local limits: group={group.name}, error={e}")
+
+        # 이번 주기에 이 워커가 더 예약할 수 있는 커넥션 수 (None = 제한 없음)
+        available: Optional[int] = None
+        if group.budget is not None:
+            DB_POOL_CONTROLLER_BUDGET.labels(group=group.name).set(group.budget)
+            if others is not None:
+                DB_POOL_CONTROLLER_RESERVED.labels(group=group.name).set(others + group.reserved())
+                available = group.budget - others - group.reserved()
+        if group.headroom is not None:
+            available = group.headroom if available is None else min(available, group.headroom)
+
+        windows = {pool.name: pool.pool.drain_checkout_window() for pool in group.controlled}
+        targets = {
+            pool.name: decide_capacity(
+                pool.capacity, pool.floor, pool.ceiling,
+                windows[pool.name].avg_wait_ms, windows[pool.name].timeouts, windows[pool.name].peak_checked_out,
+            )
+            for pool in group.controlled
+        }
+
+        # 축소 먼저 반영하여 확보한 여유를 확장에 사용
+        for pool in sorted(group.controlled, key=lambda p: targets[p.name] - p.capacity):
+            current = pool.capacity
+            target = targets[pool.name]
+            if available is not None:
+                if available < 0:
+                    # 예산 초과 (다른 워커가 먼저 확장) - 초과분만큼 하한까지 축소
+                    target = min(target, max(pool.floor, current + available))
+                elif target > current:
+                    target = current + min(target - current, available)
+                available -= target - current
+            self._apply(pool, target)
+            if self.trim_idle:
+                await self._trim_idle_connections(pool, keep=max(windows[pool.name].peak_checked_out, 1))
+
+        if available is not None and available < 0:
+            logger.warning(f"DB pool group '{group.name}' exceeds budget by {-available} at minimum pool sizes")
+
+    async def adjust(self) -> None:
+        for group in self.groups.values():
+            try:
+                await self.adjust_group(group)
+            except Exception as e:
+                logger.error(f"DB pool adjustment failed: group={group.name}, error={e}")
+
+    async def _control_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.sleep(self.interval)
+                await self.adjust()
+            except asyncio.CancelledError:
+                break
+
+    async def _release_reservations(self) -> None:
+        redis = redis_pool.async_client()
+        for group in self.groups.values():
+            await redis.hdel(f"{DB_POOL_BUDGET_KEY_PREFIX}:{group.name}", self.worker_id)
+
+    async def start(self) -> None:
+        """앱 시작 시 조절 태스크 실행 (DB_POOL_CONTROLLER_ENABLED=false 이면 실행하지 않음)
+
+        유효 크기는 하한(pool_size)에서 시작하여 대기가 생길 때 예산 안에서 확장한다.
+        """
+        if not DB_POOL_CONTROLLER_ENABLED or self._task is not None:
+            return
+        for group in self.groups.values():
+            for pool in group.controlled:
+                pool.set_capacity(pool.floor)
+        self._task = asyncio.create_task(self._control_loop())
+
+    async def stop(self) -> None:
+        """앱 종료 시 조절 태스크 중지 및 Redis 예약 해제"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        try:
+            await self._release_reservations()
+        except Exception as e:
+            logger.warning(f"Pool budget release failed: error={e}")
+        for group in self.groups.values():
+            if isinstance(group.probe_engine, AsyncEngine):
+                await group.probe_engine.dispose()
+            else:
+                group.probe_engine.dispose()
@@ -0,0 +1,179 @@
+"""SQLAlchemy 커넥션 풀 Prometheus 메트릭
+
+엔진(primary/replica, sync/async)별 커넥션 풀 상태를 prometheus_fastapi_instrumentator 가
+노출하는 기본 레지스트리(/metrics)에 등록합니다.
+
+- db_pool_size / db_pool_checked_out / db_pool_checked_in / db_pool_overflow : 스크레이프 시점 스냅샷
+- db_pool_checkout_wait_seconds : 풀에서 커넥션을 얻기까지 대기한 시간 (히스토그램)
+- db_pool_checkout_timeouts_total : pool_timeout 초과로 커넥션을 얻지 못한 횟수
+- db_pool_connections_created_total / db_pool_connections_invalidated_total : 물리 커넥션 생성/무효화 횟수
+
+사용 예시 (PromQL):
+    max_over_time(db_pool_checked_out{engine="async_primary"}[5m]) / (db_pool_size + db_pool_max_overflow)
+    histogram_quantile(0.99, rate(db_pool_checkout_wait_seconds_bucket[5m]))
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Union
+
+from prometheus_client import Counter, Histogram, REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+DB_POOL_CHECKOUT_WAIT = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a connection from the SQLAlchemy pool",
+    ["engine"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_POOL_CHECKOUT_TIMEOUTS = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["engine"],
+)
+DB_POOL_CONNECTIONS_CREATED = Counter(
+    "db_pool_connections_created_total",
+    "Physical DB connections opened by the SQLAlchemy pool",
+    ["engine"],
+)
+DB_POOL_CONNECTIONS_INVALIDATED = Counter(
+    "db_pool_connections_invalidated_total",
+    "DB connections invalidated by the SQLAlchemy pool",
+    ["engine", "soft"],
+)
+
+
+@dataclass
+class CheckoutWindowStats:
+    """일정 구간 동안의 체크아웃 통계 (풀 크기 조절 컨트롤러가 주기적으로 수거)"""
+    checkouts: int = 0
+    wait_total_s: float = 0.0
+    timeouts: int = 0
+    peak_checked_out: int = 0
+
+    @property
+    def avg_wait_ms(self) -> float:
+        return self.wait_total_s / self.checkouts * 1000 if self.checkouts else 0.0
+
+
+class _CheckoutTimingMixin:
+    """풀에서 커넥션을 꺼내는 데 걸린 시간(대기 + 신규 연결)을 측정
+
+    엔진 이름은 create_engine(pool_logging_name=...) 으로 전달되며 (Pool 의 logging_name 인자),
+    pool.recreate()(dispose) 도 같은 인자로 새 풀을 만들므로 유지된다.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.engine_name = kwargs.get("logging_name") or "default"
+        self._window = CheckoutWindowStats()
+        self._window_lock = threading.Lock()
+
+    def drain_checkout_window(self) -> CheckoutWindowStats:
+        """지난 수거 이후의 체크아웃 통계를 반환하고 초기화"""
+        with self._window_lock:
+            window, self._window = self._window, CheckoutWindowStats(peak_checked_out=self.checkedout())
+        return window
+
+    def _record_checkout(self, wait_s: float, timed_out: bool) -> None:
+        with self._window_lock:
+            window = self._window
+            window.checkouts += 1
+            window.wait_total_s += wait_s
+            window.timeouts += int(timed_out)
+            window.peak_checked_out = max(window.peak_checked_out, self.checkedout())
+
+    @property
+    def max_overflow(self) -> int:
+        """현재 max_overflow (풀 크기 조절 컨트롤러가 변경) - QueuePool 에 공개 접근자가 없어 여기서만 읽는다"""
+        return self._max_overflow
+
+    def _do_get(self):
+        started = time.perf_counter()
+        engine_name = self.engine_name
+        timed_out = False
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            timed_out = True
+            DB_POOL_CHECKOUT_TIMEOUTS.labels(engine=engine_name).inc()
+            raise
+        finally:
+            wait_s = time.perf_counter() - started
+            DB_POOL_CHECKOUT_WAIT.labels(engine=engine_name).observe(wait_s)
+            self._record_checkout(wait_s, timed_out)
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """동기 엔진용 QueuePool"""
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """비동기 엔진용 AsyncAdaptedQueuePool"""
+
+
+class PoolStatsCollector:
+    """스크레이프 시점에 각 엔진 풀의 상태를 읽어 게이지로 반환"""
+
+    def __init__(self):
+        self._engines: Dict[str, Engine] = {}
+
+    def add(self, name: str, sync_engine: Engine) -> None:
+        self._engines[name] = sync_engine
+
+    def collect(self):
+        size = GaugeMetricFamily("db_pool_size", "Configured pool_size", labels=["engine"])
+        max_overflow = GaugeMetricFamily("db_pool_max_overflow", "Current max_overflow (adjusted by the pool controller)", labels=["engine"])
+        checked_out = GaugeMetricFamily("db_pool_checked_out", "Connections currently checked out", labels=["engine"])
+        checked_in = GaugeMetricFamily("db_pool_checked_in", "Idle connections in the pool", labels=["engine"])
+        overflow = GaugeMetricFamily("db_pool_overflow", "Overflow connections in use", labels=["engine"])
+
+        for name, sync_engine in self._engines.items():
+            pool = sync_engine.pool
+            if not isinstance(pool, QueuePool):
+                continue
+            size.add_metric([name], pool.size())
+            if isinstance(pool, _CheckoutTimingMixin):
+                max_overflow.add_metric([name], pool.max_overflow)
+            checked_out.add_metric([name], pool.checkedout())
+            checked_in.add_metric([name], pool.checkedin())
+            overflow.add_metric([name], max(pool.overflow(), 0))
+
+        yield size
+        yield max_overflow
+        yield checked_out
+        yield checked_in
+        yield overflow
+
+
+pool_stats_collector = PoolStatsCollector()
+REGISTRY.register(pool_stats_collector)
+
+
+def register_pool_metrics(name: str, engine: Union[Engine, AsyncEngine]) -> None:
+    """엔진의 풀 이벤트 리스너를 등록하고 스냅샷 수집 대상에 추가
+
+    Args:
+        name: 메트릭 engine 라벨 (예: async_primary, sync_replica)
+        engine: 동기 또는 비동기 엔진
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+    pool_stats_collector.add(name, sync_engine)
+
+    @event.listens_for(sync_engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        DB_POOL_CONNECTIONS_CREATED.labels(engine=name).inc()
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        DB_POOL_CONNECTIONS_INVALIDATED.labels(engine=name, soft="false").inc()
+
+    @event.listens_for(sync_engine, "soft_invalidate")
+    def _on_soft_invalidate(dbapi_connection, connection_record, exception):
+        DB_POOL_CONNECTIONS_INVALIDATED.labels(engine=name, soft="true").inc()
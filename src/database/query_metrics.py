@@ -0,0 +1,282 @@
+"""SQL 문장별 실행 시간 측정, 라우트별 집계, 슬로우 쿼리 로그
+
+SQLAlchemy before/after_cursor_execute 이벤트로 각 문장의 실행 시간과 row 수를 기록하고,
+리터럴/바인드 파라미터를 제거한 fingerprint 로 정규화하여 라우트별로 집계합니다.
+
+- 요청 단위 수집: QueryMetricsMiddleware 가 요청 컨텍스트(ContextVar)에 문장 목록을 모으고,
+  응답 후 라우트 템플릿(/api/question/list 등) 기준으로 집계
+- Prometheus (/metrics):
+    db_statement_duration_seconds{route}   문장 1회 실행 시간
+    db_statements_per_request{route}       요청당 실행 문장 수
+    db_request_db_time_seconds{route}      요청당 DB 시간 합계
+- 프로세스 내 집계: query_stats.snapshot() → 라우트/fingerprint 별 p50/p95/p99, 요청당 호출 수
+- 슬로우 쿼리: DB_SLOW_QUERY_MS 초과 시 파라미터 값을 타입으로 가린(redact) 로그 기록
+
+요청 밖(스케줄러, 알림 폴러, 워밍업)에서 실행된 문장은 route="background" 로 집계됩니다.
+"""
+
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from prometheus_client import Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+slow_query_logger = logging.getLogger("slow_query")
+
+DB_SLOW_QUERY_MS = float(os.getenv("DB_SLOW_QUERY_MS", 200))
+DB_QUERY_STATS_SAMPLES = int(os.getenv("DB_QUERY_STATS_SAMPLES", 1000))  # 키별 보관 샘플 수 (백분위 계산용)
+DB_QUERY_STATS_MAX_KEYS = int(os.getenv("DB_QUERY_STATS_MAX_KEYS", 500))  # 집계 키(route, fingerprint) 상한
+
+BACKGROUND_ROUTE = "background"
+UNMATCHED_ROUTE = "unmatched"
+
+DB_STATEMENT_DURATION = Histogram(
+    "db_statement_duration_seconds",
+    "Duration of a single SQL statement",
+    ["route"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+DB_STATEMENTS_PER_REQUEST = Histogram(
+    "db_statements_per_request",
+    "SQL statements executed per HTTP request",
+    ["route"],
+    buckets=(0, 1, 2, 3, 4, 5, 6, 8, 10, 15, 20, 50, 100),
+)
+DB_REQUEST_DB_TIME = Histogram(
+    "db_request_db_time_seconds",
+    "Total SQL time spent per HTTP request",
+    ["route"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+
+# ── fingerprint ─────────────────────────────────────────────────────────────
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"\$\d+|%\(\w+\)s|%s")
+_IN_LIST = re.compile(r"\bIN\s*\((?:\s*\?\s*,?)+\)", re.IGNORECASE)
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(statement: str) -> str:
+    """리터럴과 바인드 파라미터를 ? 로 치환하고 공백을 정리한 정규화 SQL"""
+    normalized = _STRING_LITERAL.sub("?", statement)
+    normalized = _PLACEHOLDER.sub("?", normalized)
+    normalized = _NUMBER_LITERAL.sub("?", normalized)
+    normalized = _IN_LIST.sub("IN (...)", normalized)
+    return _WHITESPACE.sub(" ", normalized).strip()
+
+
+def fingerprint_id(normalized: str) -> str:
+    return hashlib.sha1(normalized.encode()).hexdigest()[:12]
+
+
+def redact_parameters(parameters: Any) -> Any:
+    """파라미터 값을 타입 이름으로 치환 (로그에 개인정보/토큰이 남지 않도록)"""
+    if isinstance(parameters, dict):
+        return {key: f"<{type(value).__name__}>" for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        if parameters and isinstance(parameters[0], (dict, list, tuple)):
+            return [redact_parameters(parameters[0]), f"... x{len(parameters)}"]
+        return [f"<{type(value).__name__}>" for value in parameters]
+    return f"<{type(parameters).__name__}>"
+
+
+# ── 요청 컨텍스트 ───────────────────────────────────────────────────────────
+
+@dataclass
+class StatementSample:
+    fingerprint: str
+    duration_s: float
+    rows: int
+
+
+@dataclass
+class RequestQueryStats:
+    """요청 1건에서 실행된 문장 목록"""
+    scope: Optional[dict] = None
+    statements: List[StatementSample] = field(default_factory=list)
+
+    @property
+    def route(self) -> str:
+        if self.scope is None:
+            return BACKGROUND_ROUTE
+        route = self.scope.get("route")
+        return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+_request_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+# ── 프로세스 내 집계 ────────────────────────────────────────────────────────
+
+def _percentile(ordered: List[float], pct: float) -> float:
+    if not ordered:
+        return 0.0
+    index = min(int(len(ordered) * pct / 100), len(ordered) - 1)
+    return ordered[index]
+
+
+@dataclass
+class _StatementAggregate:
+    fingerprint: str
+    calls: int = 0
+    rows: int = 0
+    total_s: float = 0.0
+    durations: Deque[float] = field(default_factory=lambda: deque(maxlen=DB_QUERY_STATS_SAMPLES))
+
+
+@dataclass
+class _RouteAggregate:
+    requests: int = 0
+    statements_per_request: Deque[int] = field(default_factory=lambda: deque(maxlen=DB_QUERY_STATS_SAMPLES))
+    db_time_per_request: Deque[float] = field(default_factory=lambda: deque(maxlen=DB_QUERY_STATS_SAMPLES))
+
+
+class QueryStatsAggregator:
+    """라우트/fingerprint 별 실행 시간 분포와 요청당 호출 수 집계"""
+
+    def __init__(self, max_keys: int = DB_QUERY_STATS_MAX_KEYS):
+        self.max_keys = max_keys
+        self._statements: Dict[Tuple[str, str], _StatementAggregate] = {}
+        self._routes: Dict[str, _RouteAggregate] = {}
+        self._lock = threading.Lock()
+
+    def record_statement(self, route: str, sample: StatementSample) -> None:
+        key = (route, sample.fingerprint)
+        with self._lock:
+            aggregate = self._statements.get(key)
+            if aggregate is None:
+                if len(self._statements) >= self.max_keys:
+                    return
+                aggregate = self._statements[key] = _StatementAggregate(fingerprint=sample.fingerprint)
+            aggregate.calls += 1
+            aggregate.rows += max(sample.rows, 0)
+            aggregate.total_s += sample.duration_s
+            aggregate.durations.append(sample.duration_s)
+
+    def record_request(self, route: str, statements: List[StatementSample]) -> None:
+        with self._lock:
+            aggregate = self._routes.setdefault(route, _RouteAggregate())
+            aggregate.requests += 1
+            aggregate.statements_per_request.append(len(statements))
+            aggregate.db_time_per_request.append(sum(s.duration_s for s in statements))
+        for sample in statements:
+            self.record_statement(route, sample)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._statements.clear()
+            self._routes.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """라우트별 요청당 호출 수/DB 시간과 fingerprint 별 p50/p95/p99 (ms)"""
+        with self._lock:
+            routes = {name: (r.requests, sorted(r.statements_per_request), sorted(r.db_time_per_request))
+                      for name, r in self._routes.items()}
+            statements = [(route, s.fingerprint, s.calls, s.rows, s.total_s, sorted(s.durations))
+                          for (route, _), s in self._statements.items()]
+
+        def _route_entry(requests: int = 0, per_request: List[int] = (), db_times: List[float] = ()) -> dict:
+            return {
+                "requests": requests,
+                "statements_per_request_avg": round(sum(per_request) / len(per_request), 2) if per_request else 0.0,
+                "statements_per_request_max": per_request[-1] if per_request else 0,
+                "db_time_ms_p50": round(_percentile(db_times, 50) * 1000, 3),
+                "db_time_ms_p95": round(_percentile(db_times, 95) * 1000, 3),
+                "db_time_ms_p99": round(_percentile(db_times, 99) * 1000, 3),
+                "statements": [],
+            }
+
+        result: Dict[str, dict] = {name: _route_entry(*values) for name, values in routes.items()}
+        for route, normalized, calls, rows, total_s, durations in statements:
+            entry = result.setdefault(route, _route_entry())
+            entry["statements"].append({
+                "fingerprint_id": fingerprint_id(normalized),
+                "fingerprint": normalized,
+                "calls": calls,
+                "rows": rows,
+                "total_ms": round(total_s * 1000, 3),
+                "p50_ms": round(_percentile(durations, 50) * 1000, 3),
+                "p95_ms": round(_percentile(durations, 95) * 1000, 3),
+                "p99_ms": round(_percentile(durations, 99) * 1000, 3),
+            })
+        for entry in result.values():
+            entry["statements"].sort(key=lambda s: s["total_ms"], reverse=True)
+        return result
+
+
+query_stats = QueryStatsAggregator()
+
+
+# ── 이벤트 리스너 ───────────────────────────────────────────────────────────
+
+def _record(statement: str, parameters, duration_s: float, rows: int) -> None:
+    normalized = fingerprint(statement)
+    sample = StatementSample(fingerprint=normalized, duration_s=duration_s, rows=rows)
+    state = _request_query_stats.get()
+    route = state.route if state else BACKGROUND_ROUTE
+
+    if state is not None:
+        state.statements.append(sample)
+    else:
+        DB_STATEMENT_DURATION.labels(route=route).observe(duration_s)
+        query_stats.record_statement(route, sample)
+
+    if duration_s * 1000 >= DB_SLOW_QUERY_MS:
+        slow_query_logger.warning(
+            f"Slow query {duration_s * 1000:.1f}ms route={route} rows={rows} "
+            f"fingerprint={fingerprint_id(normalized)} sql={normalized} params={redact_parameters(parameters)}"
+        )
+
+
+def register_query_metrics(sync_engine: Engine) -> None:
+    """엔진에 문장 실행 시간 측정 리스너 등록 (비동기 엔진은 .sync_engine 전달)"""
+
+    @event.listens_for(sync_engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if context is not None:
+            context._query_metrics_started = time.perf_counter()
+
+    @event.listens_for(sync_engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_query_metrics_started", None)
+        if started is None:
+            return
+        rows = getattr(cursor, "rowcount", -1)
+        _record(statement, parameters, time.perf_counter() - started, rows if isinstance(rows, int) else -1)
+
+
+class QueryMetricsMiddleware:
+    """요청 단위로 실행된 SQL 문장을 모아 라우트별로 집계하는 ASGI 미들웨어"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        state = RequestQueryStats(scope=scope)
+        token = _request_query_stats.set(state)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_query_stats.reset(token)
+            if state.statements:
+                route = state.route
+                for sample in state.statements:
+                    DB_STATEMENT_DURATION.labels(route=route).observe(sample.duration_s)
+                DB_STATEMENTS_PER_REQUEST.labels(route=route).observe(len(state.statements))
+                DB_REQUEST_DB_TIME.labels(route=route).observe(sum(s.duration_s for s in state.statements))
+                query_stats.record_request(route, state.statements)
@@ -0,0 +1,280 @@
+"""읽기 엔진 라우터
+
+Primary/Replica 엔진 중 읽기 요청을 보낼 엔진을 가중치 기반으로 선택합니다.
+엔진별로 다음 지표를 추적합니다.
+
+- 쿼리 지연 시간 (before/after_cursor_execute 이벤트, EWMA)
+- 커넥션 풀 대기 시간 (세션에서 커넥션을 얻기까지 걸린 시간, EWMA)
+- 복제 지연 (pg_last_xact_replay_timestamp 기반 주기적 측정, 수신한 WAL 을 모두 재생했으면 0)
+
+느리거나 지연이 큰 엔진은 가중치가 낮아지고, 연속 에러 또는 최대 복제 지연 초과 시
+일정 시간(cool-down) 동안 선택 대상에서 제외(eject)됩니다.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Union
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from src.database.consistency import parse_lsn
+
+logger = logging.getLogger(__name__)
+
+READ_ROUTER_EWMA_ALPHA = float(os.getenv("READ_ROUTER_EWMA_ALPHA", 0.2))
+READ_ROUTER_MAX_LAG_SECONDS = float(os.getenv("READ_ROUTER_MAX_LAG_SECONDS", 5.0))
+READ_ROUTER_COOLDOWN_SECONDS = float(os.getenv("READ_ROUTER_COOLDOWN_SECONDS", 30.0))
+READ_ROUTER_ERROR_THRESHOLD = int(os.getenv("READ_ROUTER_ERROR_THRESHOLD", 3))
+READ_ROUTER_LAG_PROBE_INTERVAL = float(os.getenv("READ_ROUTER_LAG_PROBE_INTERVAL", 5.0))
+
+# Replica 상태: 마지막 트랜잭션 재생 이후 경과 시간과 수신/재생 LSN (Primary 에서는 in_recovery=false, LSN NULL)
+REPLICATION_LAG_QUERY = text("""
+    SELECT pg_is_in_recovery() AS in_recovery,
+           EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) AS replay_age,
+           pg_last_wal_receive_lsn()::text AS receive_lsn,
+           pg_last_wal_replay_lsn()::text AS replay_lsn
+""")
+
+
+def replication_lag_seconds(row) -> float:
+    """REPLICATION_LAG_QUERY 결과로 복제 지연(초) 계산
+
+    마지막 재생 이후 경과 시간은 Primary 에 쓰기가 없으면 계속 늘어나므로, 수신한 WAL 을 모두
+    재생했으면(receive LSN <= replay LSN) 따라잡은 것으로 보고 0 을 반환한다.
+    """
+    if not row.in_recovery:
+        return 0.0
+    receive_lsn, replay_lsn = parse_lsn(row.receive_lsn), parse_lsn(row.replay_lsn)
+    if receive_lsn is not None and replay_lsn is not None and receive_lsn <= replay_lsn:
+        return 0.0
+    return float(row.replay_age or 0)
+
+
+AnyEngine = Union[Engine, AsyncEngine]
+
+
+@dataclass
+class EngineStats:
+    """엔진별 라우팅 지표"""
+    name: str
+    latency_ms: float = 0.0
+    pool_wait_ms: float = 0.0
+    replication_lag_s: float = 0.0
+    consecutive_errors: int = 0
+    ejected_until: float = 0.0
+    samples: int = 0
+    replay_lsn: int = 0
+
+    def is_ejected(self, now: float) -> bool:
+        return self.ejected_until > now
+
+
+class ReadEngineRouter:
+    """지연 시간/복제 지연 기반 읽기 엔진 선택기
+
+    - 첫 번째 엔진은 Primary 로 간주하며, 모든 엔진이 제외된 경우의 fallback 입니다.
+    - 가중치 = 1 / (쿼리 지연 + 풀 대기 + 1ms) × 복제 지연 페널티
+    """
+
+    def __init__(
+        self,
+        engines: Dict[str, AnyEngine],
+        alpha: float = READ_ROUTER_EWMA_ALPHA,
+        max_lag_seconds: float = READ_ROUTER_MAX_LAG_SECONDS,
+        cooldown_seconds: float = READ_ROUTER_COOLDOWN_SECONDS,
+        error_threshold: int = READ_ROUTER_ERROR_THRESHOLD,
+        probe_interval: float = READ_ROUTER_LAG_PROBE_INTERVAL,
+    ):
+        """
+        Args:
+            engines: 이름 -> 엔진 (첫 번째 항목이 Primary)
+            alpha: EWMA 가중치 (0~1, 클수록 최근 값 반영 비율이 높음)
+            max_lag_seconds: 이 값을 넘는 복제 지연은 엔진 제외
+            cooldown_seconds: 제외 유지 시간 (초)
+            error_threshold: 연속 에러 허용 횟수
+            probe_interval: 복제 지연 측정 간격 (초)
+        """
+        self.engines = engines
+        self.primary_name = next(iter(engines))
+        self.alpha = alpha
+        self.max_lag_seconds = max_lag_seconds
+        self.cooldown_seconds = cooldown_seconds
+        self.error_threshold = error_threshold
+        self.probe_interval = probe_interval
+        self.stats: Dict[str, EngineStats] = {name: EngineStats(name=name) for name in engines}
+        self._names_by_engine: Dict[int, str] = {}
+        self._task: Optional[asyncio.Task] = None
+
+        for name, engine in engines.items():
+            sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+            self._names_by_engine[id(engine)] = name
+            self._names_by_engine[id(sync_engine)] = name
+            self._register_listeners(name, sync_engine)
+
+    # ── 이벤트 리스너 ───────────────────────────────────────────────────────
+
+    def _register_listeners(self, name: str, sync_engine: Engine) -> None:
+        @event.listens_for(sync_engine, "before_cursor_execute")
+        def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            conn.info.setdefault("read_router_start", []).append(time.perf_counter())
+
+        @event.listens_for(sync_engine, "after_cursor_execute")
+        def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+            starts = conn.info.get("read_router_start")
+            if starts:
+                self.record_latency(name, (time.perf_counter() - starts.pop()) * 1000)
+
+        @event.listens_for(sync_engine, "handle_error")
+        def _handle_error(exception_context):
+            conn = exception_context.connection
+            if conn is not None and conn.info.get("read_router_start"):
+                conn.info["read_router_start"].pop()
+            self.record_error(name)
+
+    # ── 지표 기록 ───────────────────────────────────────────────────────────
+
+    def name_of(self, engine: AnyEngine) -> str:
+        return self._names_by_engine.get(id(engine), self.primary_name)
+
+    def _ewma(self, current: float, value: float, samples: int) -> float:
+        if samples == 0:
+            return value
+        return self.alpha * value + (1 - self.alpha) * current
+
+    def record_latency(self, name: str, latency_ms: float) -> None:
+        stats = self.stats[name]
+        stats.latency_ms = self._ewma(stats.latency_ms, latency_ms, stats.samples)
+        stats.samples += 1
+        stats.consecutive_errors = 0
+
+    def record_pool_wait(self, name: str, wait_ms: float) -> None:
+        stats = self.stats[name]
+        stats.pool_wait_ms = self._ewma(stats.pool_wait_ms, wait_ms, stats.samples)
+
+    def record_error(self, name: str) -> None:
+        stats = self.stats[name]
+        stats.consecutive_errors += 1
+        if stats.consecutive_errors >= self.error_threshold:
+            self.eject(name, reason=f"{stats.consecutive_errors} consecutive errors")
+
+    def record_replication_lag(self, name: str, lag_seconds: float) -> None:
+        self.stats[name].replication_lag_s = lag_seconds
+        if lag_seconds > self.max_lag_seconds:
+            self.eject(name, reason=f"replication lag {lag_seconds:.2f}s")
+
+    def record_replay_lsn(self, name: str, lsn: Optional[int]) -> None:
+        """Replica 가 재생을 마친 WAL LSN 기록 (단조 증가)"""
+        if lsn is not None:
+            stats = self.stats[name]
+            stats.replay_lsn = max(stats.replay_lsn, lsn)
+
+    def has_replayed(self, name: str, lsn: int) -> bool:
+        """마지막으로 확인된 replay LSN 이 요구 LSN 이상인지 여부 (캐시 기준)"""
+        return self.stats[name].replay_lsn >= lsn
+
+    def eject(self, name: str, reason: str) -> None:
+        """엔진을 cool-down 기간 동안 선택 대상에서 제외 (Primary 는 제외하지 않음)"""
+        if name == self.primary_name:
+            return
+        stats = self.stats[name]
+        if not stats.is_ejected(time.monotonic()):
+            logger.warning(f"Read engine '{name}' ejected for {self.cooldown_seconds}s: {reason}")
+        stats.ejected_until = time.monotonic() + self.cooldown_seconds
+        stats.consecutive_errors = 0
+
+    # ── 엔진 선택 ───────────────────────────────────────────────────────────
+
+    def get_weights(self) -> Dict[str, float]:
+        """현재 엔진별 선택 가중치 (합계 1.0, 제외된 엔진은 0)"""
+        now = time.monotonic()
+        raw: Dict[str, float] = {}
+        for name, stats in self.stats.items():
+            if stats.is_ejected(now):
+                raw[name] = 0.0
+                continue
+            cost_ms = stats.latency_ms + stats.pool_wait_ms + 1.0
+            lag_penalty = 1.0 / (1.0 + stats.replication_lag_s)
+            raw[name] = lag_penalty / cost_ms
+
+        total = sum(raw.values())
+        if total <= 0:
+            return {name: (1.0 if name == self.primary_name else 0.0) for name in raw}
+        return {name: weight / total for name, weight in raw.items()}
+
+    def choose_name(self) -> str:
+        weights = self.get_weights()
+        names: List[str] = list(weights)
+        return random.choices(names, weights=[weights[n] for n in names], k=1)[0]
+
+    def choose(self) -> AnyEngine:
+        return self.engines[self.choose_name()]
+
+    def snapshot(self) -> Dict[str, dict]:
+        """엔진별 지표와 가중치 (모니터링용)"""
+        now = time.monotonic()
+        weights = self.get_weights()
+        return {
+            name: {
+                "weight": round(weights[name], 4),
+                "latency_ms": round(stats.latency_ms, 3),
+                "pool_wait_ms": round(stats.pool_wait_ms, 3),
+                "replication_lag_s": round(stats.replication_lag_s, 3),
+                "ejected": stats.is_ejected(now),
+                "ejected_remaining_s": round(max(stats.ejected_until - now, 0.0), 1),
+            }
+            for name, stats in self.stats.items()
+        }
+
+    # ── 복제 지연 측정 ──────────────────────────────────────────────────────
+
+    async def _probe_lag(self, engine: AnyEngine):
+        if isinstance(engine, AsyncEngine):
+            async with engine.connect() as conn:
+                return (await conn.execute(REPLICATION_LAG_QUERY)).one()
+
+        def _probe_sync():
+            with engine.connect() as conn:
+                return conn.execute(REPLICATION_LAG_QUERY).one()
+
+        return await asyncio.to_thread(_probe_sync)
+
+    async def probe_replication_lag(self) -> None:
+        for name, engine in self.engines.items():
+            if name == self.primary_name:
+                continue
+            try:
+                row = await asyncio.wait_for(self._probe_lag(engine), timeout=self.probe_interval)
+                self.record_replication_lag(name, replication_lag_seconds(row))
+                self.record_replay_lsn(name, parse_lsn(row.replay_lsn))
+            except Exception as e:
+                logger.error(f"Replication lag probe failed: engine={name}, error={e}")
+                self.record_error(name)
+
+    async def _probe_loop(self) -> None:
+        while True:
+            try:
+                await self.probe_replication_lag()
+                await asyncio.sleep(self.probe_interval)
+            except asyncio.CancelledError:
+                break
+
+    async def start(self) -> None:
+        """앱 시작 시 복제 지연 측정 태스크 실행"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._probe_loop())
+
+    async def stop(self) -> None:
+        """앱 종료 시 측정 태스크 중지"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,133 @@
+"""프로세스 공용 Redis 커넥션 풀
+
+요청마다 클라이언트를 새로 만들고 PING 을 보내면 Redis 왕복이 두 배가 되고 소켓이 계속 생성/해제된다.
+프로세스당 비동기/동기 커넥션 풀을 하나씩 두고, 클라이언트는 풀을 공유하는 가벼운 객체로만 생성한다.
+
+- 풀은 FastAPI lifespan 에서 생성(init)하고 종료 시 정리(close)한다.
+  lifespan 밖(스크립트, 스케줄러 등)에서 먼저 사용되면 최초 접근 시 생성된다.
+- 풀이 가득 차면 REDIS_POOL_TIMEOUT 초 동안 반환을 기다린다 (BlockingConnectionPool).
+- 연결 상태 확인은 매 요청 PING 대신 health_check_interval 동안 유휴였던 커넥션에만 수행된다.
+
+메트릭 (/metrics):
+    redis_pool_max_connections / redis_pool_connections_created
+    redis_pool_connections_in_use / redis_pool_connections_idle
+"""
+
+import os
+from typing import Optional
+
+import aioredis
+import redis
+from prometheus_client import REGISTRY
+from prometheus_client.core import GaugeMetricFamily
+
+REDIS_HOST = os.getenv('REDIS_HOST', 'localhost')
+REDIS_PORT = int(os.getenv('REDIS_PORT', 6379))
+REDIS_PASSWORD = os.getenv('REDIS_PASSWORD', '')
+REDIS_DATABASE = int(os.getenv('REDIS_DATABASE', 0))
+REDIS_MAX_CONNECTIONS = int(os.getenv('REDIS_MAX_CONNECTIONS', 50))
+REDIS_POOL_TIMEOUT = float(os.getenv('REDIS_POOL_TIMEOUT', 5.0))
+REDIS_HEALTH_CHECK_INTERVAL = int(os.getenv('REDIS_HEALTH_CHECK_INTERVAL', 30))
+REDIS_SOCKET_TIMEOUT = float(os.getenv('REDIS_SOCKET_TIMEOUT', 5.0))
+
+
+def _pool_kwargs() -> dict:
+    return dict(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        password=REDIS_PASSWORD or None,
+        db=REDIS_DATABASE,
+        decode_responses=True,
+        max_connections=REDIS_MAX_CONNECTIONS,
+        timeout=REDIS_POOL_TIMEOUT,
+        health_check_interval=REDIS_HEALTH_CHECK_INTERVAL,
+        socket_timeout=REDIS_SOCKET_TIMEOUT,
+        socket_connect_timeout=REDIS_SOCKET_TIMEOUT,
+    )
+
+
+class RedisPoolManager:
+    """비동기/동기 Redis 커넥션 풀 보관 및 클라이언트 생성"""
+
+    def __init__(self):
+        self._async_pool: Optional[aioredis.BlockingConnectionPool] = None
+        self._sync_pool: Optional[redis.BlockingConnectionPool] = None
+
+    @property
+    def async_pool(self) -> aioredis.BlockingConnectionPool:
+        if self._async_pool is None:
+            self._async_pool = aioredis.BlockingConnectionPool(**_pool_kwargs())
+        return self._async_pool
+
+    @property
+    def sync_pool(self) -> redis.BlockingConnectionPool:
+        if self._sync_pool is None:
+            self._sync_pool = redis.BlockingConnectionPool(**_pool_kwargs())
+        return self._sync_pool
+
+    def init(self) -> None:
+        """앱 시작 시 풀 생성 (연결은 실제 명령 실행 시점에 맺는다)"""
+        _ = self.async_pool
+        _ = self.sync_pool
+
+    async def close(self) -> None:
+        """앱 종료 시 풀의 모든 커넥션 해제"""
+        if self._async_pool is not None:
+            await self._async_pool.disconnect()
+            self._async_pool = None
+        if self._sync_pool is not None:
+            self._sync_pool.disconnect()
+            self._sync_pool = None
+
+    def async_client(self) -> aioredis.Redis:
+        return aioredis.Redis(connection_pool=self.async_pool)
+
+    def sync_client(self) -> redis.Redis:
+        return redis.Redis(connection_pool=self.sync_pool)
+
+
+def _idle_connections(pool) -> int:
+    """BlockingConnectionPool 큐에 반환되어 있는 커넥션 수 (None 은 아직 생성되지 않은 자리)"""
+    queue = pool.pool
+    items = queue._queue if hasattr(queue, "_queue") else queue.queue
+    return sum(1 for connection in items if connection is not None)
+
+
+class RedisPoolStatsCollector:
+    """스크레이프 시점에 Redis 커넥션 풀 사용량을 게이지로 반환"""
+
+    def __init__(self, manager: RedisPoolManager):
+        self.manager = manager
+
+    def collect(self):
+        max_connections = GaugeMetricFamily(
+            "redis_pool_max_connections", "Configured max_connections", labels=["client"]
+        )
+        created = GaugeMetricFamily(
+            "redis_pool_connections_created", "Connections opened by the pool", labels=["client"]
+        )
+        in_use = GaugeMetricFamily(
+            "redis_pool_connections_in_use", "Connections currently checked out", labels=["client"]
+        )
+        idle = GaugeMetricFamily(
+            "redis_pool_connections_idle", "Idle connections in the pool", labels=["client"]
+        )
+
+        for name, pool in (("async", self.manager._async_pool), ("sync", self.manager._sync_pool)):
+            if pool is None:
+                continue
+            total = len(pool._connections)
+            idle_count = _idle_connections(pool)
+            max_connections.add_metric([name], pool.max_connections)
+            created.add_metric([name], total)
+            in_use.add_metric([name], max(total - idle_count, 0))
+            idle.add_metric([name], idle_count)
+
+        yield max_connections
+        yield created
+        yield in_use
+        yield idle
+
+
+redis_pool = RedisPoolManager()
+REGISTRY.register(RedisPoolStatsCollector(redis_pool))
@@ -0,0 +1,207 @@
+"""목록 API 전체 건수(total) 계산 전략
+
+목록 API 마다 필터 조건으로 정확한 COUNT(*) 를 실행하면, 대용량 테이블에서는 페이지 조회보다
+COUNT 가 더 비싸다. 대상(target)별로 다음 전략 중 하나를 선택한다.
+
+    exact     : 매 요청 COUNT(*) (기본)
+    cached    : 필터별 결과를 TTL 동안 프로세스 내에 캐시 (같은 키 동시 요청은 1회만 실행)
+    estimated : EXPLAIN 의 planner 예상 행 수 사용
+                예상치가 DB_COUNT_ESTIMATE_MIN_ROWS 미만이면 정확한 COUNT 가 싸므로 exact 로 계산
+
+설정 (환경 변수):
+    DB_COUNT_STRATEGY               기본 전략
+    DB_COUNT_STRATEGY_<TARGET>      대상별 전략 (예: DB_COUNT_STRATEGY_QUESTION_LIST=cached)
+    DB_COUNT_CACHE_TTL              cached 전략 유지 시간 (초)
+    DB_COUNT_CACHE_MAX_KEYS         cached 전략 최대 키 수 (초과 시 오래된 키부터 제거)
+    DB_COUNT_ESTIMATE_MIN_ROWS      estimated 전략에서 추정치를 그대로 쓰는 최소 행 수
+
+응답에는 어떤 전략으로 계산한 값인지(count_strategy)를 함께 반환하여, 클라이언트가
+추정/캐시 값을 정확한 값으로 오인하지 않게 한다.
+"""
+
+import asyncio
+import json
+import os
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Hashable, NamedTuple, Optional, Tuple
+
+from prometheus_client import Counter
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql import Select
+from sqlalchemy.sql.base import Executable
+from sqlalchemy.sql.elements import ClauseElement, TextClause
+
+COUNT_EXACT = "exact"
+COUNT_CACHED = "cached"
+COUNT_ESTIMATED = "estimated"
+COUNT_STRATEGIES = (COUNT_EXACT, COUNT_CACHED, COUNT_ESTIMATED)
+
+DB_COUNT_STRATEGY = os.getenv("DB_COUNT_STRATEGY", COUNT_EXACT)
+DB_COUNT_CACHE_TTL = float(os.getenv("DB_COUNT_CACHE_TTL", 30.0))
+DB_COUNT_CACHE_MAX_KEYS = int(os.getenv("DB_COUNT_CACHE_MAX_KEYS", 10000))
+DB_COUNT_ESTIMATE_MIN_ROWS = int(os.getenv("DB_COUNT_ESTIMATE_MIN_ROWS", 10000))
+
+# 대상별 기본 전략 (환경 변수로 덮어쓰기) - performance_test_data 는 COUNT 가 페이지 조회보다 비싸므로 추정
+DEFAULT_TARGET_STRATEGIES: Dict[str, str] = {
+    "performance_data": COUNT_ESTIMATED,
+}
+
+DB_COUNT_REQUESTS = Counter(
+    "db_count_requests_total",
+    "List total counts by target and the strategy that produced the value",
+    ["target", "strategy"],
+)
+
+
+class CountResult(NamedTuple):
+    """전체 건수와 그 값을 만든 전략"""
+    total: int
+    strategy: str
+
+
+def resolve_count_strategy(target: str) -> str:
+    strategy = os.getenv(
+        f"DB_COUNT_STRATEGY_{target.upper()}", DEFAULT_TARGET_STRATEGIES.get(target, DB_COUNT_STRATEGY)
+    ).lower()
+    if strategy not in COUNT_STRATEGIES:
+        raise ValueError(f"Invalid count strategy for {target}: {strategy}")
+    return strategy
+
+
+# ── cached ──────────────────────────────────────────────────────────────────
+
+class CountCache:
+    """(target, 필터) 별 건수 TTL 캐시 (프로세스 단위, 워커 간 공유하지 않음)"""
+
+    def __init__(self, ttl: float = DB_COUNT_CACHE_TTL, max_keys: int = DB_COUNT_CACHE_MAX_KEYS):
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            return entry[1]
+
+        pending = self._pending.get(key)
+        if pending is not None:
+            try:
+                return await asyncio.shield(pending)
+            except Exception:
+                pass  # 먼저 계산하던 요청이 실패하면 직접 계산
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await compute()
+        except BaseException as e:
+            # 취소된 경우 대기자까지 취소되지 않도록 일반 예외로 전달 (대기자는 직접 계산)
+            future.set_exception(e if isinstance(e, Exception) else RuntimeError("count computation cancelled"))
+            future.exception()  # 대기자가 없을 때 "exception was never retrieved" 경고 방지
+            raise
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+        future.set_result(value)
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def invalidate_target(self, target: str) -> None:
+        """대상의 모든 필터 키 제거 (쓰기 후 호출 - 다른 워커는 TTL 까지 이전 값 유지)"""
+        for key in [key for key in self._entries if isinstance(key, tuple) and key[:1] == (target,)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+count_cache = CountCache()
+
+
+# ── estimated ───────────────────────────────────────────────────────────────
+
+class _Explain(Executable, ClauseElement):
+    """EXPLAIN (FORMAT JSON) <statement> - 바인드 파라미터를 그대로 유지"""
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(_Explain)
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+async def estimate_rows(db: AsyncSession, statement, params: Optional[dict] = None) -> int:
+    """planner 가 예상한 결과 행 수 (통계 기반, 테이블을 읽지 않음)"""
+    plan = (await db.execute(_Explain(statement), params or {})).scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+# ── exact ───────────────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=256)
+def _count_text(statement: TextClause) -> TextClause:
+    return text(f"SELECT count(*) FROM ({statement.text}) AS counted_rows")
+
+
+def count_statement(statement):
+    """행 조회 문장을 감싼 COUNT(*) 문장"""
+    if isinstance(statement, Select):
+        return select(func.count()).select_from(statement.order_by(None).subquery())
+    if isinstance(statement, TextClause):
+        return _count_text(statement)
+    raise TypeError(f"Unsupported statement for counting: {type(statement).__name__}")
+
+
+async def exact_count(db: AsyncSession, statement, params: Optional[dict] = None) -> int:
+    return (await db.execute(count_statement(statement), params or {})).scalar_one()
+
+
+# ── 진입점 ──────────────────────────────────────────────────────────────────
+
+async def count_rows(
+    db: AsyncSession,
+    target: str,
+    statement,
+    cache_key: Tuple = (),
+    params: Optional[dict] = None,
+) -> CountResult:
+    """대상 전략에 따라 전체 건수 계산
+
+    Args:
+        target: 대상 이름 (전략 설정/캐시 키/메트릭 구분)
+        statement: 필터가 적용된 행 조회 문장 (LIMIT/OFFSET 제외, Select 또는 text)
+        cache_key: cached 전략의 필터 키 (예: (keyword,))
+        params: text 문장의 바인드 파라미터
+    """
+    strategy = resolve_count_strategy(target)
+
+    if strategy == COUNT_CACHED:
+        total = await count_cache.get_or_compute(
+            (target, *cache_key), lambda: exact_count(db, statement, params)
+        )
+    elif strategy == COUNT_ESTIMATED:
+        total = await estimate_rows(db, statement, params)
+        if total < DB_COUNT_ESTIMATE_MIN_ROWS:
+            total, strategy = await exact_count(db, statement, params), COUNT_EXACT
+    else:
+        total = await exact_count(db, statement, params)
+
+    DB_COUNT_REQUESTS.labels(target=target, strategy=strategy).inc()
+    return CountResult(total=total, strategy=strategy)
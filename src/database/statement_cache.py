@@ -0,0 +1,74 @@
+"""asyncpg prepared statement 캐시 설정
+
+asyncpg 드라이버는 모든 문장을 prepare 후 실행하며, SQLAlchemy asyncpg 어댑터는 커넥션마다
+SQL 문자열을 키로 하는 prepared statement LRU 캐시를 둔다. 같은 모양의 SQL 이 반복되면
+PARSE/DESCRIBE 왕복 없이 바로 실행되므로, 문장 모양이 고정되어 있어야 캐시 효과를 본다.
+
+모드:
+    on  : 캐시 사용 (기본)
+    off : PgBouncer(transaction/statement pooling) 호환 모드
+          - SQLAlchemy/asyncpg 캐시 비활성화
+          - prepared statement 이름을 매번 고유하게 생성하여 서버 커넥션 간 이름 충돌 방지
+
+설정 (환경 변수, 엔진별 값은 _<ENGINE> 접미사로 덮어쓰기 - 예: DB_STATEMENT_CACHE_MODE_ASYNC_REPLICA=off):
+    DB_STATEMENT_CACHE_MODE      on | off
+    DB_STATEMENT_CACHE_SIZE      커넥션당 캐시 문장 수 (SQLAlchemy 어댑터 + asyncpg 내부 캐시)
+    DB_STATEMENT_CACHE_LIFETIME  asyncpg 내부 캐시 문장 유지 시간 (초, 0 이면 무제한)
+                                 SQLAlchemy 어댑터 캐시는 LRU 로만 관리되며 DDL 발생 시 무효화된다.
+"""
+
+import os
+from dataclasses import dataclass
+from uuid import uuid4
+
+STATEMENT_CACHE_ON = "on"
+STATEMENT_CACHE_OFF = "off"
+
+DB_STATEMENT_CACHE_MODE = os.getenv("DB_STATEMENT_CACHE_MODE", STATEMENT_CACHE_ON)
+DB_STATEMENT_CACHE_SIZE = int(os.getenv("DB_STATEMENT_CACHE_SIZE", 100))
+DB_STATEMENT_CACHE_LIFETIME = int(os.getenv("DB_STATEMENT_CACHE_LIFETIME", 300))
+
+
+@dataclass(frozen=True)
+class StatementCacheConfig:
+    """엔진별 prepared statement 캐시 설정"""
+    mode: str
+    size: int
+    lifetime: int
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode == STATEMENT_CACHE_ON and self.size > 0
+
+
+def load_statement_cache_config(engine_name: str) -> StatementCacheConfig:
+    """전역 설정에 엔진별 환경 변수(_<ENGINE> 접미사)를 덮어쓴 설정"""
+    suffix = engine_name.upper()
+    mode = os.getenv(f"DB_STATEMENT_CACHE_MODE_{suffix}", DB_STATEMENT_CACHE_MODE).lower()
+    if mode not in (STATEMENT_CACHE_ON, STATEMENT_CACHE_OFF):
+        raise ValueError(f"Invalid DB_STATEMENT_CACHE_MODE for {engine_name}: {mode}")
+    return StatementCacheConfig(
+        mode=mode,
+        size=int(os.getenv(f"DB_STATEMENT_CACHE_SIZE_{suffix}", DB_STATEMENT_CACHE_SIZE)),
+        lifetime=int(os.getenv(f"DB_STATEMENT_CACHE_LIFETIME_{suffix}", DB_STATEMENT_CACHE_LIFETIME)),
+    )
+
+
+def _unique_statement_name() -> str:
+    return f"__asyncpg_{uuid4()}__"
+
+
+def asyncpg_connect_args(engine_name: str) -> dict:
+    """create_async_engine(connect_args=...) 에 전달할 asyncpg 연결 인자"""
+    config = load_statement_cache_config(engine_name)
+    if not config.enabled:
+        return {
+            "prepared_statement_cache_size": 0,
+            "statement_cache_size": 0,
+            "prepared_statement_name_func": _unique_statement_name,
+        }
+    return {
+        "prepared_statement_cache_size": config.size,
+        "statement_cache_size": config.size,
+        "max_cached_statement_lifetime": config.lifetime,
+    }
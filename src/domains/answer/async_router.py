@@ -0,0 +1,118 @@
+"""
+답변 API (비동기) - router.py 와 같은 경로/응답
+
+src/main.py 에서 ANSWER_API_MODE=async 일 때 router.py 대신 등록된다.
+인증은 토큰 클레임(get_current_user_claims)만 사용하여 DB 를 조회하지 않으며,
+쓰기 요청은 요청당 commit 1회로 처리한다 (src/domains/answer/async_service.py).
+"""
+
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette import status
+
+from src.common.pagination import InvalidCursorError, decode_cursor, next_cursor
+from src.database.database import get_async_db
+from src.domains.answer import async_service as answer_service
+from src.domains.answer.schemas import AnswerCreate, Answer, AnswerList, AnswerUpdate, AnswerDelete, AnswerVote
+from src.domains.answer.service import ANSWER_PAGE_MAX_SIZE, ANSWER_SORTS, answer_cursor_attributes
+from src.domains.user.router import get_current_user_claims
+from src.domains.user.schemas import UserClaims
+
+router = APIRouter(
+    prefix="/api/answer",
+)
+
+
+@router.post("/create/{question_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def answer_create(
+        question_id: int,
+        _answer_create: AnswerCreate,
+        db: AsyncSession = Depends(get_async_db),
+        current_user: UserClaims = Depends(get_current_user_claims)
+):
+    # 답변 + 알림을 한 트랜잭션으로 저장
+    if not await answer_service.create_answer(db, question_id=question_id, answer_create=_answer_create,
+                                              user=current_user):
+        raise HTTPException(status_code=404, detail="Question not found")
+
+
+@router.get("/list/{question_id}", response_model=AnswerList)
+async def answer_list(question_id: int,
+                      size: int = Query(default=20, ge=1, le=ANSWER_PAGE_MAX_SIZE),
+                      sort: Literal["create_date", "vote"] = "create_date",
+                      cursor: Optional[str] = None,
+                      include_voters: bool = False,
+                      db: AsyncSession = Depends(get_async_db)):
+    """질문의 답변 목록 (keyset 페이지 - 응답의 next_cursor 로 다음 페이지 조회)"""
+    try:
+        after = decode_cursor(cursor, ANSWER_SORTS[sort][2]) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    result = await answer_service.get_answer_list(db, question_id, limit=size, sort=sort, after=after,
+                                                  include_voters=include_voters)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Question not found")
+    total, answers = result
+    return {
+        "total": total,
+        "answer_list": answers,
+        "next_cursor": next_cursor(answers, size, *answer_cursor_attributes(sort)),
+    }
+
+
+@router.get("/detail/{answer_id}", response_model=Answer)
+async def answer_detail(answer_id: int, include_voters: bool = False, db: AsyncSession = Depends(get_async_db)):
+    """답변 상세 - 투표자 목록(voter)은 include_voters=true 일 때만 채운다 (건수는 vote_count)"""
+    answer = await answer_service.get_answer_by_id(db, answer_id=answer_id, include_voters=include_voters)
+    if not answer:
+        raise HTTPException(status_code=404, detail="Answer not found")
+    return answer
+
+
+async def _get_own_answer(db: AsyncSession, answer_id: int, current_user: UserClaims, action: str):
+    db_answer = await answer_service.get_answer_by_id(db, answer_id=answer_id)
+    if not db_answer:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="데이터를 찾을수 없습니다.")
+    if current_user.id != db_answer.user_id:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail=f"{action} 권한이 없습니다.")
+    return db_answer
+
+
+@router.put("/update", status_code=status.HTTP_204_NO_CONTENT)
+async def answer_update(_answer_update: AnswerUpdate,
+                        db: AsyncSession = Depends(get_async_db),
+                        current_user: UserClaims = Depends(get_current_user_claims)):
+    db_answer = await _get_own_answer(db, _answer_update.answer_id, current_user, "수정")
+    await answer_service.update_answer(db=db, db_answer=db_answer, answer_update=_answer_update)
+
+
+@router.delete("/delete/{answer_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def answer_delete(answer_id: int, db: AsyncSession = Depends(get_async_db),
+                        current_user: UserClaims = Depends(get_current_user_claims)):
+    """삭제 방법 1. answer_id 를 path params 로 받는 방법"""
+    db_answer = await _get_own_answer(db, answer_id, current_user, "삭제")
+    await answer_service.delete_answer(db=db, db_answer=db_answer)
+
+
+@router.delete("/delete2", status_code=status.HTTP_204_NO_CONTENT)
+async def answer_delete2(_answer_delete: AnswerDelete,
+                         db: AsyncSession = Depends(get_async_db),
+                         current_user: UserClaims = Depends(get_current_user_claims)):
+    """삭제 방법 2. answer_id 를 body 에서 받는 방법(AnswerDelete)"""
+    db_answer = await _get_own_answer(db, _answer_delete.answer_id, current_user, "삭제")
+    await answer_service.delete_answer(db=db, db_answer=db_answer)
+
+
+@router.post("/vote", status_code=status.HTTP_204_NO_CONTENT)
+async def answer_vote(_answer_vote: AnswerVote,
+                      db: AsyncSession = Depends(get_async_db),
+                      current_user: UserClaims = Depends(get_current_user_claims)):
+    # 투표/카운터/알림을 한 트랜잭션으로 처리 (답변을 미리 로드하지 않음)
+    if not await answer_service.vote_answer(db, answer_id=_answer_vote.answer_id, db_user=current_user):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
+                            detail="데이터를 찾을수 없습니다.")
@@ -0,0 +1,122 @@
+"""답변 서비스 (비동기 세션)
+
+service.py 와 같은 기능을 AsyncSession 으로 구현한다. 동기 버전은 요청마다 anyio 스레드풀 스레드와
+동기 풀 커넥션을 점유하지만, 이 버전은 이벤트 루프에서 비동기 풀 커넥션만 사용한다.
+
+- 쓰기 요청은 요청당 commit 1회: 답변 저장과 알림(add_notification)을 같은 트랜잭션으로 저장한다.
+- 응답 캐시 무효화는 commit 이후 (src/domains/question/cache.py)
+- 관계는 lazy load 할 수 없으므로 필요한 관계를 selectinload 하거나 FK 컬럼(user_id)을 사용한다.
+"""
+
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from src.domains.answer.models import Answer
+from src.domains.answer.schemas import AnswerCreate, AnswerUpdate
+from src.domains.answer.service import answer_page_statement
+from src.domains.notification import service as notification_service
+from src.domains.question.cache import invalidate_question
+from src.domains.question.counters import VOTE_STATEMENTS
+from src.domains.question.models import Question
+from src.domains.user.schemas import UserClaims
+
+
+async def get_answer_list(db: AsyncSession, question_id: int, limit: int, sort: str = "create_date",
+                          after: Optional[tuple] = None, include_voters: bool = False):
+    """질문의 답변 목록 (keyset 페이지)
+
+    Returns:
+        (전체 답변 수, 답변 목록) - 질문이 없으면 None
+    """
+    total = (await db.execute(
+        select(Question.answer_count).where(Question.id == question_id)
+    )).scalar_one_or_none()
+    if total is None:
+        return None
+    answers = (await db.execute(
+        answer_page_statement(question_id, limit, sort, after, include_voters)
+    )).scalars().all()
+    return total, answers
+
+
+async def create_answer(db: AsyncSession, question_id: int, answer_create: AnswerCreate, user: UserClaims) -> bool:
+    """답변 저장 + 질문 작성자 알림을 한 트랜잭션으로 처리 (질문/기존 답변을 로드하지 않음)
+
+    Returns:
+        질문 존재 여부
+    """
+    question = (await db.execute(
+        select(Question.user_id).where(Question.id == question_id)
+    )).one_or_none()
+    if question is None:
+        return False
+
+    db.add(Answer(question_id=question_id, content=answer_create.content,
+                  create_date=datetime.now(), user_id=user.id))
+    notification_service.add_notification(
+        db,
+        user_id=question.user_id,
+        actor_user_id=user.id,
+        event_type="answer_created",
+        resource_type="question",
+        resource_id=question_id,
+        message=f"{user.username}님이 회원님의 질문에 답변했습니다.",
+    )
+    await db.commit()
+    await invalidate_question(question_id)
+    return True
+
+
+async def get_answer_by_id(db: AsyncSession, answer_id: int, include_voters: bool = False) -> Optional[Answer]:
+    options = [selectinload(Answer.user)]
+    if include_voters:
+        options.append(selectinload(Answer.voter))
+    result = await db.execute(select(Answer).where(Answer.id == answer_id).options(*options))
+    return result.scalars().one_or_none()
+
+
+async def update_answer(db: AsyncSession, db_answer: Answer, answer_update: AnswerUpdate):
+    db_answer.content = answer_update.content
+    db_answer.modify_date = datetime.now()
+    question_id = db_answer.question_id
+    await db.commit()
+    await invalidate_question(question_id, lists=False)
+
+
+async def delete_answer(db: AsyncSession, db_answer: Answer):
+    question_id = db_answer.question_id
+    await db.delete(db_answer)
+    await db.commit()
+    await invalidate_question(question_id)
+
+
+async def vote_answer(db: AsyncSession, answer_id: int, db_user: UserClaims) -> bool:
+    """투표 추가 + vote_count 증가 + 알림 생성을 한 트랜잭션으로 처리 (이미 투표했으면 변화 없음)
+
+    Returns:
+        답변 존재 여부
+    """
+    row = (await db.execute(
+        VOTE_STATEMENTS["answer"], {"target_id": answer_id, "user_id": db_user.id}
+    )).one_or_none()
+    if row is None:
+        return False
+
+    if row.voted:
+        notification_service.add_notification(
+            db,
+            user_id=row.owner_id,
+            actor_user_id=db_user.id,
+            event_type="answer_voted",
+            resource_type="answer",
+            resource_id=answer_id,
+            message=f"{db_user.username}님이 회원님의 답변에 투표했습니다.",
+        )
+    await db.commit()
+    if row.voted:
+        await invalidate_question(row.question_id, lists=False)
+    return True
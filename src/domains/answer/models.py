@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, String, Table
+from sqlalchemy import Column, Integer, Text, DateTime, ForeignKey, String, Table, Index
 from sqlalchemy.orm import relationship
 
 from src.database.database import Base
@@ -16,7 +16,7 @@ answer_voter = Table(
     'answer_voter',
     Base.metadata,
     Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
-    Column('answer_id', Integer, ForeignKey('answer.id'), primary_key=True)
+    Column('answer_id', Integer, ForeignKey('answer.id', ondelete='CASCADE'), primary_key=True)
 )
 
 
@@ -31,4 +31,14 @@ class Answer(Base):
     question = relationship("Question", backref="answers")
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     user = relationship("User", backref="answer_users")
-    voter = relationship('User', secondary=answer_voter, backref='answer_voters')
+    # 투표자 목록은 명시적으로 요청할 때만 로드 (selectinload(Answer.voter)), 건수는 vote_count 사용
+    voter = relationship('User', secondary=answer_voter, backref='answer_voters',
+                         lazy='noload', passive_deletes=True)
+    vote_count = Column(Integer, nullable=False, default=0, server_default="0")
+
+    __table_args__ = (
+        # 질문별 답변 페이지 (작성순 keyset) / 상세 버전 스탬프 - question_id 단독 조회도 이 인덱스 사용
+        Index("ix_answer_question_create_date_id", "question_id", "create_date", "id"),
+        # 추천순 답변 페이지 (투표 시 인덱스 갱신 비용이 있으나 긴 스레드의 정렬을 피함)
+        Index("ix_answer_question_vote_count_id", "question_id", "vote_count", "id"),
+    )
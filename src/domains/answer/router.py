@@ -1,9 +1,12 @@
-from fastapi import APIRouter, Depends, HTTPException
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from starlette import status
 
+from src.common.pagination import InvalidCursorError, decode_cursor, next_cursor
 from src.database.database import get_db
-from src.domains.answer.schemas import AnswerCreate, Answer, AnswerUpdate, AnswerDelete, AnswerVote
+from src.domains.answer.schemas import AnswerCreate, Answer, AnswerList, AnswerUpdate, AnswerDelete, AnswerVote
 from src.domains.answer import service as answer_service
 from src.domains.question import service as question_service
 from src.domains.user.router import get_current_user_with_sync
@@ -40,9 +43,39 @@ def answer_create(
     )
 
 
+@router.get("/list/{question_id}", response_model=AnswerList)
+def answer_list(question_id: int,
+                size: int = Query(default=20, ge=1, le=answer_service.ANSWER_PAGE_MAX_SIZE),
+                sort: Literal["create_date", "vote"] = "create_date",
+                cursor: Optional[str] = None,
+                include_voters: bool = False,
+                db: Session = Depends(get_db)):
+    """질문의 답변 목록 (keyset 페이지 - 응답의 next_cursor 로 다음 페이지 조회)
+
+    sort: create_date (작성순) / vote (추천순). 커서는 같은 sort 로만 이어서 사용할 수 있다.
+    질문 상세의 answers_next_cursor 는 create_date 정렬의 커서다.
+    """
+    try:
+        after = decode_cursor(cursor, answer_service.ANSWER_SORTS[sort][2]) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    result = answer_service.get_answer_list(db, question_id, limit=size, sort=sort, after=after,
+                                            include_voters=include_voters)
+    if result is None:
+        raise HTTPException(status_code=404, detail="Question not found")
+    total, answers = result
+    return {
+        "total": total,
+        "answer_list": answers,
+        "next_cursor": next_cursor(answers, size, *answer_service.answer_cursor_attributes(sort)),
+    }
+
+
 @router.get("/detail/{answer_id}", response_model=Answer)
-def answer_detail(answer_id: int, db: Session = Depends(get_db)):
-    answer = answer_service.get_answer_by_id(db, answer_id=answer_id)
+def answer_detail(answer_id: int, include_voters: bool = False, db: Session = Depends(get_db)):
+    """답변 상세 - 투표자 목록(voter)은 include_voters=true 일 때만 채운다 (건수는 vote_count)"""
+    answer = answer_service.get_answer_by_id(db, answer_id=answer_id, include_voters=include_voters)
 
     # 존재하지 않는 답변을 조회할 경우 404 에러를 반환한다.
     if not answer:
@@ -103,18 +136,7 @@ def answer_delete2(_answer_delete: AnswerDelete,
 def answer_vote(_answer_vote: AnswerVote,
                 db: Session = Depends(get_db),
                 current_user: User = Depends(get_current_user_with_sync)):
-    db_answer = answer_service.get_answer_by_id(db, answer_id=_answer_vote.answer_id)
-    if not db_answer:
+    # 투표/카운터/알림을 한 트랜잭션으로 처리 (답변을 미리 로드하지 않음)
+    if not answer_service.vote_answer(db, answer_id=_answer_vote.answer_id, db_user=current_user):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail="데이터를 찾을수 없습니다.")
-    answer_service.vote_answer(db, db_answer=db_answer, db_user=current_user)
-
-    # 알림 생성 (백그라운드)
-    notification_service.create_notification_sync(
-        user_id=db_answer.user_id,
-        actor_user_id=current_user.id,
-        event_type="answer_voted",
-        resource_type="answer",
-        resource_id=db_answer.id,
-        message=f"{current_user.username}님이 회원님의 답변에 투표했습니다.",
-    )
\ No newline at end of file
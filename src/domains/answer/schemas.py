@@ -37,4 +37,11 @@ class Answer(BaseModel):
     modify_date: Union[datetime.datetime, None] = None
     user: Union[User, None]
     question_id: int
-    voter: list[User] = []
+    vote_count: int = 0
+    voter: list[User] = []  # include_voters=true 일 때만 채움
+
+
+class AnswerList(BaseModel):
+    total: int = 0  # 질문의 답변 수 (answer_count)
+    answer_list: list[Answer] = []
+    next_cursor: Union[str, None] = None  # 다음 페이지 커서 (마지막 페이지면 None)
@@ -1,23 +1,80 @@
 from datetime import datetime
+from typing import Optional, Tuple
 
-from sqlalchemy.orm import Session
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.sql import Select
 
 from src.domains.answer.models import Answer
 from src.domains.answer.schemas import AnswerCreate, AnswerUpdate
+from src.domains.notification import service as notification_service
+from src.domains.question.cache import invalidate_question_sync
+from src.domains.question.counters import VOTE_STATEMENTS
 from src.domains.question.models import Question
 from src.domains.user.models import User
 
 
+ANSWER_PAGE_MAX_SIZE = 100  # 답변 페이지 최대 크기
+
+# 정렬 -> (keyset 컬럼, 내림차순 여부, 커서 값 타입)
+ANSWER_SORTS = {
+    "create_date": ((Answer.create_date, Answer.id), False, (datetime, int)),
+    "vote": ((Answer.vote_count, Answer.id), True, (int, int)),
+}
+
+
+def answer_cursor_attributes(sort: str) -> Tuple[str, ...]:
+    """next_cursor 생성에 사용할 Answer 속성 이름"""
+    return tuple(column.key for column in ANSWER_SORTS[sort][0])
+
+
+def answer_page_statement(question_id: int, limit: int, sort: str = "create_date",
+                          after: Optional[tuple] = None, include_voters: bool = False) -> Select:
+    """질문의 답변 한 페이지 (keyset) - 동기/비동기 세션 공용
+
+    create_date: 작성순 (오래된 답변 먼저), vote: 추천순 (같으면 최신 id 먼저)
+    ix_answer_question_create_date_id / ix_answer_question_vote_count_id 인덱스를 사용한다.
+    """
+    columns, descending, _ = ANSWER_SORTS[sort]
+    stmt = select(Answer).where(Answer.question_id == question_id)
+    if after is not None:
+        key = tuple_(*columns)
+        stmt = stmt.where(key < tuple_(*after) if descending else key > tuple_(*after))
+    order_by = [column.desc() if descending else column.asc() for column in columns]
+    options = [selectinload(Answer.user)]
+    if include_voters:
+        options.append(selectinload(Answer.voter))
+    return stmt.order_by(*order_by).limit(limit).options(*options)
+
+
+def get_answer_list(db: Session, question_id: int, limit: int, sort: str = "create_date",
+                    after: Optional[tuple] = None, include_voters: bool = False):
+    """질문의 답변 목록 (keyset 페이지)
+
+    Returns:
+        (전체 답변 수, 답변 목록) - 질문이 없으면 None
+    """
+    total = db.execute(select(Question.answer_count).where(Question.id == question_id)).scalar_one_or_none()
+    if total is None:
+        return None
+    answers = db.execute(answer_page_statement(question_id, limit, sort, after, include_voters)).scalars().all()
+    return total, answers
+
+
 def create_answer(db: Session, question: Question, answer_create: AnswerCreate, user: User):
     db_answer = Answer(
         question=question, content=answer_create.content, create_date=datetime.now(), user=user
     )
+    question_id = question.id
     db.add(db_answer)
     db.commit()
+    invalidate_question_sync(question_id)
 
 
-def get_answer_by_id(db: Session, answer_id: int) -> Answer:
+def get_answer_by_id(db: Session, answer_id: int, include_voters: bool = False) -> Answer:
     # return db.query(Answer).filter(Answer.id == answer_id).first()
+    if include_voters:
+        return db.query(Answer).options(selectinload(Answer.voter)).filter(Answer.id == answer_id).first()
     return db.query(Answer).get(answer_id)
 
 
@@ -25,15 +82,42 @@ def update_answer(db: Session, db_answer: Answer,
                   answer_update: AnswerUpdate):
     db_answer.content = answer_update.content
     db_answer.modify_date = datetime.now()
+    question_id = db_answer.question_id
     db.add(db_answer)
     db.commit()
+    invalidate_question_sync(question_id, lists=False)
 
 
 def delete_answer(db: Session, db_answer: Answer):
+    question_id = db_answer.question_id
     db.delete(db_answer)
     db.commit()
+    invalidate_question_sync(question_id)
 
 
-def vote_answer(db: Session, db_answer: Answer, db_user: User):
-    db_answer.voter.append(db_user)
-    db.commit()
\ No newline at end of file
+def vote_answer(db: Session, answer_id: int, db_user: User) -> bool:
+    """투표 추가 + vote_count 증가 + 알림 생성을 한 트랜잭션으로 처리 (이미 투표했으면 변화 없음)
+
+    Returns:
+        답변 존재 여부
+    """
+    row = db.execute(
+        VOTE_STATEMENTS["answer"], {"target_id": answer_id, "user_id": db_user.id}
+    ).one_or_none()
+    if row is None:
+        return False
+
+    if row.voted:
+        notification_service.add_notification(
+            db,
+            user_id=row.owner_id,
+            actor_user_id=db_user.id,
+            event_type="answer_voted",
+            resource_type="answer",
+            resource_id=answer_id,
+            message=f"{db_user.username}님이 회원님의 답변에 투표했습니다.",
+        )
+    db.commit()
+    if row.voted:
+        invalidate_question_sync(row.question_id, lists=False)
+    return True
@@ -22,6 +22,7 @@ class AsyncExampleSchema(BaseModel):
 
 class ASyncExampleSchemaList(BaseModel):
     total: int
+    count_strategy: str = "exact"  # total 계산 전략 (exact / cached / estimated)
     example_list: list[AsyncExampleSchema] = []
 
     model_config = ConfigDict(
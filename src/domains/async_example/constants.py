@@ -1,5 +1,8 @@
 from enum import Enum
 
+# 목록 전체 건수 전략/캐시 대상 이름 (src/database/row_count.py)
+ASYNC_EXAMPLE_LIST_COUNT = "async_example_list"
+
 
 # .env 내 ENVIRONMENT 설정에 따라 환경을 구분한다.
 class Environment(str, Enum):
@@ -1,10 +1,11 @@
 import logging
-from sqlalchemy import select, or_, func
+from sqlalchemy import select, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.database.row_count import count_cache, count_rows
 from src.domains.async_example.business.schemas import AsyncExampleSchema, ASyncExampleSchemaList
-from src.domains.async_example.constants import ErrorCode
+from src.domains.async_example.constants import ASYNC_EXAMPLE_LIST_COUNT, ErrorCode
 from src.domains.async_example.database.models import AsyncExample
 from src.exceptions import DLException, handle_exceptions, ExceptionResponse
 
@@ -28,6 +29,7 @@ async def create_async_example(db: AsyncSession, async_example: AsyncExampleSche
     )
     db.add(async_example)
     await db.commit()
+    count_cache.invalidate_target(ASYNC_EXAMPLE_LIST_COUNT)
     await db.refresh(async_example)
 
     return AsyncExampleSchema.model_validate(async_example)
@@ -72,16 +74,12 @@ async def read_async_example_list(db, limit, offset, keyword):
     async_example_schema_list = [AsyncExampleSchema.model_validate(async_example) for async_example in
                                  async_example_list]
 
-    # 전체 개수를 계산하는 쿼리를 생성한다.
-    total_count_query = select(func.count()).select_from(
-        select(AsyncExample).where(search_condition).subquery()
-    )
-
-    # 전체 개수 조회
-    total_count = await db.execute(total_count_query)
-    total = total_count.scalar_one()
+    # 전체 개수 조회 (DB_COUNT_STRATEGY(_ASYNC_EXAMPLE_LIST) 전략 - src/database/row_count.py)
+    total = await count_rows(db, ASYNC_EXAMPLE_LIST_COUNT, select(AsyncExample).where(search_condition),
+                             cache_key=(keyword,))
 
-    return ASyncExampleSchemaList(total=total, example_list=async_example_schema_list)
+    return ASyncExampleSchemaList(total=total.total, count_strategy=total.strategy,
+                                  example_list=async_example_schema_list)
 
 
 @handle_exceptions
@@ -158,5 +156,6 @@ async def delete_async_example(db: AsyncSession, async_example_id: int):
 
     await db.delete(async_example)
     await db.commit()
+    count_cache.invalidate_target(ASYNC_EXAMPLE_LIST_COUNT)
     logger.info(f"Deleted AsyncExample with ID {async_example_id}")
 
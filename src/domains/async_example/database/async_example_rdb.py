@@ -4,9 +4,10 @@ from sqlalchemy import or_, select, func, desc, asc
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.database.row_count import count_cache, count_rows
 from src.domains.async_example.business.schemas import AsyncExampleSchema, ASyncExampleSchemaList, \
     RelatedAsyncExampleSchema, RelatedAsyncExampleSchemaList
-from src.domains.async_example.constants import ErrorCode
+from src.domains.async_example.constants import ASYNC_EXAMPLE_LIST_COUNT, ErrorCode
 from src.domains.async_example.database.models import AsyncExample, RelatedAsyncExample
 from src.exceptions import handle_exceptions, ExceptionResponse, DLException
 
@@ -75,16 +76,12 @@ class AsyncExampleCRUD:
         async_example_schema_list = [AsyncExampleSchema.model_validate(async_example) for async_example in
                                      async_example_list]
 
-        # 전체 개수를 계산하는 쿼리를 생성한다.
-        total_count_query = select(func.count()).select_from(
-            select(AsyncExample).where(search_condition).subquery()
-        )
-
-        # 전체 개수 조회
-        total_count = await self.db.execute(total_count_query)
-        total = total_count.scalar_one()
+        # 전체 개수 조회 (DB_COUNT_STRATEGY(_ASYNC_EXAMPLE_LIST) 전략 - src/database/row_count.py)
+        total = await count_rows(self.db, ASYNC_EXAMPLE_LIST_COUNT, select(AsyncExample).where(search_condition),
+                                 cache_key=(keyword,))
 
-        return ASyncExampleSchemaList(total=total, example_list=async_example_schema_list)
+        return ASyncExampleSchemaList(total=total.total, count_strategy=total.strategy,
+                                      example_list=async_example_schema_list)
 
     @handle_exceptions
     async def read_fetch_async_example(self, async_example_id: int) -> AsyncExampleSchema:
@@ -140,6 +137,7 @@ class AsyncExampleCRUD:
 
         await self.db.delete(async_example)
         await self.db.commit()
+        count_cache.invalidate_target(ASYNC_EXAMPLE_LIST_COUNT)
         logger.info(f"Deleted AsyncExample with ID {async_example_id}")
 
     @handle_exceptions
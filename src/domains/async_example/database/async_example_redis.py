@@ -1,11 +1,20 @@
+from typing import Optional
+
 import aioredis
 
+from src.database.redis_pool import redis_pool
 from src.exceptions import handle_exceptions
 
 
 class AsyncExampleRedis:
-    def __init__(self, redis_url: str = 'redis://localhost'):
-        self.redis_db = aioredis.from_url(redis_url, decode_responses=True)
+    def __init__(self, redis_url: Optional[str] = None, redis_db: Optional[aioredis.Redis] = None):
+        # 별도 URL 이 주어지지 않으면 프로세스 공용 커넥션 풀을 사용
+        if redis_db is not None:
+            self.redis_db = redis_db
+        elif redis_url is not None:
+            self.redis_db = aioredis.from_url(redis_url, decode_responses=True)
+        else:
+            self.redis_db = redis_pool.async_client()
 
     @handle_exceptions
     async def get(self, key: str) -> str:
@@ -43,6 +43,7 @@ class AsyncExampleResponse(BaseModel):
 
 class ASyncExampleListResponse(BaseModel):
     total: int
+    count_strategy: str = "exact"  # total 계산 전략 (exact / cached / estimated)
     example_list: list[AsyncExampleResponse] = []
 
     model_config = {
@@ -26,5 +26,5 @@ class Notification(Base):
 
     __table_args__ = (
         Index("ix_notification_user_is_read", "user_id", "is_read"),
-        Index("ix_notification_user_created", "user_id", "created_at"),
+        Index("ix_notification_user_created", "user_id", "created_at", "id"),  # 최신순 목록 / 커서 페이지네이션
     )
@@ -0,0 +1,111 @@
+"""알림 LISTEN/NOTIFY 수신기
+
+알림 INSERT 시 같은 트랜잭션에서 pg_notify(NOTIFICATION_CHANNEL, '<id>:<user_id>') 를 실행하고
+(service.py 의 Notification after_insert 이벤트 - NOTIFY 는 commit 시점에 전달되어 롤백된 알림은 전달되지 않음),
+각 인스턴스는 풀과 별도의 asyncpg 커넥션 하나로 LISTEN 하여 즉시 수신한다.
+
+- 수신 콜백은 (notification_id, user_id) 만 전달하고, 조회/푸시는 NotificationPoller 가 이 인스턴스에
+  SSE 로 연결된 사용자의 알림만 모아서 처리한다.
+- 연결이 끊기거나 헬스 체크(SELECT 1)가 실패하면 listening=False 가 되어 폴링으로 전환되고,
+  reconnect_delay 후 다시 LISTEN 을 시도한다.
+- alive_at: 마지막으로 LISTEN 연결이 정상임을 확인한 시각 (폴링 전환 시 이 시각 이후 알림부터 다시 조회)
+
+설정 (환경 변수):
+    NOTIFICATION_PUSH_MODE               listen (LISTEN/NOTIFY + 폴링 대체, 기본) / poll (폴링만)
+    NOTIFICATION_LISTEN_HEALTHCHECK      LISTEN 연결 헬스 체크 간격 (초)
+    NOTIFICATION_LISTEN_RECONNECT_DELAY  연결 실패 후 재시도 간격 (초)
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from typing import Callable, Optional
+
+import asyncpg
+
+logger = logging.getLogger(__name__)
+
+NOTIFICATION_CHANNEL = "notification_created"
+NOTIFICATION_PUSH_MODE = os.getenv("NOTIFICATION_PUSH_MODE", "listen").lower()
+if NOTIFICATION_PUSH_MODE not in ("listen", "poll"):
+    raise ValueError(f"Invalid NOTIFICATION_PUSH_MODE: {NOTIFICATION_PUSH_MODE}")
+NOTIFICATION_LISTEN_HEALTHCHECK = float(os.getenv("NOTIFICATION_LISTEN_HEALTHCHECK", 10.0))
+NOTIFICATION_LISTEN_RECONNECT_DELAY = float(os.getenv("NOTIFICATION_LISTEN_RECONNECT_DELAY", 5.0))
+
+
+def notify_payload(notification_id: int, user_id: int) -> str:
+    return f"{notification_id}:{user_id}"
+
+
+def parse_notify_payload(payload: str) -> Optional[tuple]:
+    """'<id>:<user_id>' → (id, user_id), 형식이 다르면 None"""
+    try:
+        notification_id, user_id = payload.split(":")
+        return int(notification_id), int(user_id)
+    except ValueError:
+        return None
+
+
+class NotificationListener:
+    """전용 asyncpg 커넥션으로 NOTIFICATION_CHANNEL 을 LISTEN (끊기면 재연결)"""
+
+    def __init__(self, dsn: str, on_notification: Callable[[int, int], None],
+                 healthcheck_interval: float = NOTIFICATION_LISTEN_HEALTHCHECK,
+                 reconnect_delay: float = NOTIFICATION_LISTEN_RECONNECT_DELAY):
+        self.dsn = dsn
+        self.on_notification = on_notification
+        self.healthcheck_interval = healthcheck_interval
+        self.reconnect_delay = reconnect_delay
+        self.listening = False
+        self.alive_at: Optional[datetime] = None
+        self._lost: Optional[asyncio.Event] = None
+
+    def _on_notify(self, connection, pid, channel, payload) -> None:
+        parsed = parse_notify_payload(payload)
+        if parsed is None:
+            logger.warning(f"Ignoring malformed notification payload: {payload!r}")
+            return
+        self.on_notification(*parsed)
+
+    def _on_termination(self, connection) -> None:
+        self._lost.set()
+
+    async def run(self) -> None:
+        """취소될 때까지 LISTEN 유지"""
+        while True:
+            connection = None
+            try:
+                connection = await asyncpg.connect(self.dsn)
+                self._lost = asyncio.Event()
+                connection.add_termination_listener(self._on_termination)
+                await connection.add_listener(NOTIFICATION_CHANNEL, self._on_notify)
+                self.alive_at = datetime.utcnow()
+                self.listening = True
+                logger.info(f"Listening on {NOTIFICATION_CHANNEL}")
+                await self._watch(connection)
+                logger.warning("Notification listener connection lost")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Notification listener error: {e}")
+            finally:
+                self.listening = False
+                if connection is not None and not connection.is_closed():
+                    try:
+                        await connection.close(timeout=1)
+                    except Exception:
+                        connection.terminate()
+            await asyncio.sleep(self.reconnect_delay)
+
+    async def _watch(self, connection) -> None:
+        """연결 종료 또는 헬스 체크 실패까지 대기"""
+        while not self._lost.is_set():
+            try:
+                await asyncio.wait_for(self._lost.wait(), timeout=self.healthcheck_interval)
+                return
+            except asyncio.TimeoutError:
+                pass
+            checked_at = datetime.utcnow()
+            await connection.fetchval("SELECT 1", timeout=self.healthcheck_interval)
+            self.alive_at = checked_at
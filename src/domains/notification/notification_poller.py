@@ -1,39 +1,67 @@
-"""DB 폴링 시스템
+"""알림 푸시 시스템 (LISTEN/NOTIFY + DB 폴링 대체)
 
-백그라운드에서 주기적으로 DB를 폴링하여 새 알림을 감지하고 SSE로 푸시합니다.
-각 서버 인스턴스마다 독립적으로 동작합니다.
+새 알림을 감지하여 SSE로 푸시합니다. 각 서버 인스턴스마다 독립적으로 동작합니다.
+
+- listen 모드(기본): 알림 INSERT 시 NOTIFY 된 (id, user_id) 를 전용 커넥션으로 수신하여, 이 인스턴스에
+  연결된 사용자의 알림만 짧게 모아(NOTIFICATION_PUSH_BATCH_WINDOW) id 로 조회 후 푸시한다.
+  LISTEN 중에는 폴링 쿼리를 실행하지 않는다.
+- LISTEN 연결이 끊기면 마지막 정상 시각(alive_at) 이후부터 폴링으로 조회하고, 재연결되면 한 번 더
+  폴링(catch-up)한 뒤 폴링을 멈춘다. 두 경로에서 같은 알림은 최근 푸시한 id 로 중복 제거한다.
+- poll 모드: 기존과 같이 interval 마다 폴링만 한다.
 """
 
 import asyncio
 import logging
-from datetime import datetime
+import os
+from collections import deque
+from datetime import datetime, timedelta
 from typing import Optional
 
-from src.database.database import AsyncSessionPrimary
+from src.database.database import AsyncSessionBackground, async_engine_primary
+from src.domains.notification.notification_listener import NOTIFICATION_PUSH_MODE, NotificationListener
 from src.domains.notification.sse_manager import sse_manager
 from src.domains.notification import service as notification_service
 from src.domains.notification.schemas import NotificationResponse
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_PUSH_BATCH_WINDOW = float(os.getenv("NOTIFICATION_PUSH_BATCH_WINDOW", 0.05))
+RECENT_PUSHED_SIZE = 10000  # 중복 제거용으로 기억하는 최근 푸시 알림 수
+
+
+def listener_dsn() -> str:
+    """비동기 엔진 URL 을 asyncpg.connect 용 DSN 으로 변환"""
+    return async_engine_primary.url.set(drivername="postgresql").render_as_string(hide_password=False)
+
 
 class NotificationPoller:
-    """백그라운드에서 DB를 주기적으로 폴링하여 새 알림을 SSE로 푸시
+    """새 알림을 SSE로 푸시 (LISTEN/NOTIFY 우선, 끊기면 DB 폴링)
 
-    - 폴링 간격: 1.5초 (서버 3대 × 40 QPS = 120 QPS, DB 부하 미미)
+    - 폴링 간격: 1.5초 (서버 3대 × 40 QPS = 120 QPS, DB 부하 미미) - listen 모드에서는 LISTEN 이 끊긴 동안만
     - 최적화: 연결된 사용자만 조회
     - 각 서버 인스턴스마다 독립적으로 실행
     """
 
-    def __init__(self, interval: float = 1.5):
+    def __init__(self, interval: float = 1.5, mode: str = NOTIFICATION_PUSH_MODE,
+                 batch_window: float = NOTIFICATION_PUSH_BATCH_WINDOW):
         """
         Args:
             interval: 폴링 간격 (초)
+            mode: listen (LISTEN/NOTIFY + 폴링 대체) / poll (폴링만)
+            batch_window: NOTIFY 수신 후 조회까지 모으는 시간 (초)
         """
         self.interval = interval
+        self.mode = mode
+        self.batch_window = batch_window
         self.last_check: datetime = datetime.utcnow()
         self.running = False
         self._task: Optional[asyncio.Task] = None
+        self.listener: Optional[NotificationListener] = None
+        self._listener_task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._pending_ids: set[int] = set()
+        self._pushed_ids: set[int] = set()
+        self._pushed_order: deque = deque()
 
     async def start(self):
         """앱 시작 시 백그라운드 태스크로 실행"""
@@ -43,8 +71,11 @@ class NotificationPoller:
 
         self.running = True
         self.last_check = datetime.utcnow()
+        if self.mode == "listen":
+            self.listener = NotificationListener(listener_dsn(), self._on_notification)
+            self._listener_task = asyncio.create_task(self.listener.run())
         self._task = asyncio.create_task(self._poll_loop())
-        logger.info(f"NotificationPoller started (interval={self.interval}s)")
+        logger.info(f"NotificationPoller started (mode={self.mode}, interval={self.interval}s)")
 
     async def stop(self):
         """앱 종료 시 폴링 중지"""
@@ -53,20 +84,33 @@ class NotificationPoller:
 
         self.running = False
 
-        if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+        for task in (self._task, self._listener_task, self._flush_task):
+            if task:
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
 
         logger.info("NotificationPoller stopped")
 
     async def _poll_loop(self):
-        """메인 폴링 루프"""
+        """메인 폴링 루프 (LISTEN 중에는 폴링하지 않음)"""
+        listening = False
         while self.running:
             try:
                 await asyncio.sleep(self.interval)
+                if self.listener is not None and self.listener.listening:
+                    if not listening:
+                        # LISTEN 시작 전(또는 끊긴 동안) 저장된 알림을 마지막으로 한 번 더 조회
+                        listening = True
+                        await self._check_and_push_notifications()
+                    continue
+                if listening:
+                    # LISTEN 이 끊김: 마지막 정상 시각 이후부터 폴링으로 조회
+                    listening = False
+                    self.last_check = self.listener.alive_at - timedelta(seconds=self.interval)
+                    logger.warning("Notification listener down, falling back to polling")
                 await self._check_and_push_notifications()
             except asyncio.CancelledError:
                 logger.info("Polling loop cancelled")
@@ -74,6 +118,32 @@ class NotificationPoller:
             except Exception as e:
                 logger.error(f"폴링 에러: {e}", exc_info=True)
 
+    def _on_notification(self, notification_id: int, user_id: int) -> None:
+        """NOTIFY 수신 콜백 - 이 인스턴스에 연결된 사용자의 알림만 모아서 조회 예약"""
+        if not sse_manager.is_connected(user_id) or notification_id in self._pushed_ids:
+            return
+        self._pending_ids.add(notification_id)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_pending())
+
+    async def _flush_pending(self):
+        """batch_window 동안 모인 알림을 한 번에 조회하여 푸시 (조회/푸시 중 새로 수신한 알림이 없을 때까지 반복)
+
+        조회에 실패하면 id 를 되돌려 interval 후 다시 시도한다 (LISTEN 중에는 폴링이 대신 조회하지 않음).
+        """
+        while self._pending_ids:
+            await asyncio.sleep(self.batch_window)
+            notification_ids, self._pending_ids = list(self._pending_ids), set()
+            try:
+                async with AsyncSessionBackground() as db:
+                    notifications = await notification_service.get_notifications_by_ids(db, notification_ids)
+            except Exception as e:
+                logger.error(f"DB 조회 에러: {e}", exc_info=True)
+                self._pending_ids.update(notification_ids)
+                await asyncio.sleep(self.interval)
+                continue
+            await self._push(notifications)
+
     async def _check_and_push_notifications(self):
         """새 알림 확인 및 SSE 푸시"""
         # 1. 연결된 사용자만 조회 (최적화)
@@ -84,7 +154,7 @@ class NotificationPoller:
 
         # 2. DB에서 새 알림 조회
         try:
-            async with AsyncSessionPrimary() as db:
+            async with AsyncSessionBackground() as db:
                 new_notifications = await notification_service.get_new_notifications_since(
                     db,
                     since=self.last_check,
@@ -103,9 +173,25 @@ class NotificationPoller:
             # 새 알림이 없어도 현재 시간으로 업데이트하여 시간 누적 방지
             self.last_check = datetime.utcnow()
 
+        await self._push(new_notifications)
+
+    def _mark_pushed(self, notification_id: int) -> bool:
+        """처음 푸시하는 알림이면 기록 후 True (LISTEN 과 폴링 경로의 중복 푸시 방지)"""
+        if notification_id in self._pushed_ids:
+            return False
+        self._pushed_ids.add(notification_id)
+        self._pushed_order.append(notification_id)
+        while len(self._pushed_order) > RECENT_PUSHED_SIZE:
+            self._pushed_ids.discard(self._pushed_order.popleft())
+        return True
+
+    async def _push(self, new_notifications: list):
+        """user_id별로 그룹핑하여 SSE 푸시"""
         # 4. user_id별로 그룹핑
         user_notifications: dict[int, list] = {}
         for notif in new_notifications:
+            if not self._mark_pushed(notif.id):
+                continue
             if notif.user_id not in user_notifications:
                 user_notifications[notif.user_id] = []
             user_notifications[notif.user_id].append(notif)
@@ -1,23 +1,20 @@
 import asyncio
 import logging
+from datetime import datetime
+from typing import Optional
 
 from fastapi import APIRouter, Depends, Query, HTTPException, Request
 from fastapi.responses import StreamingResponse
-from jose import jwt, JWTError
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from src.database.database import get_async_db
+from src.common.pagination import InvalidCursorError, decode_cursor, next_cursor
+from src.database.database import get_async_db, get_async_read_db
 from src.domains.notification import schemas as notification_schema
 from src.domains.notification import service as notification_service
 from src.domains.notification.sse_manager import sse_manager
-from src.domains.user.models import User
-from src.domains.user.router import get_current_user_with_async
-from src.domains.user import service as user_service
-
-# JWT 설정 (user.router와 동일)
-SECRET_KEY = "d6bb5677104d5fe5259db4a9988f5243c4e77ecd577a7bc340c25c477e62418f"
-ALGORITHM = "HS256"
+from src.domains.user.router import claims_from_token, get_current_user_claims
+from src.domains.user.schemas import UserClaims
 
 router = APIRouter(prefix="/api/notification")
 logger = logging.getLogger(__name__)
@@ -25,26 +22,36 @@ logger = logging.getLogger(__name__)
 
 @router.get("/list", response_model=notification_schema.NotificationList)
 async def notification_list(
-    db: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user_with_async),
+    db: AsyncSession = Depends(get_async_read_db),
+    current_user: UserClaims = Depends(get_current_user_claims),
     page: int = 0,
     size: int = 20,
+    cursor: Optional[str] = None,
 ):
     """알림 목록 조회 (페이징)
 
     클라이언트에서 주기적으로 호출하여 새 알림 확인
     예: 10초마다 폴링
+
+    cursor 를 주면 커서 모드 (응답의 next_cursor 로 다음 페이지 조회, page 무시)
     """
-    total, unread_count, notifications = await notification_service.get_notifications(
-        db, user_id=current_user.id, offset=page * size, limit=size
+    try:
+        after = decode_cursor(cursor, (datetime, int)) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    total, unread_count, notifications, count_strategy = await notification_service.get_notifications(
+        db, user_id=current_user.id, offset=page * size, limit=size, after=after
     )
     return {
         "total": total,
         "unread_count": unread_count,
+        "count_strategy": count_strategy,
         "notifications": [
             notification_schema.NotificationResponse.from_orm_with_actor(n)
             for n in notifications
         ],
+        "next_cursor": next_cursor(notifications, size, "created_at", "id"),
     }
 
 
@@ -52,7 +59,7 @@ async def notification_list(
 async def mark_notifications_read(
     body: notification_schema.NotificationReadUpdate,
     db: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user_with_async),
+    current_user: UserClaims = Depends(get_current_user_claims),
 ):
     """선택한 알림을 읽음 처리"""
     await notification_service.mark_as_read(
@@ -63,7 +70,7 @@ async def mark_notifications_read(
 @router.put("/read-all", status_code=status.HTTP_204_NO_CONTENT)
 async def mark_all_notifications_read(
     db: AsyncSession = Depends(get_async_db),
-    current_user: User = Depends(get_current_user_with_async),
+    current_user: UserClaims = Depends(get_current_user_claims),
 ):
     """모든 알림을 읽음 처리"""
     await notification_service.mark_all_as_read(db, user_id=current_user.id)
@@ -72,36 +79,19 @@ async def mark_all_notifications_read(
 async def get_current_user_for_sse(
     token: str = Query(..., description="JWT access token"),
     db: AsyncSession = Depends(get_async_db)
-) -> User:
+) -> UserClaims:
     """SSE용 토큰 인증 (query parameter 사용)
 
     EventSource API는 커스텀 헤더를 지원하지 않으므로 query parameter로 토큰을 받습니다.
+    토큰 클레임만 사용하므로 연결 시 DB 를 조회하지 않고, 스트림 동안 커넥션을 점유하지 않습니다.
     """
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-
-    user = await user_service.get_user_async(db, username=username)
-    if user is None:
-        raise credentials_exception
-
-    return user
+    return await claims_from_token(token, db)
 
 
 @router.get("/stream")
 async def notification_stream(
     request: Request,
-    current_user: User = Depends(get_current_user_for_sse)
+    current_user: UserClaims = Depends(get_current_user_for_sse)
 ):
     """SSE 실시간 알림 스트림
 
@@ -37,7 +37,9 @@ class NotificationResponse(BaseModel):
 class NotificationList(BaseModel):
     total: int = 0
     unread_count: int = 0
+    count_strategy: str = "exact"  # total/unread_count 계산 전략 (exact / cached)
     notifications: list[NotificationResponse] = []
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 
 class NotificationReadUpdate(BaseModel):
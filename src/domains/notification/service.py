@@ -4,15 +4,68 @@ import asyncio
 import logging
 from datetime import datetime
 
-from sqlalchemy import select, func, update
+from sqlalchemy import event, select, func, text, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from src.database.row_count import COUNT_CACHED, COUNT_EXACT, count_cache, resolve_count_strategy
 from src.domains.notification.models import Notification
+from src.domains.notification.notification_listener import (
+    NOTIFICATION_CHANNEL, NOTIFICATION_PUSH_MODE, notify_payload
+)
 from src.database.database import get_async_db
 
 logger = logging.getLogger(__name__)
 
+NOTIFICATION_COUNT = "notifications"  # 전체/안읽음 건수 전략/캐시 대상 이름
+NOTIFY_STATEMENT = text("SELECT pg_notify(:channel, :payload)")
+
+
+@event.listens_for(Notification, "after_insert")
+def _notify_inserted(mapper, connection, target: Notification) -> None:
+    """알림 INSERT 와 같은 트랜잭션에서 NOTIFY (commit 시 LISTEN 중인 인스턴스에 전달)
+
+    저장 경로(동기/비동기 세션)와 무관하게 적용된다. PostgreSQL 이 아니면 (테스트용 SQLite) 생략.
+    """
+    if NOTIFICATION_PUSH_MODE != "listen" or connection.dialect.name != "postgresql":
+        return
+    connection.execute(NOTIFY_STATEMENT, {
+        "channel": NOTIFICATION_CHANNEL,
+        "payload": notify_payload(target.id, target.user_id),
+    })
+
+
+def add_notification(
+    db,
+    user_id: int,
+    actor_user_id: int,
+    event_type: str,
+    resource_type: str,
+    resource_id: int,
+    message: str,
+) -> Notification | None:
+    """알림을 세션에 추가만 하고 commit 은 호출자에게 맡김 (원인 작업과 같은 트랜잭션으로 저장)
+
+    동기/비동기 세션 모두 사용 가능. 자기 자신에게는 None.
+    건수 캐시는 여기서 무효화한다 (commit 전에 다시 채워진 값은 TTL 안에 만료).
+    """
+    # 자기 자신에게는 알림 보내지 않음
+    if user_id is None or user_id == actor_user_id:
+        return None
+
+    notification = Notification(
+        user_id=user_id,
+        actor_user_id=actor_user_id,
+        event_type=event_type,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        message=message,
+        created_at=datetime.utcnow(),
+    )
+    db.add(notification)
+    count_cache.invalidate((NOTIFICATION_COUNT, user_id))
+    return notification
+
 
 async def create_notification(
     db: AsyncSession,
@@ -36,20 +89,11 @@ async def create_notification(
     Returns:
         생성된 Notification 객체 (자기 자신에게는 None)
     """
-    # 자기 자신에게는 알림 보내지 않음
-    if user_id == actor_user_id:
-        return None
-
-    notification = Notification(
-        user_id=user_id,
-        actor_user_id=actor_user_id,
-        event_type=event_type,
-        resource_type=resource_type,
-        resource_id=resource_id,
-        message=message,
-        created_at=datetime.utcnow(),
+    notification = add_notification(
+        db, user_id, actor_user_id, event_type, resource_type, resource_id, message
     )
-    db.add(notification)
+    if notification is None:
+        return None
     await db.commit()
     await db.refresh(notification)
 
@@ -87,21 +131,12 @@ def create_notification_sync(
     Returns:
         생성된 Notification 객체 (자기 자신에게는 None)
     """
-    # 자기 자신에게는 알림 보내지 않음
-    if user_id == actor_user_id:
-        return None
-
     try:
-        notification = Notification(
-            user_id=user_id,
-            actor_user_id=actor_user_id,
-            event_type=event_type,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            message=message,
-            created_at=datetime.utcnow(),
+        notification = add_notification(
+            db, user_id, actor_user_id, event_type, resource_type, resource_id, message
         )
-        db.add(notification)
+        if notification is None:
+            return None
         db.commit()
         db.refresh(notification)
         return notification
@@ -140,37 +175,51 @@ async def _create_notification_background(
         logger.error(f"Failed to create notification in background: {e}")
 
 
-async def get_notifications(
-    db: AsyncSession, user_id: int, offset: int = 0, limit: int = 20
-) -> tuple[int, int, list[Notification]]:
-    total_q = await db.execute(
-        select(func.count()).select_from(
-            select(Notification).where(Notification.user_id == user_id).subquery()
-        )
-    )
-    total = total_q.scalar_one()
-
-    unread_q = await db.execute(
-        select(func.count()).select_from(
-            select(Notification).where(
-                Notification.user_id == user_id,
-                Notification.is_read == False
-            ).subquery()
-        )
+async def _count_notifications(db: AsyncSession, user_id: int) -> tuple[int, int]:
+    """(전체 건수, 안 읽은 건수) - FILTER 집계로 한 번에 계산"""
+    result = await db.execute(
+        select(
+            func.count(),
+            func.count().filter(Notification.is_read == False),
+        ).where(Notification.user_id == user_id)
     )
-    unread_count = unread_q.scalar_one()
+    total, unread_count = result.one()
+    return total, unread_count
+
 
+async def get_notifications(
+    db: AsyncSession, user_id: int, offset: int = 0, limit: int = 20,
+    after: tuple[datetime, int] | None = None,
+) -> tuple[int, int, list[Notification], str]:
+    """알림 목록 (최신순)
+
+    after=(created_at, id) 이면 커서 모드: 해당 알림 다음부터 조회 (offset 무시)
+    건수는 DB_COUNT_STRATEGY(_NOTIFICATIONS) 전략으로 계산한다. 사용자별 건수는 작아
+    추정치가 의미 없으므로 estimated 는 exact 로 처리하고, cached 는 알림 생성/읽음 처리 시 무효화한다.
+    """
+    strategy = resolve_count_strategy(NOTIFICATION_COUNT)
+    if strategy == COUNT_CACHED:
+        total, unread_count = await count_cache.get_or_compute(
+            (NOTIFICATION_COUNT, user_id), lambda: _count_notifications(db, user_id)
+        )
+    else:
+        strategy = COUNT_EXACT
+        total, unread_count = await _count_notifications(db, user_id)
+
+    query = select(Notification).where(Notification.user_id == user_id)
+    if after is not None:
+        query = query.where(tuple_(Notification.created_at, Notification.id) < tuple_(*after))
+        offset = 0
     result = await db.execute(
-        select(Notification)
-        .where(Notification.user_id == user_id)
+        query
         .options(selectinload(Notification.actor))
-        .order_by(Notification.created_at.desc())
+        .order_by(Notification.created_at.desc(), Notification.id.desc())
         .offset(offset)
         .limit(limit)
     )
     notifications = result.scalars().fetchall()
 
-    return total, unread_count, notifications
+    return total, unread_count, notifications, strategy
 
 
 async def mark_as_read(
@@ -186,6 +235,7 @@ async def mark_as_read(
     )
     result = await db.execute(stmt)
     await db.commit()
+    count_cache.invalidate((NOTIFICATION_COUNT, user_id))
     return result.rowcount
 
 
@@ -200,6 +250,7 @@ async def mark_all_as_read(db: AsyncSession, user_id: int) -> int:
     )
     result = await db.execute(stmt)
     await db.commit()
+    count_cache.invalidate((NOTIFICATION_COUNT, user_id))
     return result.rowcount
 
 
@@ -230,3 +281,15 @@ async def get_new_notifications_since(
 
     result = await db.execute(stmt)
     return list(result.scalars().all())
+
+
+async def get_notifications_by_ids(db: AsyncSession, notification_ids: list[int]) -> list[Notification]:
+    """NOTIFY 로 받은 알림 조회 (LISTEN 푸시용)"""
+    stmt = (
+        select(Notification)
+        .where(Notification.id.in_(notification_ids))
+        .options(selectinload(Notification.actor))
+        .order_by(Notification.created_at.asc(), Notification.id.asc())
+    )
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
@@ -95,6 +95,10 @@ class SSEConnectionManager:
         """
         return set(self._connections.keys())
 
+    def is_connected(self, user_id: int) -> bool:
+        """해당 사용자가 이 서버에 연결되어 있는지 (LISTEN 수신 시 필터링용)"""
+        return bool(self._connections.get(user_id))
+
     def total_connections(self) -> int:
         """총 연결 수 (모니터링용)
 
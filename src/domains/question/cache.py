@@ -0,0 +1,45 @@
+"""질문 목록/상세 응답 캐시 (src/common/response_cache.py)
+
+    목록: question_list 캐시, 네임스페이스 하나("all") - 키: (page, size, keyword, cursor), 미스는 Primary 에서 조회
+    상세: question_detail 캐시, 질문 id 별 네임스페이스 - 키: (include_voters, answer_size, loader, ETag)
+          (ETag 가 조회한 데이터의 버전 스탬프이므로 Replica 에서 조회해도 이전 본문은 이전 ETag 키에만 저장됨)
+
+무효화 (commit 이후 호출):
+    질문 생성                        → 목록
+    질문 수정/삭제/투표              → 목록 + 해당 질문 상세
+    답변 생성/삭제 (answer_count)    → 목록 + 해당 질문 상세
+    답변 수정/투표                   → 해당 질문 상세
+
+HTTP 캐시 헤더 (src/common/http_cache.py):
+    목록: 본문 해시 ETag + Cache-Control: public, max-age=QUESTION_LIST_MAX_AGE
+    상세: 버전 스탬프 ETag + Cache-Control: no-cache (매번 재검증, 변경이 없으면 304)
+"""
+
+import os
+from typing import Optional
+
+from src.common.response_cache import ResponseCache
+
+LIST_NAMESPACE = "all"
+
+QUESTION_LIST_MAX_AGE = int(os.getenv("QUESTION_LIST_MAX_AGE", 5))
+LIST_CACHE_CONTROL = f"public, max-age={QUESTION_LIST_MAX_AGE}"
+DETAIL_CACHE_CONTROL = "no-cache"
+
+question_list_cache = ResponseCache("question_list")
+question_detail_cache = ResponseCache("question_detail")
+
+
+async def invalidate_question(question_id: Optional[int] = None, lists: bool = True) -> None:
+    if lists:
+        await question_list_cache.invalidate(LIST_NAMESPACE)
+    if question_id is not None:
+        await question_detail_cache.invalidate(str(question_id))
+
+
+def invalidate_question_sync(question_id: Optional[int] = None, lists: bool = True) -> None:
+    """동기 라우터(답변)용"""
+    if lists:
+        question_list_cache.invalidate_sync(LIST_NAMESPACE)
+    if question_id is not None:
+        question_detail_cache.invalidate_sync(str(question_id))
@@ -0,0 +1,96 @@
+"""질문/답변 비정규화 카운터 (vote_count, answer_count)
+
+건수를 보여주기 위해 투표자/답변 전체를 ORM 으로 로드하지 않도록, 카운터 컬럼을
+투표·답변 추가/삭제와 같은 트랜잭션에서 증감한다.
+
+- 답변 추가/삭제: Answer mapper 이벤트(after_insert / after_delete / after_update)에서
+  question.answer_count 를 갱신 (동기/비동기 세션, 저장 경로와 무관하게 적용)
+- 투표: association 테이블이라 mapper 이벤트가 없으므로, 투표 행 INSERT ... ON CONFLICT DO NOTHING
+  과 카운터 UPDATE 를 한 문장(VOTE_STATEMENTS)으로 실행한다. 기존 투표 수와 무관하게 한 번의 왕복.
+- 기존 데이터는 scripts/rebuild_question_counters.py 로 재계산한다.
+"""
+
+from sqlalchemy import event, inspect, text, update
+
+from src.domains.answer.models import Answer
+from src.domains.question.models import Question
+
+_question = Question.__table__
+
+
+def _vote_statement(target: str, voter_table: str, target_column: str, *extra_columns: str):
+    """투표 추가 + 카운터 증가 + 대상 작성자 조회를 한 문장으로 실행
+
+    결과 행: (owner_id, voted, *extra_columns)
+        행 없음       → 대상이 존재하지 않음
+        voted = false → 이미 투표함 (ON CONFLICT DO NOTHING, 카운터 변화 없음)
+        voted = true  → 이번 요청으로 투표 추가, vote_count + 1
+    """
+    columns = "".join(f", {column}" for column in extra_columns)
+    target_columns = "".join(f", target.{column}" for column in extra_columns)
+    return text(f"""
+        WITH target AS (
+            SELECT id, user_id{columns} FROM {target} WHERE id = :target_id
+        ), inserted AS (
+            INSERT INTO {voter_table} (user_id, {target_column})
+            SELECT :user_id, id FROM target
+            ON CONFLICT DO NOTHING
+            RETURNING {target_column}
+        ), bumped AS (
+            UPDATE {target} SET vote_count = vote_count + 1
+            WHERE id IN (SELECT {target_column} FROM inserted)
+            RETURNING id
+        )
+        SELECT target.user_id AS owner_id, EXISTS (SELECT 1 FROM bumped) AS voted{target_columns} FROM target
+    """)
+
+
+VOTE_STATEMENTS = {
+    "question": _vote_statement("question", "question_voter", "question_id"),
+    "answer": _vote_statement("answer", "answer_voter", "answer_id", "question_id"),  # 상세 캐시 무효화용
+}
+
+
+# 일괄 재계산용 (id 구간 단위)
+REBUILD_QUESTION_COUNTERS = text("""
+    UPDATE question AS q SET
+        vote_count = (SELECT count(*) FROM question_voter v WHERE v.question_id = q.id),
+        answer_count = (SELECT count(*) FROM answer a WHERE a.question_id = q.id)
+    WHERE q.id > :after_id AND q.id <= :until_id
+""")
+REBUILD_ANSWER_COUNTERS = text("""
+    UPDATE answer AS a SET
+        vote_count = (SELECT count(*) FROM answer_voter v WHERE v.answer_id = a.id)
+    WHERE a.id > :after_id AND a.id <= :until_id
+""")
+
+
+def _add_answer_count(connection, question_id, delta: int) -> None:
+    if question_id is None:
+        return
+    connection.execute(
+        update(_question)
+        .where(_question.c.id == question_id)
+        .values(answer_count=_question.c.answer_count + delta)
+    )
+
+
+@event.listens_for(Answer, "after_insert")
+def _answer_inserted(mapper, connection, target: Answer) -> None:
+    _add_answer_count(connection, target.question_id, 1)
+
+
+@event.listens_for(Answer, "after_delete")
+def _answer_deleted(mapper, connection, target: Answer) -> None:
+    _add_answer_count(connection, target.question_id, -1)
+
+
+@event.listens_for(Answer, "after_update")
+def _answer_moved(mapper, connection, target: Answer) -> None:
+    history = inspect(target).attrs.question_id.history
+    if not history.has_changes():
+        return
+    for question_id in history.deleted or ():
+        _add_answer_count(connection, question_id, -1)
+    for question_id in history.added or ():
+        _add_answer_count(connection, question_id, 1)
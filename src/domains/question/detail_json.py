@@ -0,0 +1,114 @@
+"""질문 상세 단일 쿼리 JSON 로더
+
+ORM 로더(get_question)는 질문 + 작성자/답변/답변 작성자(+ 투표자) selectinload 로 여러 번 조회하고,
+모든 행을 ORM 객체로 만든 뒤 pydantic 으로 다시 직렬화한다. 답변이 많은 질문일수록 객체 생성 비용이 커진다.
+
+이 로더는 PostgreSQL json_build_object / json_agg 로 question_schema.Question 과 같은 모양의
+JSON 을 한 번의 쿼리로 만들고, 결과 문자열을 그대로 응답 본문으로 사용한다 (ORM/pydantic 을 거치지 않음).
+
+- 키 순서는 스키마 필드 순서와 같게 json(비 jsonb)으로 만든다.
+- 답변은 ORM 로더와 같이 작성순(create_date, id) 첫 :answer_limit 개만 포함하고, 페이지가 차면
+  마지막 답변의 정렬 키로 answers_next_cursor 를 만든다 (src/common/pagination.py 와 같은 형식).
+- 투표자는 사용자 id 순으로 정렬한다.
+- 날짜는 PostgreSQL 의 ISO 8601 표기 (소수점 이하 0 은 생략될 수 있음)
+
+선택 (환경 변수 QUESTION_DETAIL_LOADER 또는 상세 API 의 loader 파라미터):
+    orm  : ORM selectinload + pydantic 직렬화 (기본)
+    json : 단일 쿼리 JSON
+"""
+
+import os
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.domains.question.service import QUESTION_DETAIL_ANSWER_LIMIT
+
+LOADER_ORM = "orm"
+LOADER_JSON = "json"
+QUESTION_DETAIL_LOADER = os.getenv("QUESTION_DETAIL_LOADER", LOADER_ORM).lower()
+if QUESTION_DETAIL_LOADER not in (LOADER_ORM, LOADER_JSON):
+    raise ValueError(f"Invalid QUESTION_DETAIL_LOADER: {QUESTION_DETAIL_LOADER}")
+
+
+def _user_json(alias: str) -> str:
+    return f"json_build_object('id', {alias}.id, 'username', {alias}.username, 'email', {alias}.email)"
+
+
+def _voters_json(voter_table: str, target_column: str, target_id: str) -> str:
+    return f"""coalesce((
+        SELECT json_agg({_user_json("vu")} ORDER BY vu.id)
+          FROM {voter_table} v JOIN users vu ON vu.id = v.user_id
+         WHERE v.{target_column} = {target_id}), '[]'::json)"""
+
+
+# (create_date, id) 커서: JSON 배열 → URL-safe base64 (패딩/줄바꿈 제거) - decode_cursor 로 복원 가능
+# 시각은 datetime.fromisoformat 이 읽을 수 있도록 마이크로초 6자리로 고정한다.
+_ANSWER_CURSOR = """rtrim(translate(encode(convert_to(
+        json_build_array(to_char(a.create_date, 'YYYY-MM-DD"T"HH24:MI:SS.US'), a.id)::text, 'UTF8'
+    ), 'base64'), E'+/\\n', '-_'), '=')"""
+
+
+def _detail_statement(include_voters: bool):
+    question_voters = _voters_json("question_voter", "question_id", "q.id") if include_voters else "'[]'::json"
+    answer_voters = _voters_json("answer_voter", "answer_id", "a.id") if include_voters else "'[]'::json"
+    return text(f"""
+        SELECT json_build_object(
+            'id', q.id,
+            'subject', q.subject,
+            'content', q.content,
+            'create_date', q.create_date,
+            'modify_date', q.modify_date,
+            'user', (SELECT {_user_json("qu")} FROM users qu WHERE qu.id = q.user_id),
+            'answer_count', q.answer_count,
+            'vote_count', q.vote_count,
+            'answers', coalesce(page.answers, '[]'::json),
+            'answers_next_cursor', CASE WHEN page.size = :answer_limit THEN page.last_cursor END,
+            'voter', {question_voters}
+        )::text
+        FROM question q
+        CROSS JOIN LATERAL (
+            SELECT json_agg(json_build_object(
+                       'id', a.id,
+                       'content', a.content,
+                       'create_date', a.create_date,
+                       'modify_date', a.modify_date,
+                       'user', CASE WHEN au.id IS NULL THEN NULL ELSE {_user_json("au")} END,
+                       'question_id', a.question_id,
+                       'vote_count', a.vote_count,
+                       'voter', {answer_voters}
+                   ) ORDER BY a.create_date, a.id) AS answers,
+                   count(*) AS size,
+                   (array_agg({_ANSWER_CURSOR} ORDER BY a.create_date DESC, a.id DESC))[1] AS last_cursor
+              FROM (SELECT * FROM answer
+                     WHERE question_id = q.id
+                     ORDER BY create_date, id
+                     LIMIT :answer_limit) a
+              LEFT JOIN users au ON au.id = a.user_id
+        ) page
+        WHERE q.id = :question_id
+    """)
+
+
+# include_voters -> 문장 (투표자 포함 여부별 고정 문장, prepared statement 캐시 적중)
+QUESTION_DETAIL_JSON = {
+    False: _detail_statement(False),
+    True: _detail_statement(True),
+}
+
+
+async def get_question_detail_json(db: AsyncSession, question_id: int, include_voters: bool = False,
+                                   answer_limit: int = QUESTION_DETAIL_ANSWER_LIMIT) -> Optional[str]:
+    """질문 상세 응답 본문(JSON 문자열) - 질문이 없으면 None"""
+    params = {"question_id": question_id, "answer_limit": answer_limit}
+    result = await db.execute(QUESTION_DETAIL_JSON[include_voters], params)
+    return result.scalar_one_or_none()
+
+
+def get_question_detail_json_sync(db: Session, question_id: int, include_voters: bool = False,
+                                  answer_limit: int = QUESTION_DETAIL_ANSWER_LIMIT) -> Optional[str]:
+    """동기 버전의 get_question_detail_json"""
+    params = {"question_id": question_id, "answer_limit": answer_limit}
+    return db.execute(QUESTION_DETAIL_JSON[include_voters], params).scalar_one_or_none()
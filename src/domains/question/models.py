@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Table, Index
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import deferred, relationship
 
 from src.database.database import Base
 
@@ -8,7 +9,7 @@ question_voter = Table(
     'question_voter',
     Base.metadata,
     Column('user_id', Integer, ForeignKey('users.id'), primary_key=True),
-    Column('question_id', Integer, ForeignKey('question.id'), primary_key=True)
+    Column('question_id', Integer, ForeignKey('question.id', ondelete='CASCADE'), primary_key=True)
 )
 
 
@@ -22,4 +23,16 @@ class Question(Base):
     modify_date = Column(DateTime, nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)
     user = relationship("User", backref="question_users")
-    voter = relationship('User', secondary=question_voter, backref='question_voters')
\ No newline at end of file
+    # 투표자 목록은 명시적으로 요청할 때만 로드 (selectinload(Question.voter)), 건수는 vote_count 사용
+    voter = relationship('User', secondary=question_voter, backref='question_voters',
+                         lazy='noload', passive_deletes=True)
+    # 비정규화 카운터 (src/domains/question/counters.py 에서 같은 트랜잭션으로 갱신)
+    vote_count = Column(Integer, nullable=False, default=0, server_default="0")
+    answer_count = Column(Integer, nullable=False, default=0, server_default="0")
+    # 전문 검색 문서 (제목/내용/작성자/답변, src/domains/question/search.py 에서 갱신) - 조회 시 로드하지 않음
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
+    __table_args__ = (
+        Index("ix_question_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_question_create_date_id", "create_date", "id"),  # 최신순 목록 / 커서 페이지네이션
+    )
@@ -1,11 +1,21 @@
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Literal, Optional
+
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from starlette import status
 
-from src.database.database import get_db, get_async_db
+from src.common.http_cache import cache_headers, etag_matches, make_etag, not_modified
+from src.common.pagination import InvalidCursorError, decode_cursor, next_cursor
+from src.database.database import get_db, get_async_db, get_async_read_db
+from src.domains.answer.service import ANSWER_PAGE_MAX_SIZE
 from src.domains.question import schemas as question_schema, service as question_service
-from src.domains.user.schemas import User
-from src.domains.user.router import get_current_user_with_async
+from src.domains.question.cache import (
+    DETAIL_CACHE_CONTROL, LIST_CACHE_CONTROL, LIST_NAMESPACE, question_detail_cache, question_list_cache
+)
+from src.domains.question.detail_json import LOADER_JSON, QUESTION_DETAIL_LOADER, get_question_detail_json
+from src.domains.user.schemas import User, UserClaims
+from src.domains.user.router import get_current_user_claims, get_current_user_with_async
 
 router = APIRouter(
     prefix="/api/question",
@@ -13,19 +23,82 @@ router = APIRouter(
 
 
 @router.get("/list", response_model=question_schema.QuestionList)
-async def question_list(db: AsyncSession = Depends(get_async_db), page: int = 0, size: int = 10, keyword: str = ''):
-    total, _question_list = await question_service.get_question_list(
-        db, offset=page * size, limit=size, keyword=keyword
-    )
-    return {"total": total, "question_list": _question_list}
+async def question_list(db: AsyncSession = Depends(get_async_db), page: int = 0, size: int = 10, keyword: str = '',
+                        cursor: Optional[str] = None, if_none_match: Optional[str] = Header(default=None)):
+    """질문 목록 (page 기반 offset 모드, cursor 를 주면 커서 모드 - 응답의 next_cursor 로 다음 페이지 조회)
+
+    검색어가 있는 offset 모드는 관련도순이라 next_cursor 를 주지 않는다 (다음 페이지는 page 로 조회).
+
+    직렬화된 응답을 Redis 에 캐시하고 (src/domains/question/cache.py), 본문 해시를 ETag 로 반환한다.
+    캐시 미스는 Primary 에서 조회한다: 쓰기 직후 무효화된 새 버전에 지연된 Replica 의 이전 목록이 저장되면
+    TTL 동안 그대로 제공되기 때문 (세션은 render 에서만 커넥션을 얻으므로 캐시 적중 시 DB 를 사용하지 않음).
+    """
+    try:
+        after = decode_cursor(cursor, (datetime, int)) if cursor else None
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    async def render() -> str:
+        total, _question_list = await question_service.get_question_list(
+            db, offset=page * size, limit=size, keyword=keyword, after=after
+        )
+        return question_schema.QuestionList.model_validate({
+            "total": total.total,
+            "count_strategy": total.strategy,
+            "question_list": _question_list,
+            "next_cursor": None if question_service.is_rank_ordered(keyword, after)
+            else next_cursor(_question_list, size, "create_date", "id"),
+        }, from_attributes=True).model_dump_json()
+
+    body = await question_list_cache.get_or_render(LIST_NAMESPACE, (page, size, keyword, cursor), render)
+    etag = make_etag(body)
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, LIST_CACHE_CONTROL)
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag, LIST_CACHE_CONTROL))
 
 
 @router.get("/detail/{question_id}", response_model=question_schema.Question)
-async def question_detail(question_id: int, db: AsyncSession = Depends(get_async_db)):
-    question = await question_service.get_question(db, question_id)
-    if question is None:
+async def question_detail(question_id: int, include_voters: bool = False,
+                          answer_size: int = Query(default=question_service.QUESTION_DETAIL_ANSWER_LIMIT,
+                                                   ge=1, le=ANSWER_PAGE_MAX_SIZE),
+                          loader: Literal["orm", "json"] = QUESTION_DETAIL_LOADER,
+                          if_none_match: Optional[str] = Header(default=None),
+                          db: AsyncSession = Depends(get_async_read_db)):
+    """질문 상세 - 투표자 목록(voter)은 include_voters=true 일 때만 채운다 (건수는 vote_count)
+
+    답변은 작성순 첫 answer_size 개만 포함하고, 나머지는 answers_next_cursor 로
+    /api/answer/list/{question_id} 에서 이어서 조회한다 (전체 건수는 answer_count).
+
+    ETag 는 관계를 로드하지 않는 버전 스탬프(수정 시각 + 카운터)로 계산하여, If-None-Match 가
+    일치하면 304 를 반환한다. 본문은 ETag 별로 Redis 에 캐시한다 (질문 id 별로 무효화).
+    loader: orm (selectinload + pydantic) / json (단일 쿼리 JSON, src/domains/question/detail_json.py)
+    """
+    stamp = await question_service.get_question_stamp(db, question_id)
+    if stamp is None:
         raise HTTPException(status_code=404, detail="Question not found")
-    return question
+    etag = make_etag(question_id, include_voters, answer_size, loader, *stamp)  # 로더마다 본문 바이트가 다름
+    if etag_matches(if_none_match, etag):
+        return not_modified(etag, DETAIL_CACHE_CONTROL)
+
+    async def render() -> str:
+        if loader == LOADER_JSON:
+            body = await get_question_detail_json(db, question_id, include_voters=include_voters,
+                                                  answer_limit=answer_size)
+            if body is None:
+                raise HTTPException(status_code=404, detail="Question not found")
+            return body
+        question, answers_next_cursor = await question_service.get_question_detail(
+            db, question_id, include_voters=include_voters, answer_limit=answer_size
+        )
+        if question is None:
+            raise HTTPException(status_code=404, detail="Question not found")
+        detail = question_schema.Question.model_validate(question, from_attributes=True)
+        detail.answers_next_cursor = answers_next_cursor
+        return detail.model_dump_json()
+
+    body = await question_detail_cache.get_or_render(str(question_id), (include_voters, answer_size, loader, etag),
+                                                      render)
+    return Response(content=body, media_type="application/json", headers=cache_headers(etag, DETAIL_CACHE_CONTROL))
 
 
 @router.post("/create", status_code=status.HTTP_204_NO_CONTENT)
@@ -39,7 +112,7 @@ async def question_create(_question_create: question_schema.QuestionCreate,
 @router.put("/update", status_code=status.HTTP_204_NO_CONTENT)
 async def question_update(_question_update: question_schema.QuestionUpdate,
                           db: AsyncSession = Depends(get_async_db),
-                          current_user: User = Depends(get_current_user_with_async)):
+                          current_user: UserClaims = Depends(get_current_user_claims)):
     question_model = await question_service.get_question(db, question_id=_question_update.question_id)
     if not question_model:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
@@ -55,7 +128,7 @@ async def question_update(_question_update: question_schema.QuestionUpdate,
 @router.delete("/delete", status_code=status.HTTP_204_NO_CONTENT)
 async def question_delete(_question_delete: question_schema.QuestionDelete,
                           db: AsyncSession = Depends(get_async_db),
-                          current_user: User = Depends(get_current_user_with_async)):
+                          current_user: UserClaims = Depends(get_current_user_claims)):
     question_model = await question_service.get_question(db, question_id=_question_delete.question_id)
     if not question_model:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
@@ -69,9 +142,8 @@ async def question_delete(_question_delete: question_schema.QuestionDelete,
 @router.post("/vote", status_code=status.HTTP_204_NO_CONTENT)
 async def question_vote(_question_vote: question_schema.QuestionVote,
                         db: AsyncSession = Depends(get_async_db),
-                        current_user: User = Depends(get_current_user_with_async)):
-    question_model = await question_service.get_question(db, question_id=_question_vote.question_id)
-    if not question_model:
+                        current_user: UserClaims = Depends(get_current_user_claims)):
+    # 투표/카운터/알림을 한 트랜잭션으로 처리 (질문을 미리 로드하지 않음)
+    if not await question_service.vote_question(db, question_id=_question_vote.question_id, db_user=current_user):
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST,
                             detail="데이터를 찾을수 없습니다.")
-    await question_service.vote_question(db, question_model=question_model, db_user=current_user)
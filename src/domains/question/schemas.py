@@ -9,20 +9,29 @@ from src.domains.answer.schemas import Answer
 from src.domains.user.schemas import User
 
 
-class Question(BaseModel):
+class QuestionListItem(BaseModel):
+    """목록 항목 - 답변/투표는 카운터만 반환 (관계를 로드하지 않음)"""
     id: int
     subject: str
     content: str
     create_date: datetime.datetime
     modify_date: Union[datetime.datetime, None] = None
-    answers: list[Answer] = []
     user: Union[User, None]
-    voter: list[User] = []
+    answer_count: int = 0
+    vote_count: int = 0
+
+
+class Question(QuestionListItem):
+    answers: list[Answer] = []  # 작성순 첫 페이지 (answer_size 개)
+    answers_next_cursor: Union[str, None] = None  # 다음 답변 페이지 커서 (/api/answer/list, 마지막이면 None)
+    voter: list[User] = []  # include_voters=true 일 때만 채움
 
 
 class QuestionList(BaseModel):
     total: int = 0
-    question_list: list[Question] = []
+    count_strategy: str = "exact"  # total 계산 전략 (exact / cached / estimated)
+    question_list: list[QuestionListItem] = []
+    next_cursor: Union[str, None] = None  # 다음 페이지 커서 (마지막 페이지면 None)
 
 
 class QuestionCreate(BaseModel):
@@ -0,0 +1,100 @@
+"""질문 전문 검색 (tsvector + GIN)
+
+질문마다 검색 문서(question.search_vector)를 유지하고 GIN 인덱스로 검색합니다.
+검색 문서 구성 (가중치):
+    A 질문 제목 / B 질문 내용 / C 질문 작성자 / D 답변 내용 + 답변 작성자
+
+- 한국어 형태소 사전이 없으므로 'simple' 설정(소문자화 + 공백/기호 분리)을 사용하고,
+  검색어는 토큰별 접두어 일치(토큰:*)로 AND 검색한다. ('질문' → '질문을', '질문입니다' 일치)
+- 질문/답변이 flush 될 때 같은 트랜잭션에서 해당 질문의 검색 문서를 다시 계산한다.
+  (Session after_flush 이벤트, 동기/비동기 세션 모두 적용)
+- 기존 데이터는 scripts/rebuild_question_search.py 로 일괄 생성한다.
+"""
+
+from itertools import chain
+from typing import Optional, Set
+
+from sqlalchemy import bindparam, event, func, inspect, text
+from sqlalchemy.orm import Session
+
+from src.domains.answer.models import Answer
+from src.domains.question.models import Question
+
+SEARCH_CONFIG = "simple"
+
+# 검색 문서 계산식 (q = question 별칭)
+SEARCH_DOCUMENT_SQL = f"""
+    setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(q.subject, '')), 'A')
+    || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(q.content, '')), 'B')
+    || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(
+        (SELECT u.username FROM users u WHERE u.id = q.user_id), '')), 'C')
+    || setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(
+        (SELECT string_agg(a.content || ' ' || coalesce(u.username, ''), ' ')
+           FROM answer a LEFT JOIN users u ON u.id = a.user_id
+          WHERE a.question_id = q.id), '')), 'D')
+"""
+
+REFRESH_SEARCH_DOCUMENTS = text(
+    f"UPDATE question AS q SET search_vector = {SEARCH_DOCUMENT_SQL} WHERE q.id IN :question_ids"
+).bindparams(bindparam("question_ids", expanding=True))
+
+# 일괄 생성용 (id 구간 단위)
+REBUILD_SEARCH_DOCUMENTS = text(
+    f"UPDATE question AS q SET search_vector = {SEARCH_DOCUMENT_SQL} WHERE q.id > :after_id AND q.id <= :until_id"
+)
+
+
+def build_tsquery(keyword: str) -> Optional[str]:
+    """검색어를 토큰별 접두어 AND 검색 tsquery 문자열로 변환 (토큰이 없으면 None)
+
+    각 토큰을 따옴표로 감싸 tsquery 연산자(&, |, !, :)가 그대로 해석되지 않게 한다.
+    """
+    tokens = [token.replace("\\", "\\\\").replace("'", "''") for token in keyword.split()]
+    if not tokens:
+        return None
+    return " & ".join(f"'{token}':*" for token in tokens)
+
+
+def search_condition(keyword: str):
+    """(검색 조건, 정렬용 rank) - 검색어가 비어 있으면 (None, None)"""
+    query_text = build_tsquery(keyword)
+    if query_text is None:
+        return None, None
+    ts_query = func.to_tsquery(SEARCH_CONFIG, query_text)
+    return Question.search_vector.op("@@")(ts_query), func.ts_rank_cd(Question.search_vector, ts_query)
+
+
+# ── 검색 문서 갱신 ──────────────────────────────────────────────────────────
+
+def _changed(obj, *attributes: str) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[name].history.has_changes() for name in attributes)
+
+
+def touched_question_ids(session: Session) -> Set[int]:
+    """이번 flush 에서 검색 문서에 영향을 준 질문 id (투표 등 다른 변경은 제외)"""
+    question_ids: Set[int] = set()
+    deleted_question_ids: Set[int] = set()
+    for obj in chain(session.new, session.dirty):
+        if isinstance(obj, Question) and (obj in session.new or _changed(obj, "subject", "content", "user_id")):
+            question_ids.add(obj.id)
+        elif isinstance(obj, Answer) and (obj in session.new or _changed(obj, "content", "question_id", "user_id")):
+            question_ids.add(obj.question_id)
+            question_ids.update(inspect(obj).attrs.question_id.history.deleted or ())
+    for obj in session.deleted:
+        if isinstance(obj, Answer):
+            question_ids.add(obj.question_id)
+        elif isinstance(obj, Question):
+            deleted_question_ids.add(obj.id)
+    return {qid for qid in question_ids if qid is not None} - deleted_question_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_search_documents(session: Session, flush_context) -> None:
+    question_ids = touched_question_ids(session)
+    if not question_ids:
+        return
+    connection = session.connection()
+    if connection.dialect.name != "postgresql":
+        return
+    connection.execute(REFRESH_SEARCH_DOCUMENTS, {"question_ids": sorted(question_ids)})
@@ -1,71 +1,144 @@
+import os
 from datetime import datetime
+from typing import Optional, Tuple
 
-from sqlalchemy import select, func
+from sqlalchemy import func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 
+from src.common.pagination import next_cursor
+from src.database.row_count import count_cache, count_rows
 from src.domains.answer.models import Answer
+from src.domains.answer.service import answer_cursor_attributes, answer_page_statement
+from src.domains.question.cache import invalidate_question
+from src.domains.question.counters import VOTE_STATEMENTS
 from src.domains.question.models import Question
 from src.domains.question.schemas import QuestionCreate, QuestionUpdate
+from src.domains.question.search import build_tsquery, search_condition
 from src.domains.user.models import User
+from src.domains.user.schemas import UserClaims
 from src.domains.notification import service as notification_service
 
+QUESTION_LIST_COUNT = "question_list"  # 전체 건수 전략/캐시 대상 이름
+# 상세 응답에 포함할 첫 답변 페이지 크기 (나머지는 /api/answer/list 로 조회)
+QUESTION_DETAIL_ANSWER_LIMIT = int(os.getenv("QUESTION_DETAIL_ANSWER_LIMIT", 20))
+
+
+def is_rank_ordered(keyword: str, after: Optional[Tuple[datetime, int]] = None) -> bool:
+    """관련도순 목록 여부 (검색어가 있는 offset 모드)
+
+    관련도순 페이지는 (create_date, id) 커서로 이어서 조회할 수 없으므로 next_cursor 를 발급하지 않는다
+    (다음 페이지는 page 로 조회).
+    """
+    return after is None and build_tsquery(keyword) is not None
+
 
 # offset: 시작 위치, limit: 가져올 데이터 수
-async def get_question_list(db: AsyncSession, offset: int = 0, limit: int = 10, keyword: str = ''):
+async def get_question_list(db: AsyncSession, offset: int = 0, limit: int = 10, keyword: str = '',
+                            after: Optional[Tuple[datetime, int]] = None):
+    """질문 목록
+
+    - keyword 가 있으면 검색 문서 GIN 인덱스로 검색 (offset 모드는 관련도 → 최신순 정렬, is_rank_ordered)
+    - after=(create_date, id) 이면 커서 모드: 해당 질문 다음부터 최신순으로 조회 (offset 무시, 검색 시에도 최신순)
+    - 전체 건수는 DB_COUNT_STRATEGY(_QUESTION_LIST) 전략으로 계산 (src/database/row_count.py)
+    - 답변/투표 수는 카운터 컬럼(answer_count, vote_count)을 사용하므로 작성자만 함께 로드
+    """
     query = select(Question)
-    if keyword:
-        search = '%%{}%%'.format(keyword)
-        sub_query = select(Answer.question_id, Answer.content, User.username) \
-            .outerjoin(User, Answer.user_id == User.id).subquery()
-        query = query \
-            .outerjoin(User) \
-            .outerjoin(sub_query, sub_query.c.question_id == Question.id) \
-            .filter(Question.subject.ilike(search) |  # 질문제목
-                    Question.content.ilike(search) |  # 질문내용
-                    User.username.ilike(search) |  # 질문작성자
-                    sub_query.c.content.ilike(search) |  # 답변내용
-                    sub_query.c.username.ilike(search)  # 답변작성자
-                    )
-    total = await db.execute(select(func.count()).select_from(query))
+    order_by = [Question.create_date.desc(), Question.id.desc()]
+    condition, rank = search_condition(keyword)
+    if condition is not None:
+        query = query.where(condition)
+        if is_rank_ordered(keyword, after):
+            order_by.insert(0, rank.desc())
+    total = await count_rows(db, QUESTION_LIST_COUNT, query, cache_key=(keyword,))
+
+    if after is not None:
+        query = query.where(tuple_(Question.create_date, Question.id) < tuple_(*after))
+        offset = 0
     question_list = await db.execute(query.offset(offset).limit(limit)
-                                     .order_by(Question.create_date.desc())
-                                     .distinct()
-                                     .options(selectinload(Question.answers).selectinload(Answer.voter))
-                                     .options(selectinload(Question.answers).selectinload(Answer.user))
+                                     .order_by(*order_by)
                                      .options(selectinload(Question.user))
-                                     .options(selectinload(Question.voter))
                                      )
-    return total.scalar_one(), question_list.scalars().fetchall()  # (전체 건수, 페이징 적용된 질문 목록)
+    return total, question_list.scalars().fetchall()  # (전체 건수와 계산 전략, 페이징 적용된 질문 목록)
+
+
+def _question_detail_options(include_voters: bool):
+    """상세 조회 로딩 옵션 - 투표자 목록은 include_voters 일 때만 로드 (건수는 vote_count)"""
+    options = [
+        selectinload(Question.user),
+        selectinload(Question.answers).selectinload(Answer.user),
+    ]
+    if include_voters:
+        options += [
+            selectinload(Question.voter),
+            selectinload(Question.answers).selectinload(Answer.voter),
+        ]
+    return options
 
 
-async def get_question(db: AsyncSession, question_id: int):
+async def get_question(db: AsyncSession, question_id: int, include_voters: bool = False):
     stmt = (
         select(Question)
         .where(Question.id == question_id)
-        .options(
-            selectinload(Question.user),
-            selectinload(Question.voter),
-            selectinload(Question.answers).selectinload(Answer.user),
-            selectinload(Question.answers).selectinload(Answer.voter)
-        )
+        .options(*_question_detail_options(include_voters))
     )
     result = await db.execute(stmt)
     question = result.scalars().one_or_none()
     return question
 
 
-def get_question_sync(db: Session, question_id: int):
+async def get_question_detail(db: AsyncSession, question_id: int, include_voters: bool = False,
+                              answer_limit: int = QUESTION_DETAIL_ANSWER_LIMIT):
+    """질문 + 첫 답변 페이지 (작성순 answer_limit 개)
+
+    답변 전체를 로드하지 않고 answer_page_statement 로 한 페이지만 조회하여 question.answers 에 채운다.
+
+    Returns:
+        (question, answers_next_cursor) - 질문이 없으면 (None, None)
+    """
+    options = [selectinload(Question.user)]
+    if include_voters:
+        options.append(selectinload(Question.voter))
+    result = await db.execute(select(Question).where(Question.id == question_id).options(*options))
+    question = result.scalars().one_or_none()
+    if question is None:
+        return None, None
+
+    answers = (await db.execute(
+        answer_page_statement(question_id, answer_limit, include_voters=include_voters)
+    )).scalars().all()
+    set_committed_value(question, "answers", answers)  # lazy load 없이 관계에 페이지만 설정
+    return question, next_cursor(answers, answer_limit, *answer_cursor_attributes("create_date"))
+
+
+async def get_question_stamp(db: AsyncSession, question_id: int):
+    """상세 응답의 버전 스탬프 (질문이 없으면 None) - ETag 계산용, 관계를 로드하지 않음
+
+    질문 수정 시각/카운터와 답변들의 최종 수정 시각/투표 합계로 구성한다.
+    (투표는 취소가 없어 합계가 같으면 투표자 목록도 같다)
+    """
+    answers = select(Answer).where(Answer.question_id == Question.id)
+    stmt = select(
+        Question.modify_date,
+        Question.vote_count,
+        Question.answer_count,
+        answers.with_only_columns(
+            func.max(func.coalesce(Answer.modify_date, Answer.create_date))
+        ).scalar_subquery().label("answers_modified"),
+        answers.with_only_columns(
+            func.coalesce(func.sum(Answer.vote_count), 0)
+        ).scalar_subquery().label("answer_votes"),
+    ).where(Question.id == question_id)
+    return (await db.execute(stmt)).one_or_none()
+
+
+def get_question_sync(db: Session, question_id: int, include_voters: bool = False):
     """동기 버전의 get_question (sync 라우터용)"""
     stmt = (
         select(Question)
         .where(Question.id == question_id)
-        .options(
-            selectinload(Question.user),
-            selectinload(Question.voter),
-            selectinload(Question.answers).selectinload(Answer.user),
-            selectinload(Question.answers).selectinload(Answer.voter)
-        )
+        .options(*_question_detail_options(include_voters))
     )
     result = db.execute(stmt)
     question = result.scalars().one_or_none()
@@ -79,32 +152,54 @@ async def create_question(db: AsyncSession, question_create: QuestionCreate, use
                            user=user)
     db.add(db_question)
     await db.commit()
+    count_cache.invalidate_target(QUESTION_LIST_COUNT)
+    await invalidate_question()
 
 
 async def update_question(db: AsyncSession, question_model: Question, question_update: QuestionUpdate):
     question_model.subject = question_update.subject
     question_model.content = question_update.content
     question_model.modify_date = datetime.now()
+    question_id = question_model.id
     db.add(question_model)
     await db.commit()
+    await invalidate_question(question_id)
 
 
 async def delete_question(db: AsyncSession, question_model: Question):
+    question_id = question_model.id
     await db.delete(question_model)
     await db.commit()
-
-
-async def vote_question(db: AsyncSession, question_model: Question, db_user: User):
-    question_model.voter.append(db_user)
+    count_cache.invalidate_target(QUESTION_LIST_COUNT)
+    await invalidate_question(question_id)
+
+
+async def vote_question(db: AsyncSession, question_id: int, db_user: UserClaims) -> bool:
+    """투표 추가 + vote_count 증가 + 알림 생성을 한 트랜잭션으로 처리
+
+    질문/투표자 목록을 로드하지 않고 한 문장으로 처리하므로 기존 투표 수와 무관하게 일정한 비용.
+    이미 투표했으면 아무것도 바꾸지 않는다.
+
+    Returns:
+        질문 존재 여부
+    """
+    row = (await db.execute(
+        VOTE_STATEMENTS["question"], {"target_id": question_id, "user_id": db_user.id}
+    )).one_or_none()
+    if row is None:
+        return False
+
+    if row.voted:
+        notification_service.add_notification(
+            db,
+            user_id=row.owner_id,
+            actor_user_id=db_user.id,
+            event_type="question_voted",
+            resource_type="question",
+            resource_id=question_id,
+            message=f"{db_user.username}님이 회원님의 질문에 투표했습니다.",
+        )
     await db.commit()
-
-    # 알림 생성
-    await notification_service.create_notification(
-        db=db,
-        user_id=question_model.user_id,
-        actor_user_id=db_user.id,
-        event_type="question_voted",
-        resource_type="question",
-        resource_id=question_model.id,
-        message=f"{db_user.username}님이 회원님의 질문에 투표했습니다.",
-    )
+    if row.voted:
+        await invalidate_question(question_id)
+    return True
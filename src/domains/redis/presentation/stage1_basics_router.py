@@ -23,14 +23,6 @@ from src.domains.redis.presentation.schemas import RedisLabResponse, SetKeyReque
 router = APIRouter(prefix="/stage1", tags=["Redis-1단계: 기초"])
 
 
-# ──────────────────────────────────────────
-# 헬퍼
-# ──────────────────────────────────────────
-
-async def _get_redis() -> aioredis.Redis:
-    return await get_async_redis_client()
-
-
 # ──────────────────────────────────────────
 # 1-1. SET / GET / DEL
 # ──────────────────────────────────────────
@@ -51,8 +43,7 @@ Redis는 모든 값을 **바이트 배열**로 저장한다.
 `decode_responses=True` 옵션을 주면 Python str로 자동 변환된다.
 """,
 )
-async def set_key(req: SetKeyRequest):
-    redis = await _get_redis()
+async def set_key(req: SetKeyRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     full_key = make_key("stage1", req.key)
 
     if req.ttl:
@@ -83,8 +74,7 @@ async def set_key(req: SetKeyRequest):
 - 만료된 키도 `nil` 반환 (Lazy Expiration)
 """,
 )
-async def get_key(key: str):
-    redis = await _get_redis()
+async def get_key(key: str, redis: aioredis.Redis = Depends(get_async_redis_client)):
     full_key = make_key("stage1", key)
     value = await redis.get(full_key)
 
@@ -113,8 +103,7 @@ async def get_key(key: str):
 대용량 값 삭제 시 `UNLINK`를 권장한다. (5단계에서 자세히 다룸)
 """,
 )
-async def del_key(key: str):
-    redis = await _get_redis()
+async def del_key(key: str, redis: aioredis.Redis = Depends(get_async_redis_client)):
     full_key = make_key("stage1", key)
     deleted_count = await redis.delete(full_key)
 
@@ -150,8 +139,7 @@ async def del_key(key: str):
 2. Active Expiration: 백그라운드에서 주기적으로 만료 키 정리
 """,
 )
-async def expire_demo():
-    redis = await _get_redis()
+async def expire_demo(redis: aioredis.Redis = Depends(get_async_redis_client)):
     key = make_key("stage1", "expire_demo")
 
     # 1) 키 저장 (TTL 없음)
@@ -202,8 +190,7 @@ async def expire_demo():
     response_model=RedisLabResponse,
     summary="[1-3] EXISTS / TYPE — 키 존재 여부 및 타입 확인",
 )
-async def exists_type_demo(key: str):
-    redis = await _get_redis()
+async def exists_type_demo(key: str, redis: aioredis.Redis = Depends(get_async_redis_client)):
     full_key = make_key("stage1", key)
 
     exists = await redis.exists(full_key)
@@ -247,8 +234,7 @@ async def exists_type_demo(key: str):
 - 중간에 추가/삭제된 키는 누락되거나 중복될 수 있음
 """,
 )
-async def scan_vs_keys_demo():
-    redis = await _get_redis()
+async def scan_vs_keys_demo(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     # 테스트용 키 10개 생성
     test_keys = []
@@ -303,8 +289,7 @@ async def scan_vs_keys_demo():
     summary="[유틸] Stage 1 키 전체 삭제",
     description="실습 중 생성된 `redis_lab:stage1:*` 키를 모두 삭제한다.",
 )
-async def cleanup_stage1():
-    redis = await _get_redis()
+async def cleanup_stage1(redis: aioredis.Redis = Depends(get_async_redis_client)):
     pattern = make_key("stage1", "*")
     deleted = 0
     cursor = 0
@@ -16,7 +16,7 @@ import time
 from typing import Any, Dict, List
 
 import aioredis
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from src.database.database import get_async_redis_client
 from src.domains.redis.constants import (
@@ -42,10 +42,6 @@ from src.domains.redis.presentation.schemas import (
 router = APIRouter(prefix="/stage2", tags=["Redis-2단계: 자료구조"])
 
 
-async def _get_redis() -> aioredis.Redis:
-    return await get_async_redis_client()
-
-
 # ══════════════════════════════════════════
 # 2-1. String — 카운터
 # ══════════════════════════════════════════
@@ -66,8 +62,7 @@ Single-thread 특성 덕분에 별도 Lock 없이 동시성 안전 카운터를
 - 좋아요 수
 """,
 )
-async def string_counter_incr():
-    redis = await _get_redis()
+async def string_counter_incr(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     # INCR: 1씩 증가 (키 없으면 0에서 시작)
     v1 = await redis.incr(STAGE2_STRING_COUNTER)
@@ -105,8 +100,7 @@ async def string_counter_incr():
     response_model=RedisLabResponse,
     summary="[2-1] String — 카운터 초기화",
 )
-async def string_counter_reset():
-    redis = await _get_redis()
+async def string_counter_reset(redis: aioredis.Redis = Depends(get_async_redis_client)):
     await redis.set(STAGE2_STRING_COUNTER, 0)
     return RedisLabResponse(
         stage="2단계: 자료구조",
@@ -139,8 +133,7 @@ async def string_counter_reset():
 - 그 이상 → `quicklist` (연결 리스트)
 """,
 )
-async def list_enqueue(req: ListPushRequest):
-    redis = await _get_redis()
+async def list_enqueue(req: ListPushRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     length = await redis.rpush(STAGE2_LIST_QUEUE, req.value)
 
     return RedisLabResponse(
@@ -157,8 +150,7 @@ async def list_enqueue(req: ListPushRequest):
     response_model=RedisLabResponse,
     summary="[2-2] List — LPOP (큐 dequeue)",
 )
-async def list_dequeue():
-    redis = await _get_redis()
+async def list_dequeue(redis: aioredis.Redis = Depends(get_async_redis_client)):
     value = await redis.lpop(STAGE2_LIST_QUEUE)
     length = await redis.llen(STAGE2_LIST_QUEUE)
 
@@ -184,8 +176,7 @@ async def list_dequeue():
 이 패턴으로 최신 5개 방문 페이지, 최근 검색어 등을 O(1)으로 관리한다.
 """,
 )
-async def list_recent_add(req: ListPushRequest):
-    redis = await _get_redis()
+async def list_recent_add(req: ListPushRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     max_recent = 5
 
     length = await redis.lpush(STAGE2_LIST_RECENT, req.value)
@@ -232,8 +223,7 @@ async def list_recent_add(req: ListPushRequest):
 - 온라인 사용자 목록
 """,
 )
-async def set_add_tag(req: SetAddRequest):
-    redis = await _get_redis()
+async def set_add_tag(req: SetAddRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     added = await redis.sadd(STAGE2_SET_TAGS, req.member)
     members = await redis.smembers(STAGE2_SET_TAGS)
     is_member = await redis.sismember(STAGE2_SET_TAGS, req.member)
@@ -257,8 +247,7 @@ async def set_add_tag(req: SetAddRequest):
     summary="[2-3] Set — 집합 연산 (SUNION/SINTER/SDIFF)",
     description="두 사용자의 태그 집합으로 합집합·교집합·차집합을 시연한다.",
 )
-async def set_operations():
-    redis = await _get_redis()
+async def set_operations(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     key_a = make_key("stage2", "set", "user_a_tags")
     key_b = make_key("stage2", "set", "user_b_tags")
@@ -316,8 +305,7 @@ async def set_operations():
 - 그 이상 → `skiplist` (O(log N) 삽입/삭제/조회)
 """,
 )
-async def zset_add(req: ZSetAddRequest):
-    redis = await _get_redis()
+async def zset_add(req: ZSetAddRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     await redis.zadd(STAGE2_ZSET_RANKING, {req.member: req.score})
 
     # 상위 10명 조회 (점수 내림차순)
@@ -346,8 +334,7 @@ async def zset_add(req: ZSetAddRequest):
     response_model=RedisLabResponse,
     summary="[2-4] Sorted Set — 상위 랭킹 조회",
 )
-async def zset_top_ranking(top: int = 5):
-    redis = await _get_redis()
+async def zset_top_ranking(top: int = 5, redis: aioredis.Redis = Depends(get_async_redis_client)):
     ranking = await redis.zrange(STAGE2_ZSET_RANKING, 0, top - 1, desc=True, withscores=True)
     total = await redis.zcard(STAGE2_ZSET_RANKING)
 
@@ -392,8 +379,7 @@ async def zset_top_ranking(top: int = 5):
 Hash는 필드 단위로 읽고 쓸 수 있어 메모리와 처리량이 효율적이다.
 """,
 )
-async def hash_set(user_id: str, req: HashSetRequest):
-    redis = await _get_redis()
+async def hash_set(user_id: str, req: HashSetRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     key = f"{STAGE2_HASH_USER}:{user_id}"
 
     await redis.hset(key, req.field, req.value)
@@ -416,8 +402,7 @@ async def hash_set(user_id: str, req: HashSetRequest):
     response_model=RedisLabResponse,
     summary="[2-5] Hash — HGETALL 전체 프로필 조회",
 )
-async def hash_get(user_id: str):
-    redis = await _get_redis()
+async def hash_get(user_id: str, redis: aioredis.Redis = Depends(get_async_redis_client)):
     key = f"{STAGE2_HASH_USER}:{user_id}"
     profile = await redis.hgetall(key)
 
@@ -456,8 +441,7 @@ async def hash_get(user_id: str):
 HLL은 12KB로 해결된다.
 """,
 )
-async def hll_add_visitor(req: HyperLogLogAddRequest):
-    redis = await _get_redis()
+async def hll_add_visitor(req: HyperLogLogAddRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     added = await redis.pfadd(STAGE2_HLL_VISITORS, req.user_id)
     count = await redis.pfcount(STAGE2_HLL_VISITORS)
@@ -490,8 +474,7 @@ async def hll_add_visitor(req: HyperLogLogAddRequest):
     response_model=RedisLabResponse,
     summary="[유틸] Stage 2 키 전체 삭제",
 )
-async def cleanup_stage2():
-    redis = await _get_redis()
+async def cleanup_stage2(redis: aioredis.Redis = Depends(get_async_redis_client)):
     pattern = make_key("stage2", "*")
     deleted = 0
     cursor = 0
@@ -18,7 +18,7 @@ import uuid
 from typing import Any, Dict, Optional
 
 import aioredis
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 
 from src.database.database import get_async_redis_client
 from src.domains.redis.constants import (
@@ -41,10 +41,6 @@ from src.domains.redis.presentation.schemas import (
 router = APIRouter(prefix="/stage3", tags=["Redis-3단계: 실무 패턴"])
 
 
-async def _get_redis() -> aioredis.Redis:
-    return await get_async_redis_client()
-
-
 # ══════════════════════════════════════════
 # 3-1. Cache-Aside (Lazy Loading)
 # ══════════════════════════════════════════
@@ -83,8 +79,7 @@ async def _fake_db_query(resource_id: int) -> Dict[str, Any]:
 해결: Mutex Lock, Probabilistic Early Expiration, Background Refresh
 """,
 )
-async def cache_aside(resource_id: int):
-    redis = await _get_redis()
+async def cache_aside(resource_id: int, redis: aioredis.Redis = Depends(get_async_redis_client)):
     cache_key = f"{STAGE3_CACHE_PREFIX}:{resource_id}"
 
     start = time.monotonic()
@@ -142,8 +137,7 @@ async def cache_aside(resource_id: int):
     summary="[3-1] Cache-Aside — 캐시 무효화 (Cache Invalidation)",
     description="DB 데이터 수정 시 해당 캐시 키를 삭제해 다음 요청에서 최신 데이터를 가져오게 한다.",
 )
-async def cache_invalidate(resource_id: int):
-    redis = await _get_redis()
+async def cache_invalidate(resource_id: int, redis: aioredis.Redis = Depends(get_async_redis_client)):
     cache_key = f"{STAGE3_CACHE_PREFIX}:{resource_id}"
     deleted = await redis.delete(cache_key)
 
@@ -183,8 +177,7 @@ JWT는 Stateless라 서버가 직접 무효화할 수 없다.
 ```
 """,
 )
-async def blacklist_token(req: TokenBlacklistRequest):
-    redis = await _get_redis()
+async def blacklist_token(req: TokenBlacklistRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     blacklist_key = f"{STAGE3_BLACKLIST_PREFIX}:{req.token}"
 
     await redis.set(blacklist_key, "revoked", ex=req.ttl)
@@ -210,8 +203,7 @@ async def blacklist_token(req: TokenBlacklistRequest):
     response_model=RedisLabResponse,
     summary="[3-2] Token Blacklist — 토큰 유효성 검사",
 )
-async def check_blacklist(token: str):
-    redis = await _get_redis()
+async def check_blacklist(token: str, redis: aioredis.Redis = Depends(get_async_redis_client)):
     blacklist_key = f"{STAGE3_BLACKLIST_PREFIX}:{token}"
     is_blacklisted = await redis.exists(blacklist_key)
 
@@ -260,8 +252,7 @@ Fixed Window는 윈도우 경계에서 2배 요청이 가능한 취약점이 있
 Sliding Window는 이를 해결하지만 메모리 사용량이 더 높다.
 """,
 )
-async def rate_limit_check(req: RateLimitRequest):
-    redis = await _get_redis()
+async def rate_limit_check(req: RateLimitRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     rl_key = f"{STAGE3_RATELIMIT_PREFIX}:{req.client_id}"
 
     now = time.time()
@@ -350,8 +341,7 @@ return 0
 **Redlock 알고리즘**: 단일 Redis가 아닌 N대에 과반수 락 획득 방식 (N≥3 홀수)
 """,
 )
-async def acquire_lock(req: DistributedLockRequest):
-    redis = await _get_redis()
+async def acquire_lock(req: DistributedLockRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     lock_key = f"{STAGE3_LOCK_PREFIX}:{req.resource}"
     lock_value = str(uuid.uuid4())   # 고유 식별자 (누가 걸었는지 식별)
 
@@ -387,8 +377,7 @@ async def acquire_lock(req: DistributedLockRequest):
     response_model=RedisLabResponse,
     summary="[3-4] Distributed Lock — 락 해제 (Lua 스크립트)",
 )
-async def release_lock(resource: str, lock_value: str):
-    redis = await _get_redis()
+async def release_lock(resource: str, lock_value: str, redis: aioredis.Redis = Depends(get_async_redis_client)):
     lock_key = f"{STAGE3_LOCK_PREFIX}:{resource}"
 
     # Lua 스크립트: 소유자 확인 후 삭제 (원자적)
@@ -446,8 +435,7 @@ async def release_lock(resource: str, lock_value: str):
 - SSE 서버 → `SUBSCRIBE notification:{user_id}` → 클라이언트에 전달
 """,
 )
-async def pubsub_publish(channel: str, message: str):
-    redis = await _get_redis()
+async def pubsub_publish(channel: str, message: str, redis: aioredis.Redis = Depends(get_async_redis_client)):
     receiver_count = await redis.publish(channel, message)
 
     return RedisLabResponse(
@@ -477,8 +465,7 @@ async def pubsub_publish(channel: str, message: str):
     response_model=RedisLabResponse,
     summary="[유틸] Stage 3 키 전체 삭제",
 )
-async def cleanup_stage3():
-    redis = await _get_redis()
+async def cleanup_stage3(redis: aioredis.Redis = Depends(get_async_redis_client)):
     pattern = make_key("stage3", "*")
     deleted = 0
     cursor = 0
@@ -14,7 +14,7 @@
 from typing import Any, Dict
 
 import aioredis
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from src.database.database import get_async_redis_client
 from src.domains.redis.constants import make_key
@@ -23,10 +23,6 @@ from src.domains.redis.presentation.schemas import RedisLabResponse
 router = APIRouter(prefix="/stage4", tags=["Redis-4단계: 영속성&메모리"])
 
 
-async def _get_redis() -> aioredis.Redis:
-    return await get_async_redis_client()
-
-
 # ══════════════════════════════════════════
 # 4-1. 영속성 설정 확인 (RDB / AOF)
 # ══════════════════════════════════════════
@@ -57,8 +53,7 @@ save 60 10000  # 1분 내 10000개 이상 변경 시
 - `no` : OS에 맡김 (빠름, 위험)
 """,
 )
-async def persistence_config():
-    redis = await _get_redis()
+async def persistence_config(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     # CONFIG GET으로 영속성 설정 조회
     rdb_config = await redis.config_get("save")
@@ -118,8 +113,7 @@ async def persistence_config():
 - `BGREWRITEAOF`: AOF 파일을 압축/재작성 (Background)
 """,
 )
-async def bgsave():
-    redis = await _get_redis()
+async def bgsave(redis: aioredis.Redis = Depends(get_async_redis_client)):
     result = await redis.bgsave()
     last_save = await redis.lastsave()
 
@@ -162,8 +156,7 @@ async def bgsave():
 Redis 4.0+ 에서는 `MEMORY PURGE` 명령으로 단편화된 메모리를 반환할 수 있다.
 """,
 )
-async def memory_info():
-    redis = await _get_redis()
+async def memory_info(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     raw_info = await redis.info("memory")
     maxmemory = await redis.config_get("maxmemory")
@@ -229,8 +222,7 @@ async def memory_info():
 - Hash: `listpack` / `hashtable`
 """,
 )
-async def memory_usage(key: str):
-    redis = await _get_redis()
+async def memory_usage(key: str, redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     exists = await redis.exists(key)
     if not exists:
@@ -310,8 +302,7 @@ async def memory_usage(key: str):
 - 메시지 큐: `noeviction` (메시지 유실 방지)
 """,
 )
-async def eviction_policies():
-    redis = await _get_redis()
+async def eviction_policies(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     current_policy = await redis.config_get("maxmemory-policy")
     maxmemory = await redis.config_get("maxmemory")
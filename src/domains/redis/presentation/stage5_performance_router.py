@@ -16,7 +16,7 @@ import time
 from typing import Any, Dict, List
 
 import aioredis
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from src.database.database import get_async_redis_client
 from src.domains.redis.constants import STAGE5_LUA, STAGE5_PIPELINE, make_key
@@ -25,10 +25,6 @@ from src.domains.redis.presentation.schemas import PipelineRequest, RedisLabResp
 router = APIRouter(prefix="/stage5", tags=["Redis-5단계: 성능 최적화"])
 
 
-async def _get_redis() -> aioredis.Redis:
-    return await get_async_redis_client()
-
-
 # ══════════════════════════════════════════
 # 5-1. Pipeline — RTT 최소화
 # ══════════════════════════════════════════
@@ -56,8 +52,7 @@ Client → [SET 1, SET 2, ..., SET N] → Server → [OK, OK, ..., OK] → Clien
 **주의**: Pipeline은 원자성 보장 안 함. 원자성 필요 시 MULTI/EXEC 또는 Lua 사용.
 """,
 )
-async def pipeline_benchmark(req: PipelineRequest):
-    redis = await _get_redis()
+async def pipeline_benchmark(req: PipelineRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     n = req.count
 
     # --- 1) 개별 전송 ---
@@ -140,8 +135,7 @@ end
 **EVALSHA**: 스크립트를 서버에 캐싱 후 SHA로 호출 (네트워크 절약)
 """,
 )
-async def lua_atomic_counter(limit: int = 10):
-    redis = await _get_redis()
+async def lua_atomic_counter(limit: int = 10, redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     # 조건부 증가 Lua 스크립트
     lua_script = """
@@ -209,8 +203,7 @@ SCAN cursor [MATCH pattern] [COUNT count] [TYPE type]
 → 모든 명령어 처리 중단 → 타임아웃 → 서비스 장애
 """,
 )
-async def scan_demo():
-    redis = await _get_redis()
+async def scan_demo(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     # 테스트 키 생성
     test_pattern = make_key("stage5", "scan_demo")
@@ -294,8 +287,7 @@ SLOWLOG로 병목 명령어 발견 → 해당 명령어의 시간 복잡도 확
 O(N) 명령어(KEYS, SMEMBERS, HGETALL 등)를 O(1)/O(log N) 명령어로 대체
 """,
 )
-async def slowlog_info():
-    redis = await _get_redis()
+async def slowlog_info(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     slowlog_len = await redis.slowlog_len()
     slowlog_entries = await redis.slowlog_get(10)
@@ -365,8 +357,7 @@ async def slowlog_info():
 **lazyfree-lazy-eviction** 설정으로 Eviction도 비동기로 처리 가능 (Redis 4.0+)
 """,
 )
-async def unlink_demo():
-    redis = await _get_redis()
+async def unlink_demo(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     # 큰 Set 생성 (1000개 원소)
     big_set_key = make_key("stage5", "big_set")
@@ -438,8 +429,7 @@ hit_ratio = keyspace_hits / (keyspace_hits + keyspace_misses)
 캐시 서버라면 95% 이상이 목표.
 """,
 )
-async def server_stats():
-    redis = await _get_redis()
+async def server_stats(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     server_info = await redis.info("server")
     stats_info = await redis.info("stats")
@@ -14,7 +14,7 @@ import time
 from typing import Any, Dict, List, Optional
 
 import aioredis
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from src.database.database import get_async_redis_client
 from src.domains.redis.constants import STAGE7_STREAM, STAGE7_TRANSACTION, make_key
@@ -27,10 +27,6 @@ from src.domains.redis.presentation.schemas import (
 router = APIRouter(prefix="/stage7", tags=["Redis-7단계: 고급 주제"])
 
 
-async def _get_redis() -> aioredis.Redis:
-    return await get_async_redis_client()
-
-
 # ══════════════════════════════════════════
 # 7-1. Redis Stream — 영속 메시지 스트림
 # ══════════════════════════════════════════
@@ -61,8 +57,7 @@ async def _get_redis() -> aioredis.Redis:
 - `XACK key group id` : 처리 완료 확인
 """,
 )
-async def stream_publish(req: StreamPublishRequest):
-    redis = await _get_redis()
+async def stream_publish(req: StreamPublishRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     # XADD: * = 자동 ID 생성 (milliseconds-sequence 형식)
     fields = {"event_type": req.event_type, **req.payload}
@@ -125,8 +120,7 @@ XACK stream_key my_group <message_id>           # 처리 완료 확인
 한 Consumer가 죽으면 XPENDING으로 미처리 메시지를 다른 Consumer가 재처리 가능.
 """,
 )
-async def stream_read(count: int = 10):
-    redis = await _get_redis()
+async def stream_read(count: int = 10, redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     stream_len = await redis.xlen(STAGE7_STREAM)
     messages = await redis.xrange(STAGE7_STREAM, count=count)
@@ -186,8 +180,7 @@ async def stream_read(count: int = 10):
 3. 처리 완료된 메시지를 XDEL로 삭제
 """,
 )
-async def stream_trim(maxlen: int = 5):
-    redis = await _get_redis()
+async def stream_trim(maxlen: int = 5, redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     before = await redis.xlen(STAGE7_STREAM)
     await redis.xtrim(STAGE7_STREAM, maxlen=maxlen)
@@ -245,8 +238,7 @@ EXEC               # key가 변경됐으면 nil 반환 (트랜잭션 중단)
 CAS(Compare-And-Swap) 패턴으로 동시성 충돌 감지.
 """,
 )
-async def multi_exec_demo(req: TransactionRequest):
-    redis = await _get_redis()
+async def multi_exec_demo(req: TransactionRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     key = f"{STAGE7_TRANSACTION}:{req.key}"
 
     # MULTI/EXEC 트랜잭션
@@ -310,8 +302,7 @@ while True:
 ```
 """,
 )
-async def watch_demo(req: TransactionRequest):
-    redis = await _get_redis()
+async def watch_demo(req: TransactionRequest, redis: aioredis.Redis = Depends(get_async_redis_client)):
     key = f"{STAGE7_TRANSACTION}:watch:{req.key}"
 
     # 초기값 설정
@@ -420,8 +411,7 @@ tls-ca-cert-file /path/to/ca.crt
 - rename-command FLUSHALL "" (위험 명령어 비활성화)
 """,
 )
-async def security_overview():
-    redis = await _get_redis()
+async def security_overview(redis: aioredis.Redis = Depends(get_async_redis_client)):
 
     # ACL WHOAMI: 현재 연결된 사용자
     try:
@@ -482,8 +472,7 @@ async def security_overview():
     response_model=RedisLabResponse,
     summary="[유틸] Stage 7 키 전체 삭제",
 )
-async def cleanup_stage7():
-    redis = await _get_redis()
+async def cleanup_stage7(redis: aioredis.Redis = Depends(get_async_redis_client)):
     pattern = make_key("stage7", "*")
     deleted = 0
     cursor = 0
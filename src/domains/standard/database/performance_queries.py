@@ -0,0 +1,65 @@
+"""performance_test_data 조회 SQL
+
+필터 조합(카테고리/상태 유무)별로 문장을 미리 만들어 두어, 같은 조합의 요청은 항상 같은 SQL 문자열을
+실행한다. asyncpg prepared statement 캐시는 SQL 문자열을 키로 하므로 요청마다 문자열을 조립하지 않아야
+캐시에 적중한다. 필터 값은 모두 바인드 파라미터로 전달한다.
+
+after_id 가 주어지면 OFFSET 대신 id 기준 keyset 조회 문장(WHERE id > :after_id)을 사용하여
+깊은 페이지도 PK 인덱스로 바로 찾아간다.
+"""
+
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+
+def _build_statements(has_category: bool, has_status: bool, keyset: bool) -> Tuple[TextClause, TextClause]:
+    conditions = []
+    if has_category:
+        conditions.append("category = :category")
+    if has_status:
+        conditions.append("status = :status")
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    # 전체 건수 계산 대상 (src/database/row_count.py 가 전략에 따라 COUNT 또는 EXPLAIN 으로 감쌈)
+    rows_statement = text(f"SELECT id FROM performance_test_data {where}")
+
+    if keyset:
+        conditions.append("id > :after_id")
+        where = f"WHERE {' AND '.join(conditions)}"
+    page = "LIMIT :limit" if keyset else "LIMIT :limit OFFSET :offset"
+    data_statement = text(f"""
+        SELECT id, title, content, category, status, view_count,
+               created_at::text, updated_at::text
+        FROM performance_test_data {where}
+        ORDER BY id
+        {page}
+    """)
+    return rows_statement, data_statement
+
+
+# (카테고리 필터 여부, 상태 필터 여부, keyset 여부) -> (건수 계산 대상 문장, 데이터 조회 문장)
+PERFORMANCE_DATA_STATEMENTS: Dict[Tuple[bool, bool, bool], Tuple[TextClause, TextClause]] = {
+    (has_category, has_status, keyset): _build_statements(has_category, has_status, keyset)
+    for has_category in (False, True)
+    for has_status in (False, True)
+    for keyset in (False, True)
+}
+
+
+def performance_data_statements(
+    limit: int, offset: int, category: Optional[str], status: Optional[str], after_id: Optional[int] = None
+) -> Tuple[TextClause, TextClause, dict]:
+    """필터 조합에 맞는 고정 문장과 바인드 파라미터 (after_id 가 있으면 keyset 문장)"""
+    keyset = after_id is not None
+    params = {"limit": limit}
+    if keyset:
+        params["after_id"] = after_id
+    else:
+        params["offset"] = offset
+    if category:
+        params["category"] = category
+    if status:
+        params["status"] = status
+    rows_statement, data_statement = PERFORMANCE_DATA_STATEMENTS[(bool(category), bool(status), keyset)]
+    return rows_statement, data_statement, params
@@ -2,6 +2,8 @@ from typing import List, Optional, Tuple
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
+from src.database.row_count import CountResult, count_rows
+from src.domains.standard.database.performance_queries import performance_data_statements
 from src.domains.standard.presentation.schemas.standard import DatabaseSessionInfo, PoolInfo, PerformanceDataItem
 
 class StandardAsyncRepository:
@@ -126,8 +128,9 @@ class StandardAsyncRepository:
         limit: int = 100,
         offset: int = 0,
         category: Optional[str] = None,
-        status: Optional[str] = None
-    ) -> Tuple[List[PerformanceDataItem], int]:
+        status: Optional[str] = None,
+        after_id: Optional[int] = None
+    ) -> Tuple[List[PerformanceDataItem], CountResult]:
         """
         성능 테스트 데이터 조회 (비동기)
 
@@ -136,37 +139,23 @@ class StandardAsyncRepository:
             offset: 시작 위치
             category: 카테고리 필터 (선택)
             status: 상태 필터 (선택)
+            after_id: 커서 모드 - 이 id 다음부터 조회 (offset 무시)
 
         Returns:
-            (데이터 리스트, 전체 개수)
+            (데이터 리스트, 전체 개수와 계산 전략)
         """
-        # 기본 쿼리
-        base_query = "FROM performance_test_data WHERE 1=1"
-        params = {"limit": limit, "offset": offset}
-
-        if category:
-            base_query += " AND category = :category"
-            params["category"] = category
-        if status:
-            base_query += " AND status = :status"
-            params["status"] = status
+        # 필터 조합별로 고정된 문장 사용 (prepared statement 캐시 적중)
+        rows_statement, data_statement, params = performance_data_statements(
+            limit, offset, category, status, after_id
+        )
 
-        # 전체 개수 조회
-        count_result = await self.db.execute(
-            text(f"SELECT COUNT(*) {base_query}"),
-            params
+        # 전체 개수 조회 (기본 전략: planner 추정치 - src/database/row_count.py)
+        total = await count_rows(
+            self.db, "performance_data", rows_statement, cache_key=(category, status), params=params
         )
-        total_count = count_result.scalar()
 
         # 데이터 조회
-        data_query = f"""
-            SELECT id, title, content, category, status, view_count,
-                   created_at::text, updated_at::text
-            {base_query}
-            ORDER BY id
-            LIMIT :limit OFFSET :offset
-        """
-        result = await self.db.execute(text(data_query), params)
+        result = await self.db.execute(data_statement, params)
 
         items = [
             PerformanceDataItem(
@@ -182,4 +171,4 @@ class StandardAsyncRepository:
             for row in result
         ]
 
-        return items, total_count
\ No newline at end of file
+        return items, total
\ No newline at end of file
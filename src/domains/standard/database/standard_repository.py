@@ -1,6 +1,8 @@
 from typing import List, Optional, Tuple
 from sqlalchemy import text
 from sqlalchemy.orm import Session
+from src.database.row_count import COUNT_EXACT, CountResult, count_statement
+from src.domains.standard.database.performance_queries import performance_data_statements
 from src.domains.standard.presentation.schemas.standard import DatabaseSessionInfo, PoolInfo, PerformanceDataItem
 
 class StandardRepository:
@@ -96,8 +98,9 @@ class StandardRepository:
         limit: int = 100,
         offset: int = 0,
         category: Optional[str] = None,
-        status: Optional[str] = None
-    ) -> Tuple[List[PerformanceDataItem], int]:
+        status: Optional[str] = None,
+        after_id: Optional[int] = None
+    ) -> Tuple[List[PerformanceDataItem], CountResult]:
         """
         성능 테스트 데이터 조회 (동기)
 
@@ -106,37 +109,22 @@ class StandardRepository:
             offset: 시작 위치
             category: 카테고리 필터 (선택)
             status: 상태 필터 (선택)
+            after_id: 커서 모드 - 이 id 다음부터 조회 (offset 무시)
 
         Returns:
-            (데이터 리스트, 전체 개수)
+            (데이터 리스트, 전체 개수와 계산 전략)
         """
-        # 기본 쿼리
-        base_query = "FROM performance_test_data WHERE 1=1"
-        params = {"limit": limit, "offset": offset}
-
-        if category:
-            base_query += " AND category = :category"
-            params["category"] = category
-        if status:
-            base_query += " AND status = :status"
-            params["status"] = status
-
-        # 전체 개수 조회
-        count_result = self.db.execute(
-            text(f"SELECT COUNT(*) {base_query}"),
-            params
+        # 필터 조합별로 고정된 문장 사용 (prepared statement 캐시 적중)
+        rows_statement, data_statement, params = performance_data_statements(
+            limit, offset, category, status, after_id
         )
-        total_count = count_result.scalar()
+
+        # 전체 개수 조회 (동기 경로는 비교 기준이므로 항상 정확한 COUNT)
+        count_result = self.db.execute(count_statement(rows_statement), params)
+        total = CountResult(total=count_result.scalar(), strategy=COUNT_EXACT)
 
         # 데이터 조회
-        data_query = f"""
-            SELECT id, title, content, category, status, view_count,
-                   created_at::text, updated_at::text
-            {base_query}
-            ORDER BY id
-            LIMIT :limit OFFSET :offset
-        """
-        result = self.db.execute(text(data_query), params)
+        result = self.db.execute(data_statement, params)
 
         items = [
             PerformanceDataItem(
@@ -152,4 +140,4 @@ class StandardRepository:
             for row in result
         ]
 
-        return items, total_count
\ No newline at end of file
+        return items, total
\ No newline at end of file
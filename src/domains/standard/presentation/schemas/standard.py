@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import BaseModel, ConfigDict
 
 
@@ -67,7 +67,54 @@ class BulkReadResponse(BaseModel):
     """대용량 조회 응답"""
     items: List[PerformanceDataItem]
     total_count: int
+    count_strategy: str = "exact"  # total_count 계산 전략 (exact / cached / estimated)
     limit: int
     offset: int
     query_time_ms: float
-    message: str
\ No newline at end of file
+    message: str
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None)
+
+
+class ReadEngineStatus(BaseModel):
+    """읽기 엔진 라우팅 상태"""
+    weight: float
+    latency_ms: float
+    pool_wait_ms: float
+    replication_lag_s: float
+    ejected: bool
+    ejected_remaining_s: float
+
+
+class ReadEngineWeightsResponse(BaseModel):
+    """읽기 엔진 가중치 응답"""
+    async_engines: Dict[str, ReadEngineStatus]
+    sync_engines: Dict[str, ReadEngineStatus]
+
+
+class StatementStats(BaseModel):
+    """정규화된 SQL 문장(fingerprint)별 실행 통계"""
+    fingerprint_id: str
+    fingerprint: str
+    calls: int
+    rows: int
+    total_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+class RouteQueryStats(BaseModel):
+    """라우트별 DB 사용 통계"""
+    requests: int
+    statements_per_request_avg: float
+    statements_per_request_max: int
+    db_time_ms_p50: float
+    db_time_ms_p95: float
+    db_time_ms_p99: float
+    statements: List[StatementStats]
+
+
+class QueryStatsResponse(BaseModel):
+    """라우트별 쿼리 통계 응답"""
+    slow_query_threshold_ms: float
+    routes: Dict[str, RouteQueryStats]
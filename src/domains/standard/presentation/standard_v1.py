@@ -5,16 +5,19 @@ import multiprocessing
 import threading
 import random
 from typing import Optional
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.common.constants import APIVersion
+from src.common.pagination import InvalidCursorError, decode_cursor, next_cursor
 from src.common.presentation.response import BaseErrorResponse, BaseResponse
 from src.common.presentation.router import create_versioned_router
-from src.domains.standard.presentation.schemas.standard import StandardResponse, StandardDbResponse, DatabaseSessionInfo, PoolInfo, QueryExecutionInfo, BulkReadResponse
+from src.domains.standard.presentation.schemas.standard import StandardResponse, StandardDbResponse, DatabaseSessionInfo, PoolInfo, QueryExecutionInfo, BulkReadResponse, ReadEngineWeightsResponse, QueryStatsResponse
 from src.utils import Logging
-from src.database.database import get_db, get_async_db, get_async_read_db
+from src.database.bulkhead import PARTITION_BULK, use_partition
+from src.database.query_metrics import DB_SLOW_QUERY_MS, query_stats
+from src.database.database import get_db, get_async_db, get_async_read_db, read_engine_router, sync_read_engine_router
 from src.domains.standard.database.standard_repository import StandardRepository
 from src.domains.standard.database.standard_async_repository import StandardAsyncRepository
 
@@ -34,6 +37,16 @@ router_v1 = create_versioned_router(
 logger = Logging.__call__().get_logger(name=__name__, path="standard.py", isThread=True)
 
 
+def _cursor_after_id(cursor: Optional[str]) -> Optional[int]:
+    """대용량 조회 커서(id) 디코딩 (잘못된 커서는 400)"""
+    if not cursor:
+        return None
+    try:
+        return decode_cursor(cursor, (int,))[0]
+    except InvalidCursorError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @router_v1.get(
     "/sync-test",
     response_model=BaseResponse[StandardResponse],
@@ -225,6 +238,7 @@ async def async_test_with_await_with_async(
 @router_v1.get(
     "/sync-test-with-sync-db-session",
     response_model=BaseResponse[StandardDbResponse],
+    dependencies=[Depends(use_partition(PARTITION_BULK))],
     description="동기 메서드 내 동기 db session 사용 API",
     summary="동기 메서드 내 동기 db session 사용 API"
 )
@@ -269,6 +283,7 @@ def sync_test_with_sync(
 @router_v1.get(
     "/async-test-with-async-db-session",
     response_model=BaseResponse[StandardDbResponse],
+    dependencies=[Depends(use_partition(PARTITION_BULK))],
     description="비동기 메서드 내 비동기 db session 사용 API",
     summary="비동기 메서드 내 비동기 db session 사용 API"
 )
@@ -317,6 +332,7 @@ async def async_test_with_async_db_session(
 @router_v1.get(
     "/async-test-with-async-db-session-with-sync",
     response_model=BaseResponse[StandardDbResponse],
+    dependencies=[Depends(use_partition(PARTITION_BULK))],
     description="비동기 메서드 내 동기 db session 사용 API",
     summary="비동기 메서드 내 동기 db session 사용 API"
 )
@@ -361,6 +377,7 @@ async def async_test_with_async_db_session_with_sync(
 @router_v1.get(
     "/sync-test-with-sync-db-session-multiple-queries",
     response_model=BaseResponse[StandardDbResponse],
+    dependencies=[Depends(use_partition(PARTITION_BULK))],
     description="동기 메서드 내 여러 개의 랜덤 지연시간 쿼리 실행 API",
     summary="동기 메서드 내 여러 개의 랜덤 지연시간 쿼리 실행 API"
 )
@@ -420,6 +437,7 @@ def sync_test_with_sync_multiple_queries(
 @router_v1.get(
     "/async-test-with-async-db-session-multiple-queries",
     response_model=BaseResponse[StandardDbResponse],
+    dependencies=[Depends(use_partition(PARTITION_BULK))],
     description="비동기 메서드 내 여러 개의 랜덤 지연시간 쿼리 실행 API",
     summary="비동기 메서드 내 여러 개의 랜덤 지연시간 쿼리 실행 API"
 )
@@ -481,6 +499,7 @@ async def async_test_with_async_db_session_multiple_queries(
 @router_v1.get(
     "/async-test-with-sync-db-session-multiple-queries",
     response_model=BaseResponse[StandardDbResponse],
+    dependencies=[Depends(use_partition(PARTITION_BULK))],
     description="비동기 메서드 내 동기 DB 세션으로 여러 개의 랜덤 지연시간 쿼리 실행 API",
     summary="비동기 메서드 내 동기 DB 세션으로 여러 개의 랜덤 지연시간 쿼리 실행 API"
 )
@@ -541,13 +560,15 @@ async def async_test_with_sync_db_session_multiple_queries(
 @router_v1.get(
     "/sync-bulk-read",
     response_model=BaseResponse[BulkReadResponse],
+    dependencies=[Depends(use_partition(PARTITION_BULK))],
     summary="동기 대용량 데이터 조회 API",
     description="동기 방식으로 performance_test_data 테이블에서 대용량 데이터를 조회합니다. "
-                "페이지네이션과 카테고리/상태 필터링을 지원합니다."
+                "페이지네이션(offset 또는 id 커서)과 카테고리/상태 필터링을 지원합니다."
 )
 def sync_bulk_read(
     limit: int = Query(default=100, ge=1, le=1000, description="조회할 레코드 수"),
     offset: int = Query(default=0, ge=0, description="시작 위치"),
+    cursor: Optional[str] = Query(default=None, description="커서 (이전 응답의 next_cursor, 지정 시 offset 무시)"),
     category: Optional[str] = Query(default=None, description="카테고리 필터"),
     status: Optional[str] = Query(default=None, description="상태 필터"),
     db: Session = Depends(get_db)
@@ -562,14 +583,16 @@ def sync_bulk_read(
         f"limit: {limit}, offset: {offset}"
     )
 
+    after_id = _cursor_after_id(cursor)
     repo = StandardRepository(db)
 
     start_time = time.time()
-    items, total_count = repo.get_performance_data(
+    items, total = repo.get_performance_data(
         limit=limit,
         offset=offset,
         category=category,
-        status=status
+        status=status,
+        after_id=after_id
     )
     query_time_ms = (time.time() - start_time) * 1000
 
@@ -578,10 +601,12 @@ def sync_bulk_read(
     return BaseResponse(
         data=BulkReadResponse(
             items=items,
-            total_count=total_count,
+            total_count=total.total,
+            count_strategy=total.strategy,
             limit=limit,
             offset=offset,
             query_time_ms=round(query_time_ms, 2),
+            next_cursor=next_cursor(items, limit, "id"),
             message=f"Sync read (PID: {process_id}, Worker: {worker_id}, Thread: {thread_id})"
         )
     )
@@ -590,13 +615,15 @@ def sync_bulk_read(
 @router_v1.get(
     "/async-bulk-read",
     response_model=BaseResponse[BulkReadResponse],
+    dependencies=[Depends(use_partition(PARTITION_BULK))],
     summary="비동기 대용량 데이터 조회 API",
     description="비동기 방식으로 performance_test_data 테이블에서 대용량 데이터를 조회합니다. "
-                "페이지네이션과 카테고리/상태 필터링을 지원합니다."
+                "페이지네이션(offset 또는 id 커서)과 카테고리/상태 필터링을 지원합니다."
 )
 async def async_bulk_read(
     limit: int = Query(default=100, ge=1, le=1000, description="조회할 레코드 수"),
     offset: int = Query(default=0, ge=0, description="시작 위치"),
+    cursor: Optional[str] = Query(default=None, description="커서 (이전 응답의 next_cursor, 지정 시 offset 무시)"),
     category: Optional[str] = Query(default=None, description="카테고리 필터"),
     status: Optional[str] = Query(default=None, description="상태 필터"),
     db: AsyncSession = Depends(get_async_read_db)
@@ -611,14 +638,16 @@ async def async_bulk_read(
         f"limit: {limit}, offset: {offset}"
     )
 
+    after_id = _cursor_after_id(cursor)
     repo = StandardAsyncRepository(db)
 
     start_time = time.time()
-    items, total_count = await repo.get_performance_data(
+    items, total = await repo.get_performance_data(
         limit=limit,
         offset=offset,
         category=category,
-        status=status
+        status=status,
+        after_id=after_id
     )
     query_time_ms = (time.time() - start_time) * 1000
 
@@ -627,10 +656,47 @@ async def async_bulk_read(
     return BaseResponse(
         data=BulkReadResponse(
             items=items,
-            total_count=total_count,
+            total_count=total.total,
+            count_strategy=total.strategy,
             limit=limit,
             offset=offset,
             query_time_ms=round(query_time_ms, 2),
+            next_cursor=next_cursor(items, limit, "id"),
             message=f"Async read (PID: {process_id}, Worker: {worker_id}, Thread: {thread_id})"
         )
     )
+
+
+
+@router_v1.get(
+    "/read-engine-weights",
+    response_model=BaseResponse[ReadEngineWeightsResponse],
+    summary="읽기 엔진 라우팅 가중치 조회 API",
+    description="Primary/Replica 엔진별 쿼리 지연, 풀 대기 시간, 복제 지연과 현재 선택 가중치를 반환합니다. "
+                "제외(eject)된 엔진은 가중치가 0 입니다."
+)
+async def read_engine_weights():
+    return BaseResponse(
+        data=ReadEngineWeightsResponse(
+            async_engines=read_engine_router.snapshot(),
+            sync_engines=sync_read_engine_router.snapshot(),
+        )
+    )
+
+
+@router_v1.get(
+    "/query-stats",
+    response_model=BaseResponse[QueryStatsResponse],
+    summary="라우트별 SQL 실행 통계 조회 API",
+    description="이 프로세스에서 라우트별 요청당 실행 문장 수, DB 시간 p50/p95/p99 와 "
+                "정규화된 문장(fingerprint)별 호출 수, 실행 시간 분포를 반환합니다."
+)
+async def query_stats_snapshot(
+    reset: bool = Query(default=False, description="조회 후 통계 초기화 여부")
+):
+    snapshot = query_stats.snapshot()
+    if reset:
+        query_stats.reset()
+    return BaseResponse(
+        data=QueryStatsResponse(slow_query_threshold_ms=DB_SLOW_QUERY_MS, routes=snapshot)
+    )
@@ -0,0 +1,187 @@
+"""인증 사용자 조회 캐시
+
+인증이 필요한 요청마다 JWT 디코딩 후 users 를 username 으로 SELECT 하면, 비즈니스 로직 전에
+DB 왕복이 한 번 더 생긴다 (투표가 몰리거나 SSE 재연결이 많을 때 특히 크다).
+
+- 사용자 스냅샷(id, username, email, token_version)을 프로세스 내 LRU 에 짧은 TTL 로 캐시하고,
+  AUTH_USER_CACHE_REDIS=true 이면 Redis 를 2차 캐시로 사용하여 워커 간에 공유한다.
+- 캐시 키는 토큰의 sub(username)이고, 토큰의 ver(token_version)와 스냅샷의 버전이 같을 때만 적중한다.
+  token_version 을 올리면 이전 토큰은 DB 조회 후 401 이 된다 (전체 토큰 무효화).
+- 캐시 적중 시 DB 를 조회하지 않고 스냅샷으로 만든 User 를 요청 세션에 붙여 반환한다
+  (merge(load=False) - 관계 설정 등 ORM 객체가 필요한 라우트에서도 그대로 사용 가능).
+- User 수정/삭제 시 mapper 이벤트에서 무효화한다 (다른 워커의 프로세스 내 캐시는 TTL 까지 유지).
+- 사용자 id/username 만 필요한 라우트는 get_current_user_claims 로 DB 와 캐시를 모두 거치지 않는다
+  (토큰의 uid 클레임 사용 - 토큰 만료 전까지는 삭제/버전 변경이 반영되지 않음).
+
+설정 (환경 변수):
+    AUTH_USER_CACHE_ENABLED     캐시 사용 여부 (기본 true)
+    AUTH_USER_CACHE_TTL         스냅샷 유지 시간 (초, 기본 30)
+    AUTH_USER_CACHE_MAX_KEYS    프로세스 내 최대 사용자 수 (초과 시 오래 사용하지 않은 사용자부터 제거)
+    AUTH_USER_CACHE_REDIS       Redis 2차 캐시 사용 여부 (기본 false)
+
+메트릭 (/metrics):
+    auth_user_cache_requests_total{result}   result: local / redis / miss / stale
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from prometheus_client import Counter
+from sqlalchemy import event, inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
+
+from src.database.redis_pool import redis_pool
+from src.domains.user import service as user_service
+from src.domains.user.models import User
+
+logger = logging.getLogger(__name__)
+
+AUTH_USER_CACHE_ENABLED = os.getenv("AUTH_USER_CACHE_ENABLED", "true").lower() == "true"
+AUTH_USER_CACHE_TTL = float(os.getenv("AUTH_USER_CACHE_TTL", 30.0))
+AUTH_USER_CACHE_MAX_KEYS = int(os.getenv("AUTH_USER_CACHE_MAX_KEYS", 10000))
+AUTH_USER_CACHE_REDIS = os.getenv("AUTH_USER_CACHE_REDIS", "false").lower() == "true"
+AUTH_USER_CACHE_PREFIX = "authuser"
+
+AUTH_USER_CACHE_REQUESTS = Counter(
+    "auth_user_cache_requests_total",
+    "Authenticated user lookups by result (local/redis hit, miss, stale version)",
+    ["result"],
+)
+
+SNAPSHOT_FIELDS = ("id", "username", "email", "token_version")
+
+
+class UserCache:
+    """username → 사용자 스냅샷 TTL LRU (+ 선택적 Redis 2차 캐시)"""
+
+    def __init__(self, ttl: float = AUTH_USER_CACHE_TTL, max_keys: int = AUTH_USER_CACHE_MAX_KEYS,
+                 use_redis: bool = AUTH_USER_CACHE_REDIS, enabled: bool = AUTH_USER_CACHE_ENABLED):
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self.use_redis = use_redis
+        self.enabled = enabled
+        self._entries: "OrderedDict[str, Tuple[float, dict]]" = OrderedDict()
+        self._tasks = set()  # 진행 중인 Redis 무효화 (GC 방지)
+
+    @staticmethod
+    def _redis_key(username: str) -> str:
+        return f"{AUTH_USER_CACHE_PREFIX}:{username}"
+
+    def _get_local(self, username: str) -> Optional[dict]:
+        entry = self._entries.get(username)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[username]
+            return None
+        self._entries.move_to_end(username)
+        return entry[1]
+
+    def _set_local(self, snapshot: dict) -> None:
+        self._entries[snapshot["username"]] = (time.monotonic() + self.ttl, snapshot)
+        self._entries.move_to_end(snapshot["username"])
+        while len(self._entries) > self.max_keys:
+            self._entries.popitem(last=False)
+
+    async def get(self, username: str, version: int) -> Optional[dict]:
+        """토큰 버전과 일치하는 스냅샷 (없거나 버전이 다르면 None)"""
+        if not self.enabled:
+            return None
+        snapshot, result = self._get_local(username), "local"
+        if snapshot is None and self.use_redis:
+            try:
+                cached = await redis_pool.async_client().get(self._redis_key(username))
+            except Exception as e:
+                logger.warning(f"Auth user cache lookup failed: {e}")
+                cached = None
+            if cached is not None:
+                snapshot, result = json.loads(cached), "redis"
+                self._set_local(snapshot)
+        if snapshot is None:
+            AUTH_USER_CACHE_REQUESTS.labels(result="miss").inc()
+            return None
+        if snapshot["token_version"] != version:
+            AUTH_USER_CACHE_REQUESTS.labels(result="stale").inc()
+            return None
+        AUTH_USER_CACHE_REQUESTS.labels(result=result).inc()
+        return snapshot
+
+    async def set(self, user: User) -> None:
+        if not self.enabled:
+            return
+        snapshot = {field: getattr(user, field) for field in SNAPSHOT_FIELDS}
+        self._set_local(snapshot)
+        if self.use_redis:
+            try:
+                await redis_pool.async_client().set(self._redis_key(user.username), json.dumps(snapshot),
+                                                    ex=int(self.ttl))
+            except Exception as e:
+                logger.warning(f"Auth user cache store failed: {e}")
+
+    def invalidate(self, username: str) -> None:
+        """프로세스 내 항목은 즉시, Redis 항목은 이벤트 루프가 있으면 비동기로 (없으면 동기) 삭제"""
+        self._entries.pop(username, None)
+        if not (self.enabled and self.use_redis):
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        try:
+            if loop is not None:
+                task = loop.create_task(self._invalidate_redis(username))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            else:
+                redis_pool.sync_client().delete(self._redis_key(username))
+        except Exception as e:
+            logger.error(f"Auth user cache invalidation failed ({username}): {e}")
+
+    async def _invalidate_redis(self, username: str) -> None:
+        try:
+            await redis_pool.async_client().delete(self._redis_key(username))
+        except Exception as e:
+            logger.error(f"Auth user cache invalidation failed ({username}): {e}")
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+user_cache = UserCache()
+
+
+async def resolve_user(db: AsyncSession, username: str, version: int = 0) -> Optional[User]:
+    """토큰의 (sub, ver) 로 사용자 조회 - 캐시 적중 시 DB 조회 없음
+
+    Returns:
+        요청 세션에 연결된 User (없거나 토큰 버전이 다르면 None)
+    """
+    snapshot = await user_cache.get(username, version)
+    if snapshot is not None:
+        user = User(**snapshot)
+        make_transient_to_detached(user)  # password 등 나머지 컬럼은 접근 시 로드 (인증 이후 사용하지 않음)
+        return await db.merge(user, load=False)
+
+    user = await user_service.get_user_async(db, username)
+    if user is None or user.token_version != version:
+        return None
+    await user_cache.set(user)
+    return user
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    history = inspect(target).attrs.username.history
+    for username in {target.username, *(history.deleted or ())}:
+        user_cache.invalidate(username)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target: User) -> None:
+    user_cache.invalidate(target.username)
@@ -10,6 +10,8 @@ class User(Base):
     username = Column(String(255), unique=True, nullable=False)
     password = Column(String(255), nullable=False)
     email = Column(String(255), unique=True, nullable=False)
+    # 토큰 버전 - 올리면 이전에 발급한 토큰(ver 클레임)이 모두 무효 (인증 사용자 캐시 키에도 포함)
+    token_version = Column(Integer, nullable=False, default=0, server_default="0")
 
     def __repr__(self):
         return f"<User {self.email}>"
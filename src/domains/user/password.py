@@ -0,0 +1,163 @@
+"""비밀번호 해시/검증 전용 executor
+
+bcrypt 는 의도적으로 느린 CPU 작업(cost 12 기준 수백 ms)이라, 이벤트 루프에서 호출하면 그동안 워커의
+모든 요청이 멈추고 동기 라우터에서 호출해도 anyio 스레드풀 스레드를 점유한다.
+해시/검증을 크기가 고정된 전용 executor 에서 실행하여 동시에 실행되는 bcrypt 수를 제한한다.
+
+- thread : ThreadPoolExecutor (bcrypt 는 해시 중 GIL 을 놓으므로 스레드로도 병렬 실행, 기본)
+- process: ProcessPoolExecutor (GIL 과 무관하게 격리, 프로세스 간 직렬화 비용이 있음)
+- 대기 작업이 PASSWORD_HASH_MAX_QUEUE 를 넘으면 PasswordHasherBusyError (라우터에서 503)
+- cost(PASSWORD_BCRYPT_ROUNDS)가 바뀌면 로그인 성공 시 새 cost 로 다시 해시한 값을 돌려준다
+  (verify_and_update - 저장된 해시의 cost 가 설정과 다르면 needs_update)
+
+설정 (환경 변수):
+    PASSWORD_BCRYPT_ROUNDS     bcrypt cost (기본 12)
+    PASSWORD_HASH_EXECUTOR     thread / process (기본 thread)
+    PASSWORD_HASH_WORKERS      동시에 실행할 해시/검증 수 (기본 min(4, CPU 수))
+    PASSWORD_HASH_MAX_QUEUE    워커를 기다릴 수 있는 최대 작업 수 (기본 64)
+
+메트릭 (/metrics):
+    password_hash_in_flight                 제출되어 끝나지 않은 작업 수 (실행 중 + 대기)
+    password_hash_queue_depth               워커를 기다리는 작업 수
+    password_hash_seconds{operation}        대기 포함 처리 시간 (hash / verify)
+    password_hash_rejected_total            대기열 초과로 거절된 작업 수
+    password_rehash_total                   로그인 시 cost 변경으로 다시 해시한 수
+"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional, Tuple
+
+from passlib.context import CryptContext
+from prometheus_client import Counter, Gauge, Histogram
+
+PASSWORD_BCRYPT_ROUNDS = int(os.getenv("PASSWORD_BCRYPT_ROUNDS", 12))
+PASSWORD_HASH_EXECUTOR = os.getenv("PASSWORD_HASH_EXECUTOR", "thread").lower()
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+PASSWORD_HASH_MAX_QUEUE = int(os.getenv("PASSWORD_HASH_MAX_QUEUE", 64))
+if PASSWORD_HASH_EXECUTOR not in ("thread", "process"):
+    raise ValueError(f"Invalid PASSWORD_HASH_EXECUTOR: {PASSWORD_HASH_EXECUTOR}")
+
+# min/max 를 같게 두어 cost 가 설정과 다른 해시는 needs_update (올리든 내리든 다시 해시)
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__max_rounds=PASSWORD_BCRYPT_ROUNDS,
+)
+
+PASSWORD_HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hash/verify jobs submitted and not finished (running + queued)",
+)
+PASSWORD_HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hash/verify jobs waiting for a worker",
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Password hash/verify time including queue wait",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Password hash/verify jobs rejected because the queue was full",
+)
+PASSWORD_REHASH = Counter(
+    "password_rehash_total",
+    "Password hashes upgraded on login after a cost change",
+)
+
+
+class PasswordHasherBusyError(RuntimeError):
+    """해시 대기열이 가득 참 (잠시 후 재시도)"""
+
+
+# executor 에서 실행되는 함수 (process 모드에서 pickle 가능하도록 모듈 함수)
+def _hash(secret: str) -> str:
+    return pwd_context.hash(secret)
+
+
+def _verify_and_update(secret: str, hashed: str) -> Tuple[bool, Optional[str]]:
+    return pwd_context.verify_and_update(secret, hashed)
+
+
+class PasswordHasher:
+    """크기가 고정된 executor 에서 해시/검증 실행 (동기/비동기 호출자 공용)"""
+
+    def __init__(self, mode: str = PASSWORD_HASH_EXECUTOR, workers: int = PASSWORD_HASH_WORKERS,
+                 max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.mode = mode
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[Executor] = None
+        self._in_flight = 0
+        self._lock = threading.Lock()  # 동기 라우터(스레드풀)와 이벤트 루프에서 함께 제출
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password-hash")
+        return self._executor
+
+    def _set_in_flight(self, delta: int) -> None:
+        self._in_flight += delta
+        PASSWORD_HASH_IN_FLIGHT.set(self._in_flight)
+        PASSWORD_HASH_QUEUE_DEPTH.set(max(self._in_flight - self.workers, 0))
+
+    def _submit(self, fn, *args) -> Future:
+        with self._lock:
+            if self._in_flight - self.workers >= self.max_queue:
+                PASSWORD_HASH_REJECTED.inc()
+                raise PasswordHasherBusyError("Password hashing queue is full")
+            future = self._get_executor().submit(fn, *args)
+            self._set_in_flight(1)
+        future.add_done_callback(self._done)
+        return future
+
+    def _done(self, _future: Future) -> None:
+        with self._lock:
+            self._set_in_flight(-1)
+
+    async def _run(self, operation: str, fn, *args):
+        start = time.perf_counter()
+        try:
+            return await asyncio.wrap_future(self._submit(fn, *args))
+        finally:
+            PASSWORD_HASH_SECONDS.labels(operation=operation).observe(time.perf_counter() - start)
+
+    def _run_sync(self, operation: str, fn, *args):
+        start = time.perf_counter()
+        try:
+            return self._submit(fn, *args).result()
+        finally:
+            PASSWORD_HASH_SECONDS.labels(operation=operation).observe(time.perf_counter() - start)
+
+    async def hash(self, secret: str) -> str:
+        return await self._run("hash", _hash, secret)
+
+    def hash_sync(self, secret: str) -> str:
+        """동기 라우터용 - 호출 스레드는 결과를 기다리지만 bcrypt 동시 실행 수는 executor 가 제한"""
+        return self._run_sync("hash", _hash, secret)
+
+    async def verify(self, secret: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """(일치 여부, 새 해시) - 새 해시는 cost 가 바뀌어 다시 저장해야 할 때만 반환"""
+        verified, new_hash = await self._run("verify", _verify_and_update, secret, hashed)
+        if new_hash is not None:
+            PASSWORD_REHASH.inc()
+        return verified, new_hash
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+password_hasher = PasswordHasher()
@@ -9,9 +9,11 @@ from starlette import status
 
 from src.database.database import get_db, get_async_db
 from src.domains.user.models import User
-from src.domains.user.schemas import UserCreate, Token
+from src.domains.user.schemas import Token, UserClaims, UserCreate
 from src.domains.user import service as user_service
-from src.domains.user.service import pwd_context
+from src.domains.user.auth_cache import resolve_user
+from src.domains.user.password import PasswordHasherBusyError
+from src.domains.user.token_cache import token_claims_cache
 
 router = APIRouter(
     prefix="/api/user",
@@ -23,60 +25,103 @@ ALGORITHM = "HS256"
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/user/login")
 
 
-def get_current_user_with_sync(token: str = Depends(oauth2_scheme),
-                               db: Session = Depends(get_db)):
+def _password_hasher_busy(e: PasswordHasherBusyError) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(e),
+                         headers={"Retry-After": "1"})
+
+
+def _verify_token(token: str) -> dict:
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+def _decode_token(token: str) -> dict:
+    """서명/만료 검증 후 클레임 반환 (sub 가 없거나 유효하지 않으면 401)
+
+    같은 토큰은 검증된 클레임 캐시로 처리한다 (src/domains/user/token_cache.py)
+    """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
+        payload = token_claims_cache.decode(token, _verify_token)
     except JWTError:
         raise credentials_exception
-    else:
-        user = user_service.get_user_sync(db, username=username)
-        if user is None:
-            raise credentials_exception
-        return user
+    if payload.get("sub") is None:
+        raise credentials_exception
+    return payload
+
+
+def get_current_user_with_sync(token: str = Depends(oauth2_scheme),
+                               db: Session = Depends(get_db)):
+    payload = _decode_token(token)
+    user = user_service.get_user_sync(db, username=payload["sub"])
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
 
 
 async def get_current_user_with_async(token: str = Depends(oauth2_scheme),
                                       db: AsyncSession = Depends(get_async_db)) -> User:
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Could not validate credentials",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
     """
     헤더 정보의 토큰 값을 읽어 사용자 객체를 리턴
+    (sub, ver) 별 인증 사용자 캐시를 사용하므로 적중 시 DB 조회 없음 (src/domains/user/auth_cache.py)
     """
-    try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        username: str = payload.get("sub")
-        if username is None:
-            raise credentials_exception
-    except JWTError:
-        raise credentials_exception
-    else:
-        user = await user_service.get_user_async(db, username=username)
-        if user is None:
-            raise credentials_exception
-        return user
+    payload = _decode_token(token)
+    user = await resolve_user(db, payload["sub"], payload.get("ver", 0))
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return user
+
+
+async def claims_from_token(token: str, db: AsyncSession) -> UserClaims:
+    """토큰 클레임(uid, sub)만으로 인증 사용자 생성 - DB/캐시 조회 없음
+
+    uid 클레임이 없는 이전 토큰만 캐시/DB 로 조회하고, 이때 사용한 커넥션은 바로 반환한다.
+    """
+    payload = _decode_token(token)
+    if payload.get("uid") is not None:
+        return UserClaims(id=payload["uid"], username=payload["sub"])
+
+    user = await resolve_user(db, payload["sub"], payload.get("ver", 0))
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    claims = UserClaims(id=user.id, username=user.username)
+    await db.close()  # 스트림 등 긴 요청이 커넥션을 붙잡지 않도록 반환 (세션은 이후에도 사용 가능)
+    return claims
+
+
+async def get_current_user_claims(token: str = Depends(oauth2_scheme),
+                                  db: AsyncSession = Depends(get_async_db)) -> UserClaims:
+    """사용자 id/username 만 필요한 라우트용 인증 (ORM User 가 필요하면 get_current_user_with_async)"""
+    return await claims_from_token(token, db)
 
 
 @router.post("/create", status_code=status.HTTP_204_NO_CONTENT)
-def user_create(_user_create: UserCreate, db: Session = Depends(get_db)):
-    user = user_service.get_existing_user(db, user_create=_user_create)
-    if user:
+async def user_create(_user_create: UserCreate, db: AsyncSession = Depends(get_async_db)):
+    """회원 가입 - 중복 확인과 저장을 INSERT ... ON CONFLICT 한 문장으로 처리 (충돌 시 409)"""
+    try:
+        created = await user_service.create_user(db=db, user_create=_user_create)
+    except PasswordHasherBusyError as e:
+        raise _password_hasher_busy(e)
+    if not created:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
             detail="This user already exists. Please try another one.",
         )
-    user_service.create_user(db=db, user_create=_user_create)
 
 
 @router.post("/login", response_model=Token)
@@ -84,8 +129,11 @@ async def login_for_access_token(
         form_data: OAuth2PasswordRequestForm = Depends(), db: AsyncSession = Depends(get_async_db)
 ):
     # check user and password
-    user = await user_service.get_user_async(db, form_data.username)
-    if not user or not pwd_context.verify(form_data.password, user.password):
+    try:
+        user = await user_service.authenticate_async(db, form_data.username, form_data.password)
+    except PasswordHasherBusyError as e:
+        raise _password_hasher_busy(e)
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect username or password",
@@ -95,6 +143,8 @@ async def login_for_access_token(
     # make access token
     data = {
         "sub": user.username,
+        "uid": user.id,  # claims 모드 (get_current_user_claims) 에서 DB 조회 없이 사용
+        "ver": user.token_version,  # 올리면 이 토큰 무효 (인증 사용자 캐시 키)
         "exp": datetime.utcnow() + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
     }
     access_token = jwt.encode(data, SECRET_KEY, algorithm=ALGORITHM)
@@ -27,6 +27,24 @@ class UserCreate(BaseModel):
         return v
 
 
+class UserImportItem(BaseModel):
+    username: str
+    password: str
+    email: EmailStr
+
+    @field_validator("username", "password", "email")
+    def not_empty(cls, v):
+        if not v or not v.strip():
+            raise ValueError("All fields cannot be empty")
+        return v
+
+
+class UserClaims(BaseModel):
+    """토큰 클레임만으로 만든 인증 사용자 (DB 조회 없음 - id/username 만 필요한 라우트용)"""
+    id: int
+    username: str
+
+
 class User(BaseModel):
     id: int
     username: str
@@ -1,37 +1,97 @@
-from passlib.context import CryptContext
+import asyncio
+import os
+from typing import List, Optional, Tuple
+
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.domains.user.models import User
-from src.domains.user.schemas import UserCreate
+from src.domains.user.password import password_hasher, pwd_context  # noqa: F401 (pwd_context 기존 import 경로)
+from src.domains.user.schemas import UserCreate, UserImportItem
+
+
+USER_IMPORT_MAX_BATCH = int(os.getenv("USER_IMPORT_MAX_BATCH", 1000))  # import_users 한 번(INSERT 한 문장)의 최대 행 수
+
+
+def _insert_users(rows: List[dict]):
+    """username/email unique 인덱스 충돌 행은 건너뛰는 INSERT (중복 확인 조회 없이 한 번의 왕복)"""
+    return insert(User).values(rows).on_conflict_do_nothing().returning(User.username)
+
+
+async def create_user(db: AsyncSession, user_create: UserCreate) -> bool:
+    """회원 가입 - INSERT ... ON CONFLICT DO NOTHING RETURNING 한 문장으로 중복 확인과 저장을 처리
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    bcrypt 는 전용 executor 에서 실행한다 (src/domains/user/password.py).
+    중복 여부를 먼저 조회하지 않으므로 중복 요청도 해시 비용은 발생한다.
 
+    Returns:
+        생성 여부 (username 또는 email 이 이미 있으면 False)
+    """
+    hashed = await password_hasher.hash(user_create.password1)
+    created = (await db.execute(_insert_users([{
+        "username": user_create.username,
+        "password": hashed,
+        "email": user_create.email,
+    }]))).scalar_one_or_none()
+    await db.commit()
+    return created is not None
 
-def create_user(db: Session, user_create: UserCreate):
-    db_user = User(
-        username=user_create.username,
-        password=pwd_context.hash(user_create.password1),
-        email=user_create.email,
-    )
-    db.add(db_user)
-    db.commit()
 
+async def _hash_passwords(passwords: List[str]) -> List[str]:
+    """비밀번호마다 (각자 솔트로) 해시 - 워커 수만큼씩 나눠 실행하여 대기열 제한을 넘지 않도록 한다"""
+    hashes: List[str] = []
+    for start in range(0, len(passwords), password_hasher.workers):
+        chunk = passwords[start:start + password_hasher.workers]
+        hashes.extend(await asyncio.gather(*(password_hasher.hash(p) for p in chunk)))
+    return hashes
 
-def get_existing_user(db: Session, user_create: UserCreate):
-    return (
-        db.query(User)
-        .filter(
-            (User.username == user_create.username) | (User.email == user_create.email)
-        )
-        .first()
-    )
+
+async def import_users(db: AsyncSession, users: List[UserImportItem]) -> Tuple[List[str], List[str]]:
+    """사용자 일괄 등록 (테스트 테넌트 시드용, scripts/import_users.py) - 배치 전체를 INSERT 한 문장, commit 1회
+
+    Returns:
+        (생성된 username 목록, 충돌로 건너뛴 username 목록)
+    """
+    hashes = await _hash_passwords([user.password for user in users])
+    result = await db.execute(_insert_users([
+        {"username": user.username, "password": hashed, "email": user.email}
+        for user, hashed in zip(users, hashes)
+    ]))
+    created = set(result.scalars().all())
+    await db.commit()
+
+    created_usernames, skipped_usernames = [], []
+    for user in users:
+        if user.username in created:
+            created_usernames.append(user.username)
+            created.discard(user.username)  # 배치 안의 같은 username 은 첫 항목만 생성
+        else:
+            skipped_usernames.append(user.username)
+    return created_usernames, skipped_usernames
 
 
 async def get_user_async(db: AsyncSession, username: str):
     result = await db.execute(select(User).filter(User.username == username))
-    return result.scalar_one()
+    return result.scalar_one_or_none()
+
+
+async def authenticate_async(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    """로그인 검증 - bcrypt 는 전용 executor 에서 실행 (이벤트 루프를 막지 않음)
+
+    bcrypt cost 설정이 바뀌었으면 새 cost 의 해시로 바꿔 저장한다.
+    """
+    user = await get_user_async(db, username)
+    if user is None:
+        return None
+    verified, new_hash = await password_hasher.verify(password, user.password)
+    if not verified:
+        return None
+    if new_hash is not None:
+        user.password = new_hash
+        await db.commit()
+    return user
 
 
 def get_user_sync(db: Session, username: str):
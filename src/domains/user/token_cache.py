@@ -0,0 +1,84 @@
+"""검증된 JWT 클레임 캐시
+
+jwt.decode 는 매 요청 base64/JSON 파싱과 HMAC 서명 검증을 수행하지만, 클라이언트는 같은 토큰을
+만료 전까지 수천 번 보낸다. 검증에 성공한 토큰의 클레임을 토큰 해시(SHA-256) 키로 exp 까지 보관하여
+같은 토큰은 해시 계산과 dict 조회만으로 처리한다.
+
+- 검증에 성공한 토큰만 저장하므로, 서명이 다른(위조) 토큰은 해시가 달라 항상 jwt.decode 를 거친다.
+- exp 가 지나면 적중하지 않는다 (exp 가 없는 토큰은 JWT_CLAIMS_CACHE_MAX_TTL 까지만 유지).
+- 크기 제한(JWT_CLAIMS_CACHE_SIZE)을 넘으면 오래 사용하지 않은 토큰부터 제거한다 (0 이면 캐시 안 함).
+- 동기 라우터(스레드풀)와 이벤트 루프에서 함께 사용하므로 lock 으로 보호한다.
+
+메트릭 (/metrics):
+    jwt_claims_cache_requests_total{result}   result: hit / miss
+"""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple
+
+from prometheus_client import Counter
+
+JWT_CLAIMS_CACHE_SIZE = int(os.getenv("JWT_CLAIMS_CACHE_SIZE", 10000))
+JWT_CLAIMS_CACHE_MAX_TTL = float(os.getenv("JWT_CLAIMS_CACHE_MAX_TTL", 300.0))
+
+JWT_CLAIMS_CACHE_REQUESTS = Counter(
+    "jwt_claims_cache_requests_total",
+    "Validated JWT claims cache lookups by result",
+    ["result"],
+)
+
+
+class TokenClaimsCache:
+    """토큰 해시 → (만료 시각, 클레임) LRU"""
+
+    def __init__(self, max_size: int = JWT_CLAIMS_CACHE_SIZE, max_ttl: float = JWT_CLAIMS_CACHE_MAX_TTL):
+        self.max_size = max_size
+        self.max_ttl = max_ttl
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def decode(self, token: str, verify: Callable[[str], dict]) -> dict:
+        """캐시된 클레임을 반환하고, 없으면 verify(token) (서명/만료 검증) 결과를 저장 후 반환
+
+        verify 의 예외(JWTError 등)는 그대로 전파되며 저장하지 않는다.
+        """
+        if self.max_size <= 0:
+            return verify(token)
+
+        key = hashlib.sha256(token.encode()).digest()
+        claims = self._get(key)
+        if claims is not None:
+            JWT_CLAIMS_CACHE_REQUESTS.labels(result="hit").inc()
+            return claims
+
+        JWT_CLAIMS_CACHE_REQUESTS.labels(result="miss").inc()
+        claims = verify(token)
+        expires_at = float(claims["exp"]) if "exp" in claims else time.time() + self.max_ttl
+        with self._lock:
+            self._entries[key] = (expires_at, claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return claims
+
+    def _get(self, key: bytes) -> Optional[dict]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+token_claims_cache = TokenClaimsCache()
@@ -1,3 +1,4 @@
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from prometheus_fastapi_instrumentator import Instrumentator
@@ -8,7 +9,7 @@ from src.domains.sync_example.presentation import no_login_router as sync_exampl
     login_router as sync_example_router_v2
 from src.domains.async_example.presentation import no_login_router as async_example_router_v1
 from src.domains.question import router as question_router
-from src.domains.answer import router as answer_router
+from src.domains.answer import router as answer_router, async_router as answer_async_router
 from src.domains.user import router as user_router
 from src.domains.standard.presentation.standard_v1 import router_v1 as standard_router
 from src.domains.standard.presentation.standard_v2 import router_v2 as standard_router_v2
@@ -20,17 +21,39 @@ from src.domains.batch.router import router as batch_router
 from src.exceptions import PLException, BLException, DLException
 from src.common.scheduler import start_scheduler, stop_scheduler
 from src.domains.notification.notification_poller import notification_poller
+from src.database.database import read_engine_router, sync_read_engine_router, async_engine_primary, pool_controller
+from src.database.consistency import ConsistencyTokenMiddleware, CONSISTENCY_HEADER
+from src.database.query_metrics import QueryMetricsMiddleware
+from src.database.redis_pool import redis_pool
+from src.common.warmup import warmup
+from src.domains.user.password import password_hasher
+
+# 답변 API 구현 (같은 경로): sync - 스레드풀 + 동기 세션 (기본), async - 비동기 세션
+ANSWER_API_MODE = os.getenv("ANSWER_API_MODE", "sync").lower()
+if ANSWER_API_MODE not in ("sync", "async"):
+    raise ValueError(f"Invalid ANSWER_API_MODE: {ANSWER_API_MODE}")
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # 시작 시
     print("애플리케이션 시작")
+    redis_pool.init()  # 공용 Redis 커넥션 풀 생성
     start_scheduler()  # 스케줄러 시작
     await notification_poller.start()  # 알림 폴링 시작
+    await read_engine_router.start()  # 읽기 엔진 복제 지연 측정 시작
+    await sync_read_engine_router.start()
+    await pool_controller.start()  # 적응형 풀 크기 조절 (DB_POOL_CONTROLLER_ENABLED=true 일 때)
+    await warmup.start()  # 커넥션 풀/컴파일 캐시 워밍업 (완료 전까지 /ready 503)
     yield
     # 종료 시
+    await warmup.stop()
+    await pool_controller.stop()
+    await sync_read_engine_router.stop()
+    await read_engine_router.stop()  # 읽기 엔진 복제 지연 측정 중지
     await notification_poller.stop()  # 알림 폴링 중지
     stop_scheduler()  # 스케줄러 종료
+    password_hasher.shutdown()  # 비밀번호 해시 executor 정리
+    await redis_pool.close()  # Redis 커넥션 풀 정리
     print("애플리케이션 종료")
 
 app = FastAPI(lifespan=lifespan)
@@ -49,12 +72,19 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[CONSISTENCY_HEADER],
 )
+
+# Read-your-writes 일관성 토큰 (쓰기 응답에 Primary WAL LSN 전달, 읽기 요청 시 Replica 라우팅에 반영)
+app.add_middleware(ConsistencyTokenMiddleware, primary_engine=async_engine_primary)
+
+# SQL 문장별 실행 시간을 라우트 단위로 집계 (/metrics, /api/v1/standard/query-stats)
+app.add_middleware(QueryMetricsMiddleware)
 app.include_router(sync_example_router_v1.router)
 app.include_router(sync_example_router_v2.router)
 app.include_router(async_example_router_v1.router)
 app.include_router(question_router.router)
-app.include_router(answer_router.router)
+app.include_router(answer_async_router.router if ANSWER_API_MODE == "async" else answer_router.router)
 app.include_router(user_router.router)
 
 # 표준 형식 테스트용 API
@@ -102,6 +132,20 @@ async def root():
     return {"message": "Hello World"}
 
 
+@app.get("/ready")
+async def ready():
+    """워밍업 완료 여부 (로드밸런서 헬스체크용, 완료 전에는 503)"""
+    state = warmup.state
+    if not state.ready:
+        return JSONResponse(status_code=503, content={"status": "warming_up"})
+    return {
+        "status": "ready",
+        "duration_s": state.duration_s,
+        "connections": state.connections,
+        "errors": state.errors,
+    }
+
+
 @app.get("/hello/{name}")
 async def say_hello(name: str):
     return {"message": f"Hello {name}"}
@@ -0,0 +1,62 @@
+import statistics
+import time
+import timeit
+
+from jose import jwt
+
+from src.domains.user.token_cache import TokenClaimsCache
+
+"""
+JWT 디코딩 비용 비교 (python-jose jwt.decode vs 검증된 클레임 캐시):
+
+같은 토큰을 반복 디코딩할 때 1회당 비용(µs)을 측정합니다. 캐시는 첫 호출에서만 jwt.decode 를 실행하고
+이후에는 SHA-256 해시 + dict 조회만 수행합니다. 토큰 수가 캐시 크기를 넘는 경우(매번 miss)도 함께 측정하여
+캐시가 없을 때보다 느려지지 않는지 확인합니다.
+
+실행 방법:
+    python tests/performance/test_jwt_decode_benchmark.py
+"""
+
+SECRET_KEY = "benchmark-secret"
+ALGORITHM = "HS256"
+NUMBER = 20_000
+REPEAT = 5
+
+
+def verify(token: str) -> dict:
+    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+def make_token(sub: str) -> str:
+    return jwt.encode({"sub": sub, "uid": 1, "ver": 0, "exp": int(time.time()) + 3600},
+                      SECRET_KEY, algorithm=ALGORITHM)
+
+
+def per_call_us(statement) -> float:
+    return statistics.median(timeit.repeat(statement, number=NUMBER, repeat=REPEAT)) / NUMBER * 1_000_000
+
+
+def main():
+    print("\n" + "🚀 JWT 디코딩 비용 비교 🚀".center(80))
+    print("=" * 80)
+
+    token = make_token("benchmark")
+    tokens = [make_token(f"user{i}") for i in range(NUMBER)]
+
+    no_cache = per_call_us(lambda: verify(token))
+
+    cache = TokenClaimsCache(max_size=10_000)
+    cache.decode(token, verify)
+    hit = per_call_us(lambda: cache.decode(token, verify))
+
+    thrashing = TokenClaimsCache(max_size=10)
+    cycle = iter(tokens * (REPEAT + 1))
+    miss = per_call_us(lambda: thrashing.decode(next(cycle), verify))
+
+    print(f"├─ jwt.decode (캐시 없음)  : {no_cache:8.2f} µs/회")
+    print(f"├─ 캐시 적중 (같은 토큰)   : {hit:8.2f} µs/회  ({no_cache / hit:.1f}배 빠름)")
+    print(f"└─ 캐시 miss (매번 새 토큰): {miss:8.2f} µs/회  (캐시 없음 대비 +{miss - no_cache:.2f} µs)")
+
+
+if __name__ == "__main__":
+    main()
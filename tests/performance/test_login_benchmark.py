@@ -0,0 +1,89 @@
+import asyncio
+import os
+import statistics
+import time
+
+from passlib.hash import bcrypt
+
+from src.domains.user.password import PasswordHasher
+
+"""
+로그인(비밀번호 검증) 처리량 비교 - bcrypt cost / executor 종류 / 워커 수별:
+
+동시 로그인 LOGINS 개를 한꺼번에 보내고 (asyncio.gather) 전부 끝날 때까지의 처리량(logins/s)과,
+그동안 이벤트 루프가 다른 요청을 얼마나 늦게 처리하는지(10ms 주기 타이머의 최대/평균 지연)를 측정합니다.
+
+    inline : 이벤트 루프에서 직접 bcrypt.verify (기존 로그인 방식 - 루프가 멈춤)
+    thread : PasswordHasher(mode="thread", workers=N)
+    process: PasswordHasher(mode="process", workers=N)
+
+DB 를 거치지 않고 검증 비용만 측정합니다 (로그인 요청 비용의 대부분).
+
+실행 방법:
+    python tests/performance/test_login_benchmark.py
+"""
+
+COSTS = [10, 11, 12]
+WORKER_COUNTS = [1, 2, 4, os.cpu_count() or 1]
+LOGINS = 32
+PASSWORD = "benchmark-password"
+
+
+def _verify(secret: str, hashed: str) -> bool:
+    return bcrypt.verify(secret, hashed)
+
+
+async def measure_loop_lag(stop: asyncio.Event, lags: list, interval: float = 0.01):
+    """interval 주기 타이머가 예정보다 늦게 깨어난 시간 (ms) - 다른 요청이 기다리는 시간"""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        lags.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def run_logins(verify) -> tuple:
+    """(처리량 logins/s, 루프 지연 최대 ms, 루프 지연 평균 ms)"""
+    stop, lags = asyncio.Event(), []
+    ticker = asyncio.create_task(measure_loop_lag(stop, lags))
+    await asyncio.sleep(0.02)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(verify() for _ in range(LOGINS)))
+    elapsed = time.perf_counter() - start
+    stop.set()
+    await ticker
+    assert all(results)
+    return LOGINS / elapsed, max(lags, default=0), statistics.mean(lags) if lags else 0
+
+
+async def main():
+    print("\n" + "🚀 로그인(bcrypt 검증) 처리량 비교 🚀".center(80))
+    print("=" * 80)
+    print(f"동시 로그인 {LOGINS}개, CPU {os.cpu_count()}개")
+
+    for cost in COSTS:
+        hashed = bcrypt.using(rounds=cost).hash(PASSWORD)
+        print(f"\n🔐 cost {cost}")
+
+        async def inline():
+            return _verify(PASSWORD, hashed)
+
+        throughput, lag_max, lag_mean = await run_logins(inline)
+        print(f"├─ inline        : {throughput:8.1f} logins/s | 루프 지연 최대 {lag_max:8.1f}ms 평균 {lag_mean:7.1f}ms")
+
+        for mode in ("thread", "process"):
+            for workers in sorted(set(WORKER_COUNTS)):
+                hasher = PasswordHasher(mode=mode, workers=workers, max_queue=LOGINS)
+
+                async def pooled():
+                    return await hasher._run("verify", _verify, PASSWORD, hashed)
+
+                await pooled()  # 워커 생성 (process 모드의 프로세스 시작 비용 제외)
+                throughput, lag_max, lag_mean = await run_logins(pooled)
+                hasher.shutdown()
+                print(f"├─ {mode:<7} x{workers:<4} : {throughput:8.1f} logins/s | "
+                      f"루프 지연 최대 {lag_max:8.1f}ms 평균 {lag_mean:7.1f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
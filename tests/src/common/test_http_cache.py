@@ -0,0 +1,36 @@
+"""
+ETag / If-None-Match 조건부 요청 유틸 테스트
+
+    pytest tests/src/common/test_http_cache.py -v
+"""
+
+from datetime import datetime
+
+from src.common.http_cache import etag_matches, make_etag, not_modified
+
+
+def test_make_etag_is_quoted_and_changes_with_stamp():
+    stamp = (datetime(2024, 5, 1, 12, 0), 3, 2, None, 0)
+    etag = make_etag(1, False, *stamp)
+
+    assert etag.startswith('"') and etag.endswith('"')
+    assert etag == make_etag(1, False, *stamp)
+    assert etag != make_etag(1, False, datetime(2024, 5, 1, 12, 0), 4, 2, None, 0)  # 투표 수 변경
+    assert etag != make_etag(1, True, *stamp)  # 투표자 포함 여부
+
+
+def test_etag_matches_list_weak_and_wildcard():
+    etag = '"abc"'
+    assert etag_matches('"abc"', etag)
+    assert etag_matches('"zzz", W/"abc"', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches('"zzz"', etag)
+    assert not etag_matches(None, etag)
+
+
+def test_not_modified_has_no_body():
+    response = not_modified('"abc"', "no-cache")
+    assert response.status_code == 304
+    assert response.body == b""
+    assert response.headers["etag"] == '"abc"'
+    assert response.headers["cache-control"] == "no-cache"
@@ -0,0 +1,42 @@
+"""
+커서(keyset) 페이지네이션 유틸 테스트
+
+    pytest tests/src/common/test_pagination.py -v
+"""
+
+from datetime import datetime
+from types import SimpleNamespace
+
+import pytest
+
+from src.common.pagination import InvalidCursorError, decode_cursor, encode_cursor, next_cursor
+from src.domains.standard.database.performance_queries import performance_data_statements
+
+
+def test_cursor_round_trip():
+    created = datetime(2024, 5, 19, 12, 30, 15, 123456)
+    cursor = encode_cursor(created, 42)
+
+    assert decode_cursor(cursor, (datetime, int)) == (created, 42)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", encode_cursor(1, 2), encode_cursor("x")])
+def test_invalid_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursorError):
+        decode_cursor(cursor, (int,))
+
+
+def test_next_cursor_only_when_page_is_full():
+    rows = [SimpleNamespace(id=1), SimpleNamespace(id=2)]
+
+    assert decode_cursor(next_cursor(rows, 2, "id"), (int,)) == (2,)
+    assert next_cursor(rows, 3, "id") is None
+    assert next_cursor([], 3, "id") is None
+
+
+def test_bulk_read_keyset_statement_skips_offset():
+    _, offset_statement, offset_params = performance_data_statements(100, 90000, None, None)
+    _, keyset_statement, keyset_params = performance_data_statements(100, 90000, None, None, after_id=90000)
+
+    assert "OFFSET" in offset_statement.text and "OFFSET" not in keyset_statement.text
+    assert keyset_params == {"limit": 100, "after_id": 90000}
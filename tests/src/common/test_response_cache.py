@@ -0,0 +1,101 @@
+"""
+Redis 응답 캐시(버전 네임스페이스) 테스트 (Redis 서버 없이 메모리 클라이언트로 확인)
+
+    pytest tests/src/common/test_response_cache.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from src.common import response_cache
+from src.common.response_cache import ResponseCache
+
+
+class _MemoryPipeline:
+    def __init__(self, store):
+        self.store = store
+        self.commands = []
+
+    def incr(self, key):
+        self.commands.append(("incr", key))
+
+    def expire(self, key, seconds):
+        self.commands.append(("expire", key))
+
+    async def execute(self):
+        for command, key in self.commands:
+            if command == "incr":
+                self.store[key] = str(int(self.store.get(key, 0)) + 1)
+
+
+class _MemoryRedis:
+    def __init__(self, store):
+        self.store = store
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def set(self, key, value, ex=None):
+        self.store[key] = value
+
+    def pipeline(self, transaction=True):
+        return _MemoryPipeline(self.store)
+
+
+class _BrokenRedis:
+    async def get(self, key):
+        raise ConnectionError("redis down")
+
+
+@pytest.fixture
+def store(monkeypatch):
+    store = {}
+    monkeypatch.setattr(response_cache.redis_pool, "async_client", lambda: _MemoryRedis(store))
+    return store
+
+
+def _renderer(bodies):
+    calls = []
+
+    async def render():
+        calls.append(1)
+        return bodies[len(calls) - 1]
+
+    return render, calls
+
+
+def test_hit_after_miss_and_invalidate_bumps_namespace(store):
+    cache = ResponseCache("question_list", ttl=30, enabled=True)
+    render, calls = _renderer(['{"v": 1}', '{"v": 2}'])
+
+    async def scenario():
+        first = await cache.get_or_render("all", (0, 10, ""), render)
+        second = await cache.get_or_render("all", (0, 10, ""), render)
+        await cache.invalidate("all")
+        third = await cache.get_or_render("all", (0, 10, ""), render)
+        return first, second, third
+
+    assert asyncio.run(scenario()) == ('{"v": 1}', '{"v": 1}', '{"v": 2}')
+    assert len(calls) == 2
+    assert store["respcache:question_list:all:ver"] == "1"
+
+
+def test_render_errors_are_not_cached(store):
+    cache = ResponseCache("question_detail", ttl=30, enabled=True)
+
+    async def not_found():
+        raise LookupError("missing")
+
+    with pytest.raises(LookupError):
+        asyncio.run(cache.get_or_render("1", (False,), not_found))
+    assert store == {}
+
+
+def test_redis_errors_fall_back_to_render(monkeypatch):
+    monkeypatch.setattr(response_cache.redis_pool, "async_client", lambda: _BrokenRedis())
+    cache = ResponseCache("question_list", ttl=30, enabled=True)
+    render, calls = _renderer(['{"v": 1}'])
+
+    assert asyncio.run(cache.get_or_render("all", (0, 10, ""), render)) == '{"v": 1}'
+    assert len(calls) == 1
@@ -0,0 +1,104 @@
+"""
+기동 워밍업 및 readiness 테스트 (/ready 전환, 실패 단계 처리, 풀 크기까지 커넥션 워밍)
+
+    pytest tests/src/common/test_warmup.py -v
+"""
+
+import asyncio
+import json
+import logging
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.pool import QueuePool
+
+import src.main as main
+from src.common import warmup as warmup_module
+from src.common.warmup import Warmup, warm_async_engine, warm_sync_engine
+
+
+@pytest.fixture
+def sync_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'warmup.db'}", poolclass=QueuePool, pool_size=3, max_overflow=5)
+    yield engine
+    engine.dispose()
+
+
+class _AsyncConnection:
+    def __init__(self, engine):
+        self.engine = engine
+        self.connection = None
+
+    async def start(self):
+        self.connection = self.engine.connect()
+        return self
+
+    async def close(self):
+        self.connection.close()
+
+
+class _AsyncEngine:
+    """warm_async_engine 이 사용하는 부분만 흉내 (sync_engine.pool, connect().start())"""
+
+    def __init__(self, sync_engine):
+        self.sync_engine = sync_engine
+
+    def connect(self):
+        return _AsyncConnection(self.sync_engine)
+
+
+def test_engines_are_warmed_up_to_pool_size(sync_engine):
+    """오버플로 커넥션은 반환 시 닫히므로 pool_size 까지만 열고 모두 풀에 반환한다"""
+    assert warm_sync_engine(sync_engine, 10) == 3
+    assert (sync_engine.pool.checkedin(), sync_engine.pool.checkedout()) == (3, 0)
+
+    assert asyncio.run(warm_async_engine(_AsyncEngine(sync_engine), 2)) == 2
+    assert asyncio.run(warm_async_engine(_AsyncEngine(sync_engine), 10)) == 3
+    assert sync_engine.pool.checkedout() == 0
+
+
+@pytest.fixture
+def warmup(monkeypatch, sync_engine):
+    async def warm_redis(count):
+        return {"redis_async": count, "redis_sync": count}
+
+    monkeypatch.setattr(warmup_module, "ASYNC_ENGINES", {"async_primary": _AsyncEngine(sync_engine)})
+    monkeypatch.setattr(warmup_module, "SYNC_ENGINES", {"sync_primary": sync_engine})
+    monkeypatch.setattr(warmup_module, "warm_redis_pools", warm_redis)
+    monkeypatch.setattr(warmup_module, "_prime_async_queries", lambda engine: asyncio.sleep(0))
+    monkeypatch.setattr(warmup_module, "_prime_sync_queries", lambda engine: None)
+    warmup = Warmup()
+    monkeypatch.setattr(main, "warmup", warmup)
+    return warmup
+
+
+def _ready():
+    response = asyncio.run(main.ready())
+    if isinstance(response, dict):
+        return 200, response
+    return response.status_code, json.loads(response.body)
+
+
+def test_ready_returns_503_until_warmup_finishes(warmup):
+    assert _ready() == (503, {"status": "warming_up"})
+
+    asyncio.run(warmup.run())
+
+    status_code, body = _ready()
+    assert status_code == 200
+    assert body["connections"] == {"async_primary": 3, "sync_primary": 3, "redis_async": 5, "redis_sync": 5}
+    assert body["errors"] == []
+
+
+def test_failed_step_is_logged_and_does_not_block_readiness(warmup, monkeypatch, caplog):
+    async def broken_redis(count):
+        raise ConnectionError("redis down")
+
+    monkeypatch.setattr(warmup_module, "warm_redis_pools", broken_redis)
+    with caplog.at_level(logging.ERROR, logger=warmup_module.__name__):
+        asyncio.run(warmup.run())
+
+    status_code, body = _ready()
+    assert status_code == 200
+    assert body["errors"] == ["redis: redis down"]
+    assert "Warm-up step failed: redis" in caplog.text
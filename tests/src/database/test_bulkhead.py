@@ -0,0 +1,69 @@
+"""
+워크로드별 커넥션 풀 파티션(Bulkhead) 테스트
+
+    pytest tests/src/database/test_bulkhead.py -v
+"""
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from src.database.bulkhead import (
+    PARTITION_BULK,
+    PARTITION_INTERACTIVE,
+    BulkheadStatsCollector,
+    get_partition,
+    use_partition,
+)
+from src.database.pool_metrics import InstrumentedQueuePool
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    async def current_partition():
+        return get_partition()
+
+    @app.get("/default")
+    async def default(partition: str = Depends(current_partition)):
+        return {"partition": partition}
+
+    @app.get("/bulk", dependencies=[Depends(use_partition(PARTITION_BULK))])
+    async def bulk(partition: str = Depends(current_partition)):
+        return {"partition": partition}
+
+    @app.get("/bulk-sync", dependencies=[Depends(use_partition(PARTITION_BULK))])
+    def bulk_sync(partition: str = Depends(current_partition)):
+        return {"partition": partition}
+
+    return app
+
+
+def test_partition_dependency_applies_to_later_dependencies():
+    """엔드포인트에 지정한 파티션이 같은 요청의 DB 의존성에 보이고, 다른 요청에는 남지 않는다"""
+    client = TestClient(_app())
+
+    assert client.get("/bulk").json() == {"partition": PARTITION_BULK}
+    assert client.get("/bulk-sync").json() == {"partition": PARTITION_BULK}
+    assert client.get("/default").json() == {"partition": PARTITION_INTERACTIVE}
+    assert get_partition() == PARTITION_INTERACTIVE
+
+
+def test_unknown_partition_is_rejected():
+    with pytest.raises(ValueError):
+        use_partition("reporting")
+
+
+def test_stats_collector_reports_partition_capacity(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk.db'}", poolclass=InstrumentedQueuePool,
+                           pool_size=2, max_overflow=3)
+    collector = BulkheadStatsCollector()
+    collector.add(PARTITION_BULK, "sync", engine)
+    connection = engine.connect()
+
+    samples = {metric.name: metric.samples[0].value for metric in collector.collect()}
+
+    assert samples == {"db_bulkhead_capacity": 5, "db_bulkhead_in_use": 1}
+    connection.close()
+    engine.dispose()
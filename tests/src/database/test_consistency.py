@@ -0,0 +1,29 @@
+"""
+Read-your-writes 일관성 토큰 테스트
+
+    pytest tests/src/database/test_consistency.py -v
+"""
+
+from src.database.consistency import _read_request_token, parse_lsn
+
+
+def test_parse_lsn_orders_by_wal_position():
+    """LSN 문자열은 WAL 위치 순서대로 비교 가능한 정수로 변환된다"""
+    assert parse_lsn("0/16B3748") < parse_lsn("0/16B3750") < parse_lsn("1/0")
+    assert parse_lsn("16/B374D848") == (0x16 << 32) | 0xB374D848
+
+
+def test_parse_lsn_rejects_invalid_values():
+    assert parse_lsn(None) is None
+    assert parse_lsn("") is None
+    assert parse_lsn("not-an-lsn") is None
+
+
+def test_request_token_from_header_or_cookie():
+    """토큰은 헤더를 우선하고, 없으면 쿠키에서 읽는다"""
+    header_scope = {"headers": [(b"x-consistency-token", b"0/10")]}
+    cookie_scope = {"headers": [(b"cookie", b"session=abc; consistency_token=0/20")]}
+
+    assert _read_request_token(header_scope) == 0x10
+    assert _read_request_token(cookie_scope) == 0x20
+    assert _read_request_token({"headers": []}) is None
@@ -0,0 +1,144 @@
+"""
+적응형 커넥션 풀 크기 조절 컨트롤러 테스트 (크기 결정, 유효 크기 적용, 전역 예산, 여유 커넥션 조회)
+
+    pytest tests/src/database/test_pool_controller.py -v
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.exc import TimeoutError
+
+from src.database import pool_controller
+from src.database.pool_controller import AdaptivePoolController, ControlledPool, decide_capacity
+from src.database.pool_metrics import InstrumentedQueuePool
+
+
+@pytest.mark.parametrize(
+    "avg_wait_ms, timeouts, peak, expected",
+    [
+        (20.0, 0, 8, 15),  # 대기 발생 → 확장
+        (0.1, 1, 8, 15),  # pool_timeout 초과 → 확장
+        (0.1, 0, 10, 15),  # 가득 찬 채로 사용 → 확장
+        (0.1, 0, 7, 10),  # 적정 사용량 → 유지
+        (0.1, 0, 2, 7),  # 사용량 감소 → 최대 사용량 + step 까지 축소
+        (0.1, 0, 0, 5),  # 유휴 → 하한(pool_size) 까지만 축소
+    ],
+)
+def test_decide_capacity(avg_wait_ms, timeouts, peak, expected):
+    assert decide_capacity(
+        capacity=10, floor=5, ceiling=30, avg_wait_ms=avg_wait_ms, timeouts=timeouts,
+        peak_checked_out=peak, step=5, grow_wait_ms=5.0, shrink_ratio=0.5,
+    ) == expected
+
+
+def test_decide_capacity_respects_ceiling():
+    assert decide_capacity(28, 5, 30, avg_wait_ms=50.0, timeouts=0, peak_checked_out=28, step=5) == 30
+
+
+def test_set_capacity_limits_checkouts(tmp_path):
+    """유효 크기를 줄이면 그 이상의 체크아웃은 pool_timeout 후 실패하고 윈도우에 기록된다"""
+    engine = create_engine(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        poolclass=InstrumentedQueuePool,
+        pool_size=1,
+        max_overflow=5,
+        pool_timeout=0.05,
+        pool_logging_name="test_controller",
+    )
+    controlled = ControlledPool(name="test_controller", engine=engine, floor=1, ceiling=6)
+    controlled.set_capacity(2)
+
+    first, second = engine.connect(), engine.connect()
+    with pytest.raises(TimeoutError):
+        engine.connect()
+
+    window = engine.pool.drain_checkout_window()
+    assert window.checkouts == 3
+    assert window.timeouts == 1
+    assert window.peak_checked_out == 2
+
+    first.close()
+    second.close()
+    assert engine.pool.checkedout() == 0
+    engine.dispose()
+
+
+@pytest.fixture
+def controller(tmp_path):
+    """pool_size 2 (하한), max_overflow 8 (상한 10) 인 엔진 둘로 구성된 그룹 하나"""
+    engines = {
+        name: create_engine(f"sqlite:///{tmp_path / name}.db", poolclass=InstrumentedQueuePool,
+                            pool_size=2, max_overflow=8, pool_timeout=0.05, pool_logging_name=f"test_{name}")
+        for name in ("a", "b")
+    }
+    controller = AdaptivePoolController({"primary": (engines, [])}, reserved_connections=10)
+    yield controller
+    for engine in engines.values():
+        engine.dispose()
+
+
+def _budget(controller, monkeypatch, budget: int, others: int):
+    """Redis 에 다른 워커 예약 합계가 others 인 상태 (여유 커넥션 제한 없음)"""
+    async def probe_headroom(group):
+        group.headroom = None
+
+    async def sync_reservations(group):
+        return others
+
+    group = controller.groups["primary"]
+    group.budget = budget
+    monkeypatch.setattr(controller, "_probe_headroom", probe_headroom)
+    monkeypatch.setattr(controller, "_sync_reservations", sync_reservations)
+    return group
+
+
+def _capacities(group):
+    return {pool.name: pool.capacity for pool in group.controlled}
+
+
+def _saturate(pool: ControlledPool):
+    """유효 크기만큼 체크아웃하여 가득 찬 채로 사용 (확장 신호) 후 반환"""
+    connections = [pool.engine.connect() for _ in range(pool.capacity)]
+    for connection in connections:
+        connection.close()
+
+
+def test_over_budget_group_shrinks_by_the_excess(controller, monkeypatch):
+    """다른 워커가 먼저 확장하여 예산을 넘으면 초과분만큼 (하한까지) 축소"""
+    group = _budget(controller, monkeypatch, budget=12, others=5)
+    for pool in group.controlled:
+        pool.set_capacity(5)
+
+    asyncio.run(controller.adjust_group(group))  # 예약 10 + 다른 워커 5 > 예산 12 → 3 초과
+
+    assert _capacities(group) == {"a": 2, "b": 5}
+
+
+def test_growth_is_clipped_to_available_budget(controller, monkeypatch):
+    group = _budget(controller, monkeypatch, budget=20, others=5)
+    for pool in group.controlled:
+        pool.set_capacity(5)
+        _saturate(pool)
+
+    asyncio.run(controller.adjust_group(group))  # 둘 다 +5 를 원하지만 여유는 20 - 5 - 10 = 5
+
+    assert _capacities(group) == {"a": 10, "b": 5}
+
+
+def test_headroom_probe_does_not_use_saturated_pool(controller, monkeypatch):
+    """조절 대상 풀이 가득 차도 전용 커넥션으로 여유 커넥션을 조회하고 체크아웃 윈도우에 기록하지 않는다"""
+    monkeypatch.setattr(pool_controller, "CONNECTION_HEADROOM_QUERY",
+                        text("SELECT 100 AS max_connections, 30 AS connections"))
+    group = controller.groups["primary"]
+    pool = group.controlled[0].pool
+    held = [group.controlled[0].engine.connect() for _ in range(group.controlled[0].capacity)]
+    pool.drain_checkout_window()
+
+    asyncio.run(controller._probe_headroom(group))
+
+    assert (group.budget, group.headroom) == (90, 60)
+    assert pool.drain_checkout_window().checkouts == 0
+    for connection in held:
+        connection.close()
@@ -0,0 +1,57 @@
+"""
+커넥션 풀 메트릭 테스트 (실제 QueuePool 스냅샷, 체크아웃 대기 히스토그램의 engine 라벨)
+
+    pytest tests/src/database/test_pool_metrics.py -v
+"""
+
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import create_engine
+
+from src.database.pool_metrics import InstrumentedQueuePool, PoolStatsCollector
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=InstrumentedQueuePool,
+                           pool_size=2, max_overflow=3, pool_logging_name="test_pool_metrics")
+    yield engine
+    engine.dispose()
+
+
+def _snapshot(collector: PoolStatsCollector) -> dict:
+    return {
+        metric.name: {sample.labels["engine"]: sample.value for sample in metric.samples}
+        for metric in collector.collect()
+    }
+
+
+def _checkouts() -> float:
+    return REGISTRY.get_sample_value("db_pool_checkout_wait_seconds_count", {"engine": "test_pool_metrics"}) or 0
+
+
+def test_collector_reports_pool_state(engine):
+    collector = PoolStatsCollector()
+    collector.add("test", engine)
+    connections = [engine.connect() for _ in range(3)]  # pool_size 2 + overflow 1
+    connections[0].close()
+
+    assert _snapshot(collector) == {
+        "db_pool_size": {"test": 2},
+        "db_pool_max_overflow": {"test": 3},
+        "db_pool_checked_out": {"test": 2},
+        "db_pool_checked_in": {"test": 1},
+        "db_pool_overflow": {"test": 1},
+    }
+    for connection in connections[1:]:
+        connection.close()
+
+
+def test_checkout_wait_is_labelled_with_engine_name_after_dispose(engine):
+    before = _checkouts()
+    engine.connect().close()
+    engine.dispose()  # pool.recreate() 후에도 같은 이름
+    engine.connect().close()
+
+    assert _checkouts() == before + 2
+    assert engine.pool.engine_name == "test_pool_metrics"
@@ -0,0 +1,57 @@
+"""
+SQL 문장별 실행 시간 측정 / 라우트별 집계 테스트
+
+    pytest tests/src/database/test_query_metrics.py -v
+"""
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.database.query_metrics import (
+    QueryMetricsMiddleware,
+    fingerprint,
+    query_stats,
+    redact_parameters,
+    register_query_metrics,
+)
+
+
+def test_fingerprint_strips_literals_and_placeholders():
+    """리터럴/바인드 파라미터가 달라도 같은 fingerprint 로 묶인다"""
+    a = fingerprint("SELECT * FROM question WHERE id IN ($1, $2)  AND subject = 'a' LIMIT 10")
+    b = fingerprint("SELECT * FROM question WHERE id IN ($1, $2, $3) AND subject = 'b''c' LIMIT 20")
+
+    assert a == b == "SELECT * FROM question WHERE id IN (...) AND subject = ? LIMIT ?"
+    assert fingerprint("SELECT %(param_1)s::text") == "SELECT ?::text"
+
+
+def test_redact_parameters_keeps_only_types():
+    assert redact_parameters({"username": "kim", "id": 1}) == {"username": "<str>", "id": "<int>"}
+    assert redact_parameters(("secret", 1.5)) == ["<str>", "<float>"]
+
+
+def test_statements_are_aggregated_per_route_template():
+    """요청마다 실행된 문장 수와 fingerprint 가 라우트 템플릿 기준으로 집계된다"""
+    engine = create_engine("sqlite://")
+    register_query_metrics(engine)
+    app = FastAPI()
+    app.add_middleware(QueryMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int):
+        with engine.connect() as conn:
+            conn.execute(text("SELECT :id"), {"id": item_id})
+            conn.execute(text("SELECT :id + 1"), {"id": item_id})
+        return {"id": item_id}
+
+    query_stats.reset()
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+
+    route = query_stats.snapshot()["/items/{item_id}"]
+    assert route["requests"] == 2
+    assert route["statements_per_request_avg"] == 2
+    assert {s["fingerprint"] for s in route["statements"]} == {"SELECT ?", "SELECT ? + ?"}
+    assert all(s["calls"] == 2 for s in route["statements"])
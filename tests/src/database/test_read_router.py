@@ -0,0 +1,84 @@
+"""
+읽기 엔진 라우터 테스트
+
+    pytest tests/src/database/test_read_router.py -v
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from src.database import read_router
+from src.database.read_router import ReadEngineRouter
+
+
+@pytest.fixture
+def router():
+    return ReadEngineRouter(
+        {"primary": create_engine("sqlite://"), "replica": create_engine("sqlite://")},
+        alpha=1.0,
+        max_lag_seconds=1.0,
+        cooldown_seconds=60,
+        error_threshold=2,
+    )
+
+
+def test_slow_engine_gets_lower_weight(router):
+    """지연 시간이 큰 엔진은 가중치가 낮아진다"""
+    router.record_latency("primary", 2.0)
+    router.record_latency("replica", 50.0)
+
+    weights = router.get_weights()
+    assert weights["primary"] > weights["replica"]
+    assert sum(weights.values()) == pytest.approx(1.0)
+
+
+def test_replica_ejected_on_lag_and_errors(router):
+    """복제 지연 초과 또는 연속 에러 시 replica 는 cool-down 동안 제외된다"""
+    router.record_replication_lag("replica", 3.0)
+    assert router.get_weights()["replica"] == 0.0
+    assert router.choose_name() == "primary"
+
+    router.stats["replica"].ejected_until = 0
+    router.record_error("replica")
+    assert router.get_weights()["replica"] > 0
+    router.record_error("replica")
+    assert router.get_weights()["replica"] == 0.0
+
+
+def test_primary_is_never_ejected(router):
+    """Primary 는 fallback 이므로 제외되지 않는다"""
+    for _ in range(5):
+        router.record_error("primary")
+    assert router.get_weights()["primary"] > 0
+
+
+def test_cursor_events_record_latency(router):
+    """쿼리 실행 이벤트로 지연 시간이 기록된다"""
+    with router.engines["replica"].connect() as conn:
+        conn.execute(text("SELECT 1"))
+    assert router.stats["replica"].samples == 1
+
+
+def _probe(router, monkeypatch, receive_lsn, replay_lsn, replay_age=600.0):
+    """SQLite replica 로 REPLICATION_LAG_QUERY 결과 행을 흉내내어 측정"""
+    monkeypatch.setattr(read_router, "REPLICATION_LAG_QUERY", text(
+        "SELECT 1 AS in_recovery, :replay_age AS replay_age, :receive_lsn AS receive_lsn, :replay_lsn AS replay_lsn"
+    ).bindparams(replay_age=replay_age, receive_lsn=receive_lsn, replay_lsn=replay_lsn))
+    asyncio.run(router.probe_replication_lag())
+
+
+def test_caught_up_replica_of_idle_primary_has_no_lag(router, monkeypatch):
+    """Primary 에 쓰기가 없어 마지막 재생 이후 오래 지났어도, 수신한 WAL 을 모두 재생했으면 지연 0"""
+    _probe(router, monkeypatch, receive_lsn="0/3000060", replay_lsn="0/3000060")
+
+    assert router.stats["replica"].replication_lag_s == 0.0
+    assert router.get_weights()["replica"] > 0
+
+
+def test_replica_behind_received_wal_reports_replay_age(router, monkeypatch):
+    _probe(router, monkeypatch, receive_lsn="0/3000100", replay_lsn="0/3000060")
+
+    assert router.stats["replica"].replication_lag_s == 600.0
+    assert router.get_weights()["replica"] == 0.0
@@ -0,0 +1,33 @@
+"""
+공용 Redis 커넥션 풀 테스트 (Redis 서버 없이 풀 객체/메트릭만 확인)
+
+    pytest tests/src/database/test_redis_pool.py -v
+"""
+
+from src.database.redis_pool import RedisPoolManager, RedisPoolStatsCollector
+
+
+def test_clients_share_one_pool():
+    """클라이언트는 매번 새로 만들어도 같은 커넥션 풀을 공유한다"""
+    manager = RedisPoolManager()
+
+    assert manager.sync_client().connection_pool is manager.sync_client().connection_pool
+    assert manager.async_client().connection_pool is manager.async_client().connection_pool
+
+
+def test_collector_reports_in_use_connections():
+    manager = RedisPoolManager()
+    manager.init()
+    pool = manager.sync_pool
+    pool.make_connection()  # 커넥션 1개 생성 후 반환하지 않은 상태 (사용 중)
+
+    samples = {
+        (metric.name, sample.labels["client"]): sample.value
+        for metric in RedisPoolStatsCollector(manager).collect()
+        for sample in metric.samples
+    }
+
+    assert samples[("redis_pool_connections_created", "sync")] == 1
+    assert samples[("redis_pool_connections_in_use", "sync")] == 1
+    assert samples[("redis_pool_connections_idle", "sync")] == 0
+    assert samples[("redis_pool_max_connections", "sync")] == pool.max_connections
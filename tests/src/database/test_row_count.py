@@ -0,0 +1,84 @@
+"""
+목록 전체 건수 계산 전략 테스트
+
+    pytest tests/src/database/test_row_count.py -v
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from src.database.row_count import (
+    COUNT_CACHED,
+    COUNT_ESTIMATED,
+    COUNT_EXACT,
+    CountCache,
+    count_statement,
+    resolve_count_strategy,
+)
+
+
+def test_resolve_count_strategy(monkeypatch):
+    monkeypatch.delenv("DB_COUNT_STRATEGY_QUESTION_LIST", raising=False)
+    monkeypatch.delenv("DB_COUNT_STRATEGY_PERFORMANCE_DATA", raising=False)
+    assert resolve_count_strategy("question_list") == COUNT_EXACT
+    assert resolve_count_strategy("performance_data") == COUNT_ESTIMATED
+
+    monkeypatch.setenv("DB_COUNT_STRATEGY_QUESTION_LIST", "Cached")
+    assert resolve_count_strategy("question_list") == COUNT_CACHED
+
+    monkeypatch.setenv("DB_COUNT_STRATEGY_QUESTION_LIST", "approximate")
+    with pytest.raises(ValueError):
+        resolve_count_strategy("question_list")
+
+
+def test_count_statement_wraps_text_once():
+    rows = text("SELECT id FROM performance_test_data WHERE category = :category")
+    wrapped = count_statement(rows)
+    assert wrapped.text == (
+        "SELECT count(*) FROM (SELECT id FROM performance_test_data WHERE category = :category) AS counted_rows"
+    )
+    assert count_statement(rows) is wrapped  # 같은 문장이면 같은 COUNT 문장 (prepared statement 캐시 적중)
+
+
+def test_count_cache_single_flight_and_ttl():
+    """같은 키 동시 요청은 1회만 계산하고, TTL 이 지나면 다시 계산한다"""
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls) * 100
+
+    async def scenario():
+        cache = CountCache(ttl=0.05)
+        first = await asyncio.gather(*[cache.get_or_compute(("question_list", ""), compute) for _ in range(5)])
+        cached = await cache.get_or_compute(("question_list", ""), compute)
+        await asyncio.sleep(0.06)
+        expired = await cache.get_or_compute(("question_list", ""), compute)
+        return first, cached, expired
+
+    first, cached, expired = asyncio.run(scenario())
+    assert first == [100] * 5
+    assert cached == 100
+    assert expired == 200
+    assert len(calls) == 2
+
+
+def test_count_cache_invalidate_target_and_max_keys():
+    async def scenario():
+        cache = CountCache(ttl=60, max_keys=2)
+
+        async def value():
+            return 1
+
+        await cache.get_or_compute(("question_list", "a"), value)
+        await cache.get_or_compute(("question_list", "b"), value)
+        await cache.get_or_compute(("notifications", 1), value)  # 가장 오래된 키 제거
+        assert list(cache._entries) == [("question_list", "b"), ("notifications", 1)]
+
+        cache.invalidate_target("question_list")
+        assert list(cache._entries) == [("notifications", 1)]
+
+    asyncio.run(scenario())
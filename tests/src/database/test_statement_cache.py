@@ -0,0 +1,52 @@
+"""
+asyncpg prepared statement 캐시 설정 테스트
+
+    pytest tests/src/database/test_statement_cache.py -v
+"""
+
+import pytest
+
+from src.database.statement_cache import asyncpg_connect_args, load_statement_cache_config
+from src.domains.standard.database.performance_queries import performance_data_statements
+
+
+def test_engine_specific_settings_override_global(monkeypatch):
+    """엔진별 환경 변수가 전역 설정보다 우선한다"""
+    monkeypatch.setenv("DB_STATEMENT_CACHE_SIZE_ASYNC_REPLICA", "500")
+    monkeypatch.setenv("DB_STATEMENT_CACHE_LIFETIME_ASYNC_REPLICA", "60")
+
+    assert asyncpg_connect_args("async_replica") == {
+        "prepared_statement_cache_size": 500,
+        "statement_cache_size": 500,
+        "max_cached_statement_lifetime": 60,
+    }
+    assert load_statement_cache_config("async_primary").size == 100
+
+
+def test_off_mode_disables_cache_and_uses_unique_names(monkeypatch):
+    """off(PgBouncer 호환) 모드는 캐시를 끄고 매번 고유한 statement 이름을 만든다"""
+    monkeypatch.setenv("DB_STATEMENT_CACHE_MODE_ASYNC_BULK", "off")
+
+    args = asyncpg_connect_args("async_bulk")
+    name_func = args["prepared_statement_name_func"]
+
+    assert args["prepared_statement_cache_size"] == 0
+    assert args["statement_cache_size"] == 0
+    assert name_func() != name_func()
+
+
+def test_invalid_mode_is_rejected(monkeypatch):
+    monkeypatch.setenv("DB_STATEMENT_CACHE_MODE_ASYNC_PRIMARY", "sometimes")
+    with pytest.raises(ValueError):
+        load_statement_cache_config("async_primary")
+
+
+def test_performance_queries_reuse_statement_per_filter_combination():
+    """같은 필터 조합이면 값이 달라도 같은 SQL 문장을 사용한다"""
+    rows_a, data_a, params_a = performance_data_statements(10, 0, "science", None)
+    rows_b, data_b, params_b = performance_data_statements(50, 100, "travel", None)
+    _, data_none, params_none = performance_data_statements(10, 0, None, None)
+
+    assert rows_a is rows_b and data_a is data_b
+    assert params_b == {"limit": 50, "offset": 100, "category": "travel"}
+    assert data_none is not data_a and "category" not in params_none
@@ -0,0 +1,49 @@
+"""
+답변 keyset 페이지 쿼리 테스트 (정렬/커서 조건이 복합 인덱스 순서와 일치하는지 확인)
+
+    pytest tests/src/domains/answer/test_answer_page.py -v
+"""
+
+from datetime import datetime
+
+from sqlalchemy.dialects import postgresql
+
+from src.domains.answer.models import Answer
+from src.domains.answer.service import answer_cursor_attributes, answer_page_statement
+from src.domains.question.models import Question  # noqa: F401 (relationship 설정용)
+from src.domains.user.models import User  # noqa: F401 (relationship 설정용)
+
+
+def _sql(statement) -> str:
+    return str(statement.compile(dialect=postgresql.dialect())).replace("\n", " ")
+
+
+def test_create_date_sort_uses_question_create_date_id_order():
+    sql = _sql(answer_page_statement(1, 20, after=(datetime(2024, 5, 1), 10)))
+
+    assert "(answer.create_date, answer.id) > (" in sql
+    assert "ORDER BY answer.create_date ASC, answer.id ASC" in sql
+    assert "LIMIT" in sql
+
+
+def test_vote_sort_is_descending():
+    sql = _sql(answer_page_statement(1, 20, sort="vote", after=(3, 10)))
+
+    assert "(answer.vote_count, answer.id) < (" in sql
+    assert "ORDER BY answer.vote_count DESC, answer.id DESC" in sql
+
+
+def test_first_page_has_no_cursor_condition():
+    assert ") > (" not in _sql(answer_page_statement(1, 20))
+
+
+def test_cursor_attributes_match_sort_columns():
+    assert answer_cursor_attributes("create_date") == ("create_date", "id")
+    assert answer_cursor_attributes("vote") == ("vote_count", "id")
+
+
+def test_composite_indexes_cover_sorts():
+    indexes = {index.name: [column.name for column in index.columns] for index in Answer.__table__.indexes}
+
+    assert indexes["ix_answer_question_create_date_id"] == ["question_id", "create_date", "id"]
+    assert indexes["ix_answer_question_vote_count_id"] == ["question_id", "vote_count", "id"]
@@ -0,0 +1,24 @@
+"""
+답변 API 동기/비동기 라우터 테스트 (ANSWER_API_MODE 전환 시 같은 경로/응답 모델 제공 확인)
+
+    pytest tests/src/domains/answer/test_answer_routers.py -v
+"""
+
+import inspect
+
+from src.domains.answer import async_router, router as sync_router
+
+
+def _routes(router):
+    return {
+        (route.path, tuple(sorted(route.methods))): (route.response_model, route.status_code)
+        for route in router.routes
+    }
+
+
+def test_async_router_matches_sync_routes():
+    assert _routes(async_router.router) == _routes(sync_router.router)
+
+
+def test_async_router_endpoints_are_coroutines():
+    assert all(inspect.iscoroutinefunction(route.endpoint) for route in async_router.router.routes)
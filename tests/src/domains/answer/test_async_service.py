@@ -0,0 +1,134 @@
+"""
+비동기 답변 서비스 테스트 (쓰기 요청당 commit 1회, 알림을 같은 트랜잭션으로 저장, 없는 질문/답변 처리)
+
+    pytest tests/src/domains/answer/test_async_service.py -v
+"""
+
+import asyncio
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine, event, select, text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from src.database.database import Base
+from src.domains.answer import async_router, async_service
+from src.domains.answer.models import Answer
+from src.domains.answer.schemas import AnswerCreate
+from src.domains.notification.models import Notification
+from src.domains.question.models import Question
+from src.domains.user.models import User
+from src.domains.user.schemas import UserClaims
+
+
+@compiles(TSVECTOR, "sqlite")
+def _tsvector_as_text(element, compiler, **kw):
+    return "TEXT"
+
+
+class _AsyncSession:
+    """동기 Session 을 AsyncSession 처럼 사용 (비동기 서비스가 사용하는 메서드만)"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def add(self, instance):
+        self.session.add(instance)
+
+    async def execute(self, statement, params=None):
+        return self.session.execute(statement, params)
+
+    async def delete(self, instance):
+        self.session.delete(instance)
+
+    async def commit(self):
+        self.session.commit()
+
+
+@pytest.fixture
+def session(monkeypatch):
+    engine = create_engine("sqlite://")
+    tables = [Base.metadata.tables[name]
+              for name in ("users", "question", "answer", "question_voter", "answer_voter", "notification")]
+    Base.metadata.create_all(engine, tables=tables)
+    invalidated = []
+
+    async def invalidate_question(question_id, lists=True):
+        invalidated.append(question_id)
+
+    monkeypatch.setattr(async_service, "invalidate_question", invalidate_question)
+    with Session(engine) as session:
+        session.add_all([
+            User(id=1, username="owner", password="x", email="owner@example.com"),
+            User(id=2, username="writer", password="x", email="writer@example.com"),
+            Question(id=10, subject="제목", content="내용", create_date=datetime.now(), user_id=1),
+        ])
+        session.commit()
+        session.invalidated = invalidated
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(session):
+    """실행된 INSERT 와 COMMIT 순서 기록"""
+    log = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if statement.startswith("INSERT"):
+            log.append(statement.split("(")[0].strip())
+
+    event.listen(session.bind, "before_cursor_execute", before_cursor_execute)
+    event.listen(session.bind, "commit", lambda conn: log.append("COMMIT"))
+    return log
+
+
+WRITER = UserClaims(id=2, username="writer")
+
+
+def test_create_answer_stores_answer_and_notification_in_one_commit(session, statements):
+    created = asyncio.run(async_service.create_answer(_AsyncSession(session), 10, AnswerCreate(content="답변"), WRITER))
+
+    assert created
+    assert statements == ["INSERT INTO answer", "INSERT INTO notification", "COMMIT"]
+    notification = session.execute(select(Notification)).scalar_one()
+    assert (notification.user_id, notification.actor_user_id, notification.resource_id) == (1, 2, 10)
+    assert session.invalidated == [10]  # 캐시 무효화는 commit 이후
+
+
+def test_create_answer_for_missing_question_returns_404(session, statements):
+    db = _AsyncSession(session)
+    assert not asyncio.run(async_service.create_answer(db, 99, AnswerCreate(content="답변"), WRITER))
+    with pytest.raises(HTTPException) as e:
+        asyncio.run(async_router.answer_create(99, AnswerCreate(content="답변"), db=db, current_user=WRITER))
+
+    assert e.value.status_code == 404
+    assert statements == []
+    assert session.invalidated == []
+
+
+@pytest.fixture
+def vote_statement(monkeypatch):
+    """VOTE_STATEMENTS 는 PostgreSQL 전용 (CTE 안의 INSERT) - 같은 결과 컬럼을 돌려주는 SQLite 조회로 대체"""
+    monkeypatch.setitem(async_service.VOTE_STATEMENTS, "answer", text(
+        "SELECT user_id AS owner_id, :user_id IS NOT NULL AS voted, question_id FROM answer WHERE id = :target_id"
+    ))
+
+
+def test_vote_answer_notifies_owner_in_one_commit(session, statements, vote_statement):
+    session.add(Answer(id=20, question_id=10, content="답변", create_date=datetime.now(), user_id=1))
+    session.commit()
+    statements.clear()
+
+    assert asyncio.run(async_service.vote_answer(_AsyncSession(session), 20, WRITER))
+    assert statements == ["INSERT INTO notification", "COMMIT"]
+    assert session.invalidated == [10]
+
+
+def test_vote_missing_answer_returns_false(session, statements, vote_statement):
+    assert not asyncio.run(async_service.vote_answer(_AsyncSession(session), 99, WRITER))
+    assert statements == []
+    assert session.invalidated == []
@@ -0,0 +1,132 @@
+"""
+알림 LISTEN/NOTIFY 푸시 테스트 (payload 형식, 연결된 사용자 필터링, 폴링/LISTEN 중복 제거, 조회 중 수신/조회 실패)
+
+    pytest tests/src/domains/notification/test_notification_push.py -v
+"""
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from src.domains.notification import notification_poller as poller_module
+from src.domains.notification.notification_listener import notify_payload, parse_notify_payload
+from src.domains.notification.notification_poller import NotificationPoller
+
+
+def test_payload_round_trip():
+    assert parse_notify_payload(notify_payload(42, 7)) == (42, 7)
+    assert parse_notify_payload("42") is None
+    assert parse_notify_payload("a:b") is None
+
+
+@pytest.fixture
+def poller(monkeypatch):
+    poller = NotificationPoller(mode="poll", batch_window=0)
+    pushed = []
+
+    async def send_to_user(user_id, data):
+        pushed.append(user_id)
+
+    monkeypatch.setattr(poller_module.sse_manager, "send_to_user", send_to_user)
+    monkeypatch.setattr(poller_module.NotificationResponse, "from_orm_with_actor",
+                        lambda notif: SimpleNamespace(model_dump_json=lambda: "{}"))
+    poller.pushed = pushed
+    return poller
+
+
+def test_notification_is_pushed_once_across_listen_and_poll(poller):
+    notification = SimpleNamespace(id=1, user_id=7)
+
+    asyncio.run(poller._push([notification]))
+    asyncio.run(poller._push([notification, SimpleNamespace(id=2, user_id=7)]))
+
+    assert poller.pushed == [7, 7]
+
+
+def test_recent_pushed_ids_are_bounded(poller, monkeypatch):
+    monkeypatch.setattr(poller_module, "RECENT_PUSHED_SIZE", 2)
+    for notification_id in (1, 2, 3):
+        assert poller._mark_pushed(notification_id)
+
+    assert poller._mark_pushed(1)  # 가장 오래된 id 는 잊음
+    assert not poller._mark_pushed(3)
+
+
+def test_notify_for_users_on_other_instances_is_ignored(poller, monkeypatch):
+    monkeypatch.setattr(poller_module.sse_manager, "is_connected", lambda user_id: user_id == 7)
+
+    async def receive():
+        poller._on_notification(1, 8)
+        assert poller._flush_task is None
+        poller._on_notification(2, 7)
+        assert poller._pending_ids == {2}
+        poller._flush_task.cancel()
+
+    asyncio.run(receive())
+
+
+
+class _Session:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Fetcher:
+    """get_notifications_by_ids 대체 - 호출 기록, failures 만큼 실패, gate 가 있으면 조회 중 대기"""
+
+    def __init__(self):
+        self.calls = []
+        self.failures = 0
+        self.gate = None
+
+    async def __call__(self, db, notification_ids):
+        self.calls.append(sorted(notification_ids))
+        if self.gate is not None:
+            await self.gate.wait()
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("db down")
+        return [SimpleNamespace(id=notification_id, user_id=7) for notification_id in notification_ids]
+
+
+@pytest.fixture
+def fetcher(poller, monkeypatch):
+    fetcher = _Fetcher()
+    poller.interval = 0
+    monkeypatch.setattr(poller_module.sse_manager, "is_connected", lambda user_id: True)
+    monkeypatch.setattr(poller_module, "AsyncSessionBackground", _Session)
+    monkeypatch.setattr(poller_module.notification_service, "get_notifications_by_ids", fetcher)
+    return fetcher
+
+
+def test_notify_received_during_flush_is_pushed(poller, fetcher):
+    async def receive():
+        fetcher.gate = asyncio.Event()
+        poller._on_notification(1, 7)
+        await asyncio.sleep(0.01)  # 1 조회 중
+        poller._on_notification(2, 7)
+        fetcher.gate.set()
+        await poller._flush_task
+
+    asyncio.run(receive())
+
+    assert fetcher.calls == [[1], [2]]
+    assert poller.pushed == [7, 7]
+    assert not poller._pending_ids
+
+
+def test_failed_fetch_is_retried(poller, fetcher):
+    fetcher.failures = 1
+
+    async def receive():
+        poller._on_notification(1, 7)
+        await poller._flush_task
+
+    asyncio.run(receive())
+
+    assert fetcher.calls == [[1], [1]]
+    assert poller.pushed == [7]
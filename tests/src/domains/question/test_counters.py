@@ -0,0 +1,76 @@
+"""
+질문/답변 비정규화 카운터(vote_count, answer_count) 테스트
+
+    pytest tests/src/domains/question/test_counters.py -v
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session, selectinload
+
+from src.database.database import Base
+from src.domains.answer.models import Answer
+from src.domains.question.counters import VOTE_STATEMENTS
+from src.domains.question.models import Question
+from src.domains.user.models import User
+
+
+@compiles(TSVECTOR, "sqlite")
+def _tsvector_as_text(element, compiler, **kw):
+    return "TEXT"
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    tables = [Base.metadata.tables[name] for name in ("users", "question", "answer", "question_voter", "answer_voter")]
+    Base.metadata.create_all(engine, tables=tables)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+def test_answer_count_follows_answer_insert_and_delete(session):
+    question = Question(subject="제목", content="내용", create_date=datetime.now())
+    session.add(question)
+    session.commit()
+
+    first = Answer(question=question, content="답변1", create_date=datetime.now())
+    second = Answer(question=question, content="답변2", create_date=datetime.now())
+    session.add_all([first, second])
+    session.commit()
+    assert question.answer_count == 2
+
+    session.delete(first)
+    session.commit()
+    assert question.answer_count == 1
+
+
+def test_vote_statements_are_single_upsert_per_target():
+    """투표는 ON CONFLICT DO NOTHING 과 카운터 증가를 한 문장으로 실행한다 (PostgreSQL 전용)"""
+    assert set(VOTE_STATEMENTS) == {"question", "answer"}
+    for target, statement in VOTE_STATEMENTS.items():
+        assert set(statement._bindparams) == {"target_id", "user_id"}
+        assert f"INSERT INTO {target}_voter" in statement.text
+        assert "ON CONFLICT DO NOTHING" in statement.text
+        assert f"UPDATE {target} SET vote_count = vote_count + 1" in statement.text
+
+
+def test_voters_are_not_loaded_by_default(session):
+    user = User(username="voter", password="x", email="voter@example.com")
+    question = Question(subject="제목", content="내용", create_date=datetime.now(), voter=[user])
+    session.add(question)
+    session.commit()
+    question_id = question.id
+    session.expire_all()
+
+    assert session.get(Question, question_id).voter == []  # 투표자 목록은 요청할 때만 로드 (noload)
+    session.expire_all()
+    loaded = session.scalars(
+        select(Question).options(selectinload(Question.voter)).where(Question.id == question_id)
+    ).one()
+    assert [voter.username for voter in loaded.voter] == ["voter"]
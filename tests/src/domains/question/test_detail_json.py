@@ -0,0 +1,49 @@
+"""
+질문 상세 단일 쿼리 JSON 로더 테스트 (응답 스키마와 키 구성 일치 확인)
+
+    pytest tests/src/domains/question/test_detail_json.py -v
+"""
+
+import base64
+import re
+from datetime import datetime
+
+from src.common.pagination import decode_cursor
+from src.domains.answer.schemas import Answer
+from src.domains.question.detail_json import QUESTION_DETAIL_JSON
+from src.domains.question.schemas import Question
+from src.domains.user.schemas import User
+
+
+def _keys(sql: str):
+    return re.findall(r"'(\w+)', ", sql)
+
+
+def test_json_keys_follow_schema_field_order():
+    """질문 필드 → (LATERAL 답변 페이지의) 답변 필드 순서로 스키마와 같은 키를 만든다 (작성자 키 제외)"""
+    user_keys = set(User.model_fields)
+    expected = list(Question.model_fields) + list(Answer.model_fields)
+
+    keys = _keys(QUESTION_DETAIL_JSON[True].text)
+    assert [key for key in keys if key not in user_keys] == [key for key in expected if key not in user_keys]
+
+
+def test_voters_only_queried_when_requested():
+    assert "question_voter" in QUESTION_DETAIL_JSON[True].text
+    assert "answer_voter" in QUESTION_DETAIL_JSON[True].text
+    assert "_voter" not in QUESTION_DETAIL_JSON[False].text
+
+
+def test_answer_page_is_limited():
+    for statement in QUESTION_DETAIL_JSON.values():
+        assert "LIMIT :answer_limit" in statement.text
+        assert "ORDER BY create_date, id" in statement.text
+
+
+def test_sql_cursor_format_is_decodable():
+    """SQL 에서 만든 커서 (표준 base64 76자 줄바꿈 → URL-safe, 패딩 제거) 를 decode_cursor 로 복원"""
+    payload = '["2024-05-01T12:00:00.000000", 123456789]'  # json_build_array(...)::text 형식
+    encoded = base64.encodebytes(payload.encode()).decode()  # PostgreSQL encode(..., 'base64') 와 같이 줄바꿈 포함
+    cursor = encoded.translate(str.maketrans("+/", "-_", "\n")).rstrip("=")
+
+    assert decode_cursor(cursor, (datetime, int)) == (datetime(2024, 5, 1, 12), 123456789)
@@ -0,0 +1,34 @@
+"""
+질문 상세 ETag/본문 캐시 키 테스트 (로더별로 다른 표현을 구분하는지)
+
+    pytest tests/src/domains/question/test_question_detail.py -v
+"""
+
+import asyncio
+from datetime import datetime
+
+from src.domains.question import router as question_router
+
+
+def test_loader_is_part_of_etag_and_cache_key(monkeypatch):
+    cached = {}
+
+    async def stamp(db, question_id):
+        return datetime(2024, 5, 1), 3, 2, None, 0
+
+    async def get_or_render(namespace, parts, render):
+        cached[parts] = f"body:{parts[2]}"
+        return cached[parts]
+
+    monkeypatch.setattr(question_router.question_service, "get_question_stamp", stamp)
+    monkeypatch.setattr(question_router.question_detail_cache, "get_or_render", get_or_render)
+
+    def detail(loader):
+        return asyncio.run(question_router.question_detail(1, include_voters=False, answer_size=20, loader=loader,
+                                                           if_none_match=None, db=None))
+
+    orm, json_loader = detail("orm"), detail("json")
+
+    assert orm.headers["etag"] != json_loader.headers["etag"]
+    assert len(cached) == 2
+    assert (orm.body, json_loader.body) == (b"body:orm", b"body:json")
@@ -0,0 +1,96 @@
+"""
+질문 목록 테스트 (검색 관련도순 페이지와 커서 페이지가 같은 정렬을 사용하는지, 캐시 미스 조회 DB)
+
+    pytest tests/src/domains/question/test_question_list.py -v
+"""
+
+import asyncio
+import inspect
+import json
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+
+from src.database.database import Base, get_async_db
+from src.domains.question import router as question_router, service as question_service
+from src.domains.question.models import Question
+from src.domains.user.models import User  # noqa: F401 (relationship 설정용)
+
+
+@compiles(TSVECTOR, "sqlite")
+def _tsvector_as_text(element, compiler, **kw):
+    return "TEXT"
+
+
+class _AsyncSession:
+    """동기 Session 을 AsyncSession 처럼 사용 (execute 만 필요)"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def execute(self, statement, params=None):
+        return self.session.execute(statement, params)
+
+
+@pytest.fixture
+def db(monkeypatch):
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Base.metadata.tables[name] for name in ("users", "question")])
+    with Session(engine) as session:
+        now = datetime(2024, 5, 1)
+        # 관련도(vote_count)와 작성순이 다르게 섞인 검색 대상 5건 + 비대상 1건
+        for index, votes in enumerate((1, 5, 3, 4, 2)):
+            session.add(Question(subject=f"fastapi {index}", content="내용", vote_count=votes,
+                                 create_date=now + timedelta(minutes=index)))
+        session.add(Question(subject="django", content="내용", create_date=now))
+        session.commit()
+
+        # PostgreSQL 전문 검색 대신 제목 LIKE 조건과 vote_count 를 관련도로 사용
+        monkeypatch.setattr(question_service, "search_condition",
+                            lambda keyword: (Question.subject.like(f"%{keyword}%"), Question.vote_count))
+        monkeypatch.setenv("DB_COUNT_STRATEGY_QUESTION_LIST", "exact")
+
+        async def render_only(namespace, parts, render):
+            return await render()
+
+        monkeypatch.setattr(question_router.question_list_cache, "get_or_render", render_only)
+        yield _AsyncSession(session)
+    engine.dispose()
+
+
+def _list(db, **params) -> dict:
+    response = asyncio.run(question_router.question_list(db=db, if_none_match=None, **{
+        "page": 0, "size": 2, "keyword": "", "cursor": None, **params
+    }))
+    return json.loads(response.body)
+
+
+def _subjects(body: dict):
+    return [question["subject"] for question in body["question_list"]]
+
+
+def test_keyword_search_pages_in_rank_order_without_cursor(db):
+    first = _list(db, keyword="fastapi")
+    second = _list(db, keyword="fastapi", page=1)
+
+    assert first["total"] == 5
+    assert first["next_cursor"] is None  # 관련도순 페이지는 (create_date, id) 커서로 이어갈 수 없음
+    assert _subjects(first) + _subjects(second) == ["fastapi 1", "fastapi 3", "fastapi 2", "fastapi 4"]
+
+
+def test_cursor_pages_continue_in_date_order(db):
+    first = _list(db)
+    second = _list(db, cursor=first["next_cursor"])
+
+    assert _subjects(first) + _subjects(second) == ["fastapi 4", "fastapi 3", "fastapi 2", "fastapi 1"]
+    assert second["next_cursor"] is not None
+
+
+def test_list_cache_misses_render_from_primary():
+    """무효화 직후 미스가 지연된 Replica 의 이전 목록을 새 버전으로 저장하지 않도록 Primary 세션 사용"""
+    dependency = inspect.signature(question_router.question_list).parameters["db"].default
+    assert dependency.dependency is get_async_db
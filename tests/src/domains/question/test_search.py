@@ -0,0 +1,28 @@
+"""
+질문 전문 검색(tsvector) 테스트
+
+    pytest tests/src/domains/question/test_search.py -v
+"""
+
+from datetime import datetime
+
+from sqlalchemy.orm import Session
+
+from src.domains.answer.models import Answer
+from src.domains.question.models import Question
+from src.domains.question.search import build_tsquery, touched_question_ids
+from src.domains.user.models import User  # noqa: F401 (relationship 설정용)
+
+
+def test_build_tsquery_quotes_tokens_as_prefix_and_search():
+    assert build_tsquery("fastapi  질문") == "'fastapi':* & '질문':*"
+    assert build_tsquery("it's a|b") == "'it''s':* & 'a|b':*"
+    assert build_tsquery("   ") is None
+
+
+def test_touched_question_ids_for_new_questions_and_answers():
+    session = Session()
+    session.add(Question(id=1, subject="제목", content="내용", create_date=datetime.now()))
+    session.add(Answer(id=10, content="답변", create_date=datetime.now(), question_id=2))
+
+    assert touched_question_ids(session) == {1, 2}
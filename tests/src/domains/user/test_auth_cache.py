@@ -0,0 +1,80 @@
+"""
+인증 사용자 캐시 테스트 (토큰 버전 일치, TTL/LRU, 사용자 변경 시 무효화, 스냅샷 세션 연결)
+
+    pytest tests/src/domains/user/test_auth_cache.py -v
+"""
+
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.database.database import Base
+from src.domains.user.auth_cache import UserCache, user_cache
+from src.domains.user.models import User
+
+
+def _user(username="alice", version=0, user_id=1):
+    return User(id=user_id, username=username, email=f"{username}@example.com", token_version=version)
+
+
+@pytest.fixture
+def cache():
+    return UserCache(ttl=30, max_keys=2, use_redis=False, enabled=True)
+
+
+def test_hit_requires_matching_token_version(cache):
+    asyncio.run(cache.set(_user(version=1)))
+
+    assert asyncio.run(cache.get("alice", 1))["id"] == 1
+    assert asyncio.run(cache.get("alice", 0)) is None  # 이전 버전 토큰
+    assert asyncio.run(cache.get("bob", 0)) is None
+
+
+def test_expired_and_least_recently_used_entries_are_dropped(cache):
+    for user_id, username in enumerate(("alice", "bob", "carol")):
+        asyncio.run(cache.set(_user(username, user_id=user_id)))
+
+    assert asyncio.run(cache.get("alice", 0)) is None  # max_keys=2 초과로 제거
+    cache.ttl = 0
+    asyncio.run(cache.set(_user("dave", user_id=9)))
+    assert asyncio.run(cache.get("dave", 0)) is None
+
+
+@pytest.fixture
+def session():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Base.metadata.tables["users"]])
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+    user_cache.clear()
+
+
+def test_user_update_invalidates_cached_snapshot(session):
+    user = User(username="alice", password="x", email="alice@example.com")
+    session.add(user)
+    session.commit()
+    asyncio.run(user_cache.set(user))
+
+    user.username = "alice2"
+    session.commit()
+
+    assert asyncio.run(user_cache.get("alice", 0)) is None
+
+
+def test_snapshot_is_attached_to_session_without_query(session):
+    session.add(User(id=1, username="alice", password="x", email="alice@example.com"))
+    session.commit()
+    session.expunge_all()
+    statements = []
+    event.listen(session.bind, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    user = _user()
+    make_transient_to_detached(user)
+    merged = session.merge(user, load=False)
+
+    assert (merged.id, merged.username) == (1, "alice")
+    assert statements == []
+    assert merged.password == "x"  # 스냅샷에 없는 컬럼은 접근 시 로드
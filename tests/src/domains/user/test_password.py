@@ -0,0 +1,65 @@
+"""
+비밀번호 해시 executor 테스트 (이벤트 루프 밖 실행, 대기열 제한, cost 변경 시 재해시)
+
+    pytest tests/src/domains/user/test_password.py -v
+"""
+
+import asyncio
+import threading
+
+import pytest
+from passlib.context import CryptContext
+
+from src.domains.user.password import (
+    PASSWORD_BCRYPT_ROUNDS, PasswordHasher, PasswordHasherBusyError, pwd_context
+)
+
+
+@pytest.fixture
+def hasher():
+    hasher = PasswordHasher(mode="thread", workers=1, max_queue=1)
+    yield hasher
+    hasher.shutdown()
+
+
+def test_hash_runs_on_dedicated_executor(hasher):
+    thread_names = []
+
+    def record(secret):
+        thread_names.append(threading.current_thread().name)
+        return secret
+
+    assert hasher._submit(record, "secret").result() == "secret"
+    assert thread_names[0].startswith("password-hash")
+    assert hasher._in_flight == 0
+
+
+def test_rejects_when_queue_is_full(hasher):
+    release = threading.Event()
+    running = hasher._submit(release.wait)  # 워커 1개 점유
+    queued = hasher._submit(release.wait)  # 대기열 1개
+    try:
+        with pytest.raises(PasswordHasherBusyError):
+            hasher._submit(release.wait)
+    finally:
+        release.set()
+    running.result()
+    queued.result()
+    assert hasher._in_flight == 0
+
+
+def test_verify_rehashes_when_cost_changed(hasher):
+    old_cost = PASSWORD_BCRYPT_ROUNDS - 1
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=old_cost).hash("secret")
+
+    verified, new_hash = asyncio.run(hasher.verify("secret", old_hash))
+
+    assert verified
+    assert new_hash.startswith(f"$2b${PASSWORD_BCRYPT_ROUNDS:02d}$")
+    assert pwd_context.verify("secret", new_hash)
+
+
+def test_verify_wrong_password_does_not_rehash(hasher):
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__default_rounds=4).hash("secret")
+
+    assert asyncio.run(hasher.verify("wrong", old_hash)) == (False, None)
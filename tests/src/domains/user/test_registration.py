@@ -0,0 +1,45 @@
+"""
+회원 가입/일괄 등록 테스트 (ON CONFLICT 단일 INSERT, 일괄 등록 시 사용자별 비밀번호 해시)
+
+    pytest tests/src/domains/user/test_registration.py -v
+"""
+
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from src.domains.user import service as user_service
+from src.domains.user.router import router
+
+
+def test_insert_skips_unique_conflicts_and_returns_created_usernames():
+    statement = user_service._insert_users([
+        {"username": "alice", "password": "x", "email": "alice@example.com"},
+        {"username": "bob", "password": "y", "email": "bob@example.com"},
+    ])
+    sql = str(statement.compile(dialect=postgresql.dialect()))
+
+    assert sql.startswith("INSERT INTO users")
+    assert "ON CONFLICT DO NOTHING RETURNING users.username" in sql
+    assert sql.count("%(username_m") == 2  # 여러 행을 한 문장으로
+
+
+def test_import_hashes_every_password_separately(monkeypatch):
+    """같은 비밀번호라도 사용자마다 따로 해시한다 (솔트를 공유하지 않음)"""
+    hashed = []
+
+    async def fake_hash(secret):
+        hashed.append(secret)
+        return f"hash{len(hashed)}:{secret}"
+
+    monkeypatch.setattr(user_service.password_hasher, "workers", 2)
+    monkeypatch.setattr(user_service.password_hasher, "hash", fake_hash)
+    hashes = asyncio.run(user_service._hash_passwords(["seed", "seed", "other", "seed"]))
+
+    assert hashed == ["seed", "seed", "other", "seed"]
+    assert hashes == ["hash1:seed", "hash2:seed", "hash3:other", "hash4:seed"]
+
+
+def test_import_route_is_not_exposed():
+    """일괄 등록은 인증 없는 HTTP 라우트가 아닌 스크립트(scripts/import_users.py)로만 실행"""
+    assert "/api/user/import" not in {route.path for route in router.routes}
@@ -0,0 +1,68 @@
+"""
+검증된 JWT 클레임 캐시 테스트 (같은 토큰 재검증 생략, 만료, 크기 제한, 검증 실패 미저장)
+
+    pytest tests/src/domains/user/test_token_cache.py -v
+"""
+
+import time
+
+import pytest
+from jose import JWTError, jwt
+
+from src.domains.user.token_cache import TokenClaimsCache
+
+SECRET = "test-secret"
+
+
+def _token(sub="alice", exp_in=3600):
+    return jwt.encode({"sub": sub, "exp": int(time.time()) + exp_in}, SECRET, algorithm="HS256")
+
+
+class CountingVerifier:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, token):
+        self.calls += 1
+        return jwt.decode(token, SECRET, algorithms=["HS256"], options={"verify_exp": False})
+
+
+def test_same_token_is_verified_once():
+    cache, verify = TokenClaimsCache(max_size=10), CountingVerifier()
+    token = _token()
+
+    assert cache.decode(token, verify)["sub"] == "alice"
+    assert cache.decode(token, verify)["sub"] == "alice"
+    assert verify.calls == 1
+
+
+def test_expired_token_is_verified_again():
+    cache, verify = TokenClaimsCache(max_size=10), CountingVerifier()
+    token = _token(exp_in=-1)
+
+    cache.decode(token, verify)
+    cache.decode(token, verify)
+    assert verify.calls == 2
+
+
+def test_least_recently_used_token_is_evicted():
+    cache, verify = TokenClaimsCache(max_size=1), CountingVerifier()
+    first, second = _token("alice"), _token("bob")
+
+    cache.decode(first, verify)
+    cache.decode(second, verify)
+    cache.decode(first, verify)
+    assert verify.calls == 3
+
+
+def test_invalid_token_is_not_cached():
+    cache = TokenClaimsCache(max_size=10)
+    forged = jwt.encode({"sub": "alice"}, "other-secret", algorithm="HS256")
+
+    def verify(token):
+        return jwt.decode(token, SECRET, algorithms=["HS256"])
+
+    for _ in range(2):
+        with pytest.raises(JWTError):
+            cache.decode(forged, verify)
+    assert len(cache._entries) == 0